@@ -0,0 +1,182 @@
+# benchmarks/bench_asr_profiles.py
+"""
+Offline ASR profile comparison: runs a corpus of WAVs with reference
+transcripts through every ASR profile in data/config.json ("ears.profiles")
+and reports, per profile:
+
+  load_s         model load time (download excluded once cached)
+  rtf            decode seconds per second of audio (lower is faster, < 1 is faster than real time)
+  latency        per-utterance decode time percentiles
+  wer            corpus word error rate against the references
+
+The corpus is a JSONL manifest of {"audio": path, "text": reference}, paths
+relative to the manifest. The bundled one (fixtures/asr_corpus.jsonl) holds
+typical ENJO requests; --synthesize renders its missing WAVs with the
+Mouth's Kokoro voices. Recorded operator audio gives more honest numbers.
+
+    python -m benchmarks.bench_asr_profiles --synthesize
+    python -m benchmarks.bench_asr_profiles --profiles fast,balanced --cpu-threads 4
+    python -m benchmarks.bench_asr_profiles --manifest recordings/manifest.jsonl --out asr.json
+"""
+import argparse
+import json
+import os
+import re
+import time
+
+from benchmarks.bench_storage import summarize
+from src.senses.asr_profiles import ASRProfile
+from src.senses.ears import WHISPER_SAMPLE_RATE
+from src.utils.boot import lazy_import
+
+faster_whisper = lazy_import("faster_whisper")
+sf = lazy_import("soundfile")
+
+DEFAULT_MANIFEST = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "asr_corpus.jsonl")
+VOICES = ("af_bella", "am_michael", "bf_emma", "am_adam")
+
+_ONES = "zero one two three four five six seven eight nine ten eleven twelve thirteen fourteen fifteen " \
+        "sixteen seventeen eighteen nineteen".split()
+_TENS = "twenty thirty forty fifty sixty seventy eighty ninety".split()
+
+
+def number_words(n):
+    if n < 20:
+        return _ONES[n]
+    tens, ones = divmod(n, 10)
+    return _TENS[tens - 2] + ("" if ones == 0 else " " + _ONES[ones])
+
+
+def normalize(text):
+    """Lowercase words without punctuation. "30%" and "thirty percent" compare equal."""
+    text = text.lower().replace("%", " percent")
+    words = []
+    for token in re.findall(r"[a-z0-9']+", text):
+        if token.isdigit() and int(token) < 100:
+            words += number_words(int(token)).split()
+        else:
+            words.append(token.strip("'"))
+    return [w for w in words if w]
+
+
+def edit_distance(reference, hypothesis):
+    """Word-level Levenshtein distance (substitutions + deletions + insertions)."""
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref_word in enumerate(reference, 1):
+        current = [i]
+        for j, hyp_word in enumerate(hypothesis, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ref_word != hyp_word)))
+        previous = current
+    return previous[-1]
+
+
+def load_manifest(path):
+    base = os.path.dirname(os.path.abspath(path))
+    rows = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                row = json.loads(line)
+                rows.append((os.path.join(base, row["audio"]), row["text"]))
+    return rows
+
+
+def synthesize_missing(rows):
+    """Renders missing corpus WAVs with the Mouth's Kokoro model, rotating voices."""
+    from src.senses.mouth import Mouth
+    mouth = Mouth()
+    if not mouth.active:
+        raise SystemExit("Kokoro is not available: cannot synthesize the corpus.")
+
+    for i, (path, text) in enumerate(rows):
+        if os.path.exists(path):
+            continue
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        samples, sample_rate = mouth.kokoro.create(text, voice=VOICES[i % len(VOICES)], speed=1.0, lang="en-us")
+        sf.write(path, samples, sample_rate, subtype="PCM_16")
+        print(f">> Corpus: {os.path.basename(path)} <- {text}")
+
+
+def run_profile(asr, corpus, repeats):
+    started = time.perf_counter()
+    model = asr.load_model()
+    load_s = time.perf_counter() - started
+
+    asr.transcribe(model, corpus[0][1])  # Warm-up: first call allocates the decoder buffers
+
+    latencies, errors, ref_words, audio_s = [], 0, 0, 0.0
+    worst = []
+    for name, audio, reference in corpus:
+        for _ in range(repeats):
+            started = time.perf_counter()
+            text, _ = asr.transcribe(model, audio)
+            latencies.append(time.perf_counter() - started)
+            audio_s += len(audio) / WHISPER_SAMPLE_RATE
+
+        ref, hyp = normalize(reference), normalize(text)
+        distance = edit_distance(ref, hyp)
+        errors += distance
+        ref_words += len(ref)
+        if distance:
+            worst.append({"audio": name, "errors": distance, "reference": reference, "heard": text})
+
+    worst.sort(key=lambda row: row["errors"], reverse=True)
+    return {
+        "settings": asr.describe(),
+        "load_s": round(load_s, 3),
+        "rtf": round(sum(latencies) / audio_s, 4),
+        "latency": summarize(latencies),
+        "wer": round(errors / ref_words, 4) if ref_words else None,
+        "worst": worst[:5],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare ASR profiles on a WAV corpus (RTF, latency, WER).")
+    parser.add_argument("--manifest", default=DEFAULT_MANIFEST, help="JSONL of {audio, text} rows.")
+    parser.add_argument("--profiles", help="Comma-separated profile names (default: all in config.json).")
+    parser.add_argument("--cpu-threads", type=int, help="Override cpu_threads for every profile.")
+    parser.add_argument("--repeats", type=int, default=1, help="Decodes per file (latency samples).")
+    parser.add_argument("--synthesize", action="store_true", help="Render missing corpus WAVs with Kokoro first.")
+    parser.add_argument("--out", help="Write the JSON report here.")
+    args = parser.parse_args()
+
+    rows = load_manifest(args.manifest)
+    if args.synthesize:
+        synthesize_missing(rows)
+
+    corpus = []
+    for path, reference in rows:
+        if not os.path.exists(path):
+            print(f">> Corpus: skipping missing {path} (run with --synthesize or record it)")
+            continue
+        corpus.append((os.path.basename(path), faster_whisper.decode_audio(path, sampling_rate=WHISPER_SAMPLE_RATE),
+                       reference))
+    if not corpus:
+        raise SystemExit("No audio in the corpus.")
+
+    names = args.profiles.split(",") if args.profiles else list(ASRProfile.profiles())
+    overrides = {"cpu_threads": args.cpu_threads} if args.cpu_threads is not None else {}
+
+    results = {}
+    for name in names:
+        print(f">> Profile '{name}'...")
+        results[name] = run_profile(ASRProfile.from_config(name, **overrides), corpus, args.repeats)
+        r = results[name]
+        print(f"   rtf {r['rtf']:.3f} | p50 {r['latency']['p50_ms']:.0f}ms | p95 {r['latency']['p95_ms']:.0f}ms "
+              f"| WER {r['wer'] if r['wer'] is None else format(r['wer'], '.1%')}")
+
+    report = {
+        "config": vars(args),
+        "corpus": {"files": len(corpus), "audio_s": round(sum(len(a) for _, a, _ in corpus) / WHISPER_SAMPLE_RATE, 2)},
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+if __name__ == "__main__":
+    main()
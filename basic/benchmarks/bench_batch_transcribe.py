@@ -0,0 +1,116 @@
+# benchmarks/bench_batch_transcribe.py
+"""
+Scaling curve of the batch transcriber: throughput (seconds of audio per
+wall-clock second) at 1, 2, 4 ... N worker processes, with speedup and
+parallel efficiency against one worker.
+
+By default every worker runs a CPU-bound stand-in for Whisper that burns
+--rtf CPU-seconds per second of audio, on synthetic WAVs of mixed length,
+so the pool itself is measured. --whisper transcribes real audio (--input)
+with one single-threaded WhisperModel per worker.
+
+    python -m benchmarks.bench_batch_transcribe
+    python -m benchmarks.bench_batch_transcribe --whisper --input recordings/ --profile fast
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+import wave
+
+import numpy as np
+
+from src.senses.batch_transcriber import (BatchTranscriber, WhisperWorker, audio_duration, available_cores,
+                                          collect_audio)
+
+
+class FakeWorker:
+    """Burns rtf CPU-seconds per second of audio (pure CPU, like a decoder)."""
+
+    def __init__(self, rtf=0.1):
+        self.rtf = rtf
+
+    def __call__(self, path):
+        seconds = audio_duration(path)
+        deadline = time.process_time() + self.rtf * seconds
+        x = 0
+        while time.process_time() < deadline:
+            for i in range(1000):
+                x += i * i
+        return {"text": f"{seconds:.1f}s of audio", "language": "en"}
+
+
+def synthetic_corpus(directory, files, seed):
+    """Mixed-length WAVs (2-40 s), like a day of recorded sessions."""
+    rng = np.random.default_rng(seed)
+    paths = []
+    for i in range(files):
+        seconds = float(rng.choice([rng.uniform(2, 8), rng.uniform(8, 20), rng.uniform(20, 40)], p=[0.6, 0.3, 0.1]))
+        path = os.path.join(directory, f"session_{i:03d}.wav")
+        with wave.open(path, "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(16000)
+            f.writeframes(rng.normal(0, 500, int(seconds * 16000)).astype(np.int16).tobytes())
+        paths.append(path)
+    return paths
+
+
+def worker_counts(limit):
+    counts, n = [], 1
+    while n < limit:
+        counts.append(n)
+        n *= 2
+    return counts + [limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch transcription scaling benchmark.")
+    parser.add_argument("--workers", help="Comma-separated worker counts (default: 1,2,4..cores).")
+    parser.add_argument("--files", type=int, default=48, help="Synthetic files to generate.")
+    parser.add_argument("--rtf", type=float, default=0.05, help="Fake decoder: CPU-seconds per audio second.")
+    parser.add_argument("--whisper", action="store_true", help="Use real Whisper workers.")
+    parser.add_argument("--input", nargs="*", help="Audio for --whisper (dirs, manifests or files).")
+    parser.add_argument("--profile", help="ASR profile for --whisper.")
+    parser.add_argument("--cpu-threads", type=int, default=1, help="Threads per worker (1 = pure process scaling).")
+    parser.add_argument("--out", help="Write the JSON report here.")
+    args = parser.parse_args()
+
+    cores = available_cores()
+    counts = [int(n) for n in args.workers.split(",")] if args.workers else worker_counts(cores)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.whisper:
+            paths = collect_audio(args.input or [])
+            if not paths:
+                raise SystemExit("--whisper needs --input audio.")
+            factory, factory_args = WhisperWorker, (args.profile, args.cpu_threads)
+        else:
+            paths = synthetic_corpus(tmp, args.files, seed=0)
+            factory, factory_args = FakeWorker, (args.rtf,)
+
+        audio_s = sum(audio_duration(p) for p in paths)
+        results = []
+        for n in counts:
+            batch = BatchTranscriber(workers=n, cpu_threads=args.cpu_threads,
+                                     worker_factory=factory, worker_args=factory_args)
+            summary = batch.run(paths, os.path.join(tmp, f"out_{n}.jsonl"), resume=False, progress=False)
+            results.append({"workers": n, "wall_s": summary["wall_s"], "errors": summary["errors"],
+                            "throughput_x": round(audio_s / summary["wall_s"], 2)})
+
+    base = results[0]["throughput_x"] / results[0]["workers"]
+    for row in results:
+        row["speedup"] = round(row["throughput_x"] / base, 2)
+        row["efficiency"] = round(row["speedup"] / row["workers"], 2)
+
+    text = json.dumps({"config": vars(args), "cores": cores, "files": len(paths),
+                       "audio_s": round(audio_s, 1), "results": results}, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+# benchmarks/bench_brain.py
+"""
+Offline benchmark suite for the Brain.
+
+Injects the deterministic fakes from fake_providers.py (no network, no audio)
+and measures:
+  - think latency percentiles
+  - failover cost (_switch_provider + the retry) when the primary fails
+  - subconscious overhead (background extraction per turn)
+  - provider calls per turn, two-call vs fused (ModelConfig.fused_turns)
+  - profile block tokens (all facts vs indexed top-k) as the profile grows
+  - MemorySystem load/save cost as history and profile grow
+
+Results are written as JSON so runs can be diffed:
+
+    python -m benchmarks.bench_brain --out bench_output.json
+    python -m benchmarks.bench_brain --compare bench_output.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.fake_providers import FakeGeminiClient, FakeGroqClient, FakeLocalEngine, LatencyModel
+from src.brain.core import Brain
+from src.brain.memory import MemorySystem
+
+
+def summarize(samples):
+    """Latency summary in milliseconds."""
+    ordered = sorted(samples)
+
+    def pct(q):
+        return round(ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))] * 1000, 3)
+
+    return {
+        "n": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+        "p50_ms": pct(0.50),
+        "p95_ms": pct(0.95),
+        "p99_ms": pct(0.99),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+@contextlib.contextmanager
+def quiet():
+    """The Brain narrates everything; keep the benchmark output clean."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def make_brain(data_dir, gemini=None, groq=None, local=None):
+    with quiet():
+        return Brain(
+            memory=MemorySystem(data_dir=data_dir),
+            gemini_client=FakeGeminiClient(gemini or LatencyModel(0.05, 0.01, seed=1)),
+            groq_client=FakeGroqClient(groq or LatencyModel(0.03, 0.005, seed=2)),
+            local_engine=FakeLocalEngine(local or LatencyModel(0.08, 0.02, seed=3)),
+        )
+
+
+# --- SCENARIOS ---
+def bench_think(turns, latency):
+    with tempfile.TemporaryDirectory() as tmp:
+        brain = make_brain(tmp, gemini=LatencyModel(latency, latency / 5, seed=1))
+        samples = []
+        with quiet():
+            for i in range(turns):
+                started = time.perf_counter()
+                brain.think(f"Benchmark turn {i}. How are you?")
+                samples.append(time.perf_counter() - started)
+            brain.shutdown()
+    return {"provider_latency_s": latency, **summarize(samples)}
+
+
+def bench_failover(turns, latency):
+    """Gemini always fails -> every turn pays a Gemini error + switch + Groq call."""
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for label, failure_rate in (("healthy", 0.0), ("gemini_down", 1.0)):
+            brain = make_brain(
+                tmp,
+                gemini=LatencyModel(latency, 0.0, failure_rate=failure_rate, seed=1),
+                groq=LatencyModel(latency, 0.0, seed=2),
+            )
+            brain.health.stop()  # No background re-routing: measure the raw failover path
+            samples, switch_costs = [], []
+            with quiet():
+                for i in range(turns):
+                    brain.active_provider, brain.active_model_name = "gemini", brain.config.gemini_models[0]
+                    brain.health.reset()
+                    for breaker in brain.router.breakers.values():
+                        breaker.record_success()
+                    started = time.perf_counter()
+                    brain.think(f"Failover turn {i}.")
+                    samples.append(time.perf_counter() - started)
+
+                    brain.active_provider = "gemini"
+                    switch_started = time.perf_counter()
+                    brain._switch_provider()
+                    switch_costs.append(time.perf_counter() - switch_started)
+                brain.shutdown()
+            results[label] = {"think": summarize(samples), "switch_provider": summarize(switch_costs)}
+
+        results["failover_overhead_ms"] = round(
+            results["gemini_down"]["think"]["p50_ms"] - results["healthy"]["think"]["p50_ms"], 3
+        )
+    return results
+
+
+def bench_subconscious(turns, latency):
+    """Time for the background worker to finish extraction after each turn."""
+    with tempfile.TemporaryDirectory() as tmp:
+        brain = make_brain(tmp, gemini=LatencyModel(latency, latency / 5, seed=1))
+        think_samples, drain_samples = [], []
+        with quiet():
+            for i in range(turns):
+                started = time.perf_counter()
+                brain.think(f"I live in city number {i}.")
+                think_samples.append(time.perf_counter() - started)
+
+                started = time.perf_counter()
+                brain.flush_subconscious(timeout=30)
+                drain_samples.append(time.perf_counter() - started)
+            stats = brain.subconscious_worker.snapshot()
+            brain.shutdown()
+    return {"think": summarize(think_samples), "background_drain": summarize(drain_samples), "worker": stats}
+
+
+def bench_fused(turns, latency):
+    """Provider calls per turn, separate Subconscious call vs one fused call (think_stream, like ENJO.run and the server)."""
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, fused in (("two_call", False), ("fused", True)):
+            brain = make_brain(tmp, gemini=LatencyModel(latency, latency / 5, seed=1))
+            brain.config.fused_turns = fused
+            samples = []
+            with quiet():
+                for i in range(turns):
+                    started = time.perf_counter()
+                    list(brain.think_stream(f"I live in city number {i}."))
+                    samples.append(time.perf_counter() - started)
+                brain.flush_subconscious(timeout=30)
+                brain.shutdown()
+            results[label] = {
+                "think": summarize(samples),
+                "calls_per_turn": round(brain.gemini_client.backend.calls / turns, 3),
+            }
+    return results
+
+
+def bench_profile(sizes, turns):
+    """Prompt tokens spent on profile facts: inject-everything vs the BM25 top-k."""
+    results = []
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            brain = make_brain(tmp)
+            with quiet():
+                brain.memory.update_profile({f"fact_{i}": f"likes topic {i % 97} and hobby {i}" for i in range(size)})
+                brain._sync_profile()
+                select = []
+                for i in range(turns):
+                    started = time.perf_counter()
+                    brain._select_profile(f"Tell me about topic {i % 97}.")
+                    select.append(time.perf_counter() - started)
+                brain.shutdown()
+            stats = brain.profile_stats
+            results.append({
+                "facts": size,
+                "select": summarize(select),
+                "tokens_full_per_turn": stats["tokens_full"] // turns,
+                "tokens_injected_per_turn": stats["tokens_injected"] // turns,
+            })
+    return results
+
+
+def bench_memory(sizes, repeats):
+    results = {"history": [], "profile": []}
+    with tempfile.TemporaryDirectory() as tmp:
+        with quiet():
+            memory = MemorySystem(data_dir=tmp)
+
+        for size in sizes:
+            history = [{"role": "user" if i % 2 == 0 else "model", "text": f"message {i} " * 8} for i in range(size)]
+            memory.MAX_HISTORY = size  # Measure the real cost of persisting `size` messages
+            save, load = [], []
+            for _ in range(repeats):
+                started = time.perf_counter()
+                memory.save_history(history)
+                save.append(time.perf_counter() - started)
+                started = time.perf_counter()
+                memory.load_history()
+                load.append(time.perf_counter() - started)
+            results["history"].append({"messages": size, "save": summarize(save), "load": summarize(load)})
+
+        for size in sizes:
+            update, load, flush = [], [], []
+            with quiet():
+                memory.update_profile({f"fact_{i}": f"value {i}" for i in range(size)})
+                memory.flush()
+                for r in range(repeats):
+                    started = time.perf_counter()
+                    memory.update_profile({"fresh_fact": r})
+                    update.append(time.perf_counter() - started)
+                    started = time.perf_counter()
+                    memory.load_profile()
+                    load.append(time.perf_counter() - started)
+                    # The write-behind thread would do this once per PROFILE_FLUSH_DELAY
+                    started = time.perf_counter()
+                    memory.flush()
+                    flush.append(time.perf_counter() - started)
+            results["profile"].append({"facts": size, "update": summarize(update), "load": summarize(load),
+                                       "flush": summarize(flush)})
+        memory.close()
+    return results
+
+
+# --- REPORTING ---
+def metadata():
+    try:
+        rev = subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL).decode().strip()
+    except Exception:
+        rev = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "git_rev": rev,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+
+def flatten(node, prefix=""):
+    """{'a': {'p50_ms': 1}} -> {'a.p50_ms': 1} (only *_ms numbers are compared)."""
+    flat = {}
+    if isinstance(node, dict):
+        for key, value in node.items():
+            flat.update(flatten(value, f"{prefix}.{key}" if prefix else str(key)))
+    elif isinstance(node, list):
+        for i, value in enumerate(node):
+            flat.update(flatten(value, f"{prefix}[{i}]"))
+    elif isinstance(node, (int, float)) and prefix.endswith("_ms"):
+        flat[prefix] = node
+    return flat
+
+
+def compare(baseline, current, threshold):
+    old, new = flatten(baseline.get("results", {})), flatten(current.get("results", {}))
+    regressions = []
+    for key in sorted(old.keys() & new.keys()):
+        if old[key] > 0 and (new[key] - old[key]) / old[key] > threshold:
+            regressions.append({"metric": key, "baseline": old[key], "current": new[key],
+                                "change": f"{(new[key] - old[key]) / old[key]:+.0%}"})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline Brain benchmarks with fake providers.")
+    parser.add_argument("--turns", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.05, help="Mean fake provider latency (s).")
+    parser.add_argument("--sizes", default="10,100,1000,10000", help="History/profile sizes for memory benchmarks.")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--only", choices=["think", "failover", "subconscious", "fused", "profile", "memory"], action="append")
+    parser.add_argument("--out", help="Write the JSON report here.")
+    parser.add_argument("--compare", help="Baseline JSON report to compare against.")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative slowdown that counts as a regression.")
+    args = parser.parse_args()
+
+    selected = set(args.only or ["think", "failover", "subconscious", "fused", "profile", "memory"])
+    sizes = [int(s) for s in args.sizes.split(",")]
+    results = {}
+
+    if "think" in selected:
+        results["think"] = bench_think(args.turns, args.latency)
+    if "failover" in selected:
+        results["failover"] = bench_failover(args.turns, args.latency)
+    if "subconscious" in selected:
+        results["subconscious"] = bench_subconscious(args.turns, args.latency)
+    if "fused" in selected:
+        results["fused"] = bench_fused(args.turns, args.latency)
+    if "profile" in selected:
+        results["profile"] = bench_profile(sizes, args.turns)
+    if "memory" in selected:
+        results["memory"] = bench_memory(sizes, args.repeats)
+
+    report = {"meta": metadata(), "config": vars(args), "results": results}
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            report["regressions"] = compare(json.load(f), report, args.threshold)
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    if report.get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+# benchmarks/bench_ears.py
+"""
+Capture-to-text overhead of the two Ears audio paths, per utterance:
+
+  disk:   AudioData -> WAV encode -> write data/input_cache.wav -> Whisper re-opens
+          and decodes the file (faster_whisper.decode_audio) -> delete
+  memory: AudioData -> raw PCM -> band-limited resample to 16 kHz -> float32 NumPy array
+
+The model itself is the same on both paths, so by default only the audio
+hand-off is timed. alias_db is how much of a 12 kHz tone survives each path
+(it must be filtered out, not folded to 4 kHz). --whisper also runs full
+transcriptions; with --reference it reports each path's WER.
+Point --temp-dir at a slow disk (USB stick, network share) to see the worst case.
+
+    python -m benchmarks.bench_ears
+    python -m benchmarks.bench_ears --wav recording.wav --temp-dir /mnt/usb --whisper
+    python -m benchmarks.bench_ears --wav recording.wav --whisper --reference "what the recording says"
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+import wave
+
+import numpy as np
+import speech_recognition as sr
+
+from benchmarks.bench_storage import summarize
+from src.senses.asr_profiles import ASRProfile
+from src.senses.ears import WHISPER_SAMPLE_RATE, audio_to_float32
+
+
+def load_audio(path, seconds, rate):
+    """A WAV fixture, or a synthetic utterance (voiced tone + noise) at a typical mic rate."""
+    if path:
+        with wave.open(path, "rb") as f:
+            return sr.AudioData(f.readframes(f.getnframes()), f.getframerate(), f.getsampwidth())
+
+    t = np.arange(int(seconds * rate)) / rate
+    signal = 0.3 * np.sin(2 * np.pi * 180 * t) * (0.5 + 0.5 * np.sin(2 * np.pi * 3 * t))
+    signal += 0.02 * np.random.default_rng(0).standard_normal(len(t))
+    pcm = (np.clip(signal, -1, 1) * 32767).astype(np.int16).tobytes()
+    return sr.AudioData(pcm, rate, 2)
+
+
+def disk_path(audio, temp_wav):
+    from faster_whisper import decode_audio  # Only this path needs it
+
+    with open(temp_wav, "wb") as f:
+        f.write(audio.get_wav_data())
+        f.flush()
+        os.fsync(f.fileno())  # What a real write costs on the target disk
+    samples = decode_audio(temp_wav, sampling_rate=WHISPER_SAMPLE_RATE)
+    os.remove(temp_wav)
+    return samples
+
+
+def alias_db(fn, rate):
+    """Level of a 12 kHz tone after a path, relative to the input (dB). Should be far below 0."""
+    t = np.arange(2 * rate) / rate
+    tone = 0.5 * np.sin(2 * np.pi * 12000 * t)
+    out = fn(sr.AudioData((tone * 32767).astype(np.int16).tobytes(), rate, 2))[1600:-1600]  # Skip edges
+    rms = max(float(np.sqrt(np.mean(np.square(out)))), 1e-9)
+    return round(20 * np.log10(rms / (0.5 / np.sqrt(2))), 1)
+
+
+def wer(reference, hypothesis):
+    """Word error rate: word-level edit distance / reference length."""
+    ref = reference.lower().split()
+    hyp = hypothesis.lower().split()
+    row = list(range(len(hyp) + 1))
+    for i, word in enumerate(ref, 1):
+        prev, row[0] = row[0], i
+        for j, guess in enumerate(hyp, 1):
+            prev, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, prev + (word != guess))
+    return round(row[-1] / max(1, len(ref)), 4)
+
+
+def time_path(fn, repeats):
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return summarize(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ears audio hand-off benchmark (disk vs in-memory).")
+    parser.add_argument("--wav", help="Recorded utterance to use instead of synthetic audio.")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--rate", type=int, default=44100, help="Synthetic capture rate (typical mic).")
+    parser.add_argument("--repeats", type=int, default=30)
+    parser.add_argument("--temp-dir", help="Where the disk path writes its WAV (default: system temp).")
+    parser.add_argument("--whisper", action="store_true", help="Also time full transcriptions.")
+    parser.add_argument("--profile", help="ASR profile for --whisper (default: ears.profile in config.json).")
+    parser.add_argument("--reference", help="What --wav says; with --whisper, reports WER of both paths.")
+    parser.add_argument("--out", help="Write the JSON report here.")
+    args = parser.parse_args()
+
+    audio = load_audio(args.wav, args.seconds, args.rate)
+    temp_dir = args.temp_dir or tempfile.gettempdir()
+    temp_wav = os.path.join(temp_dir, "bench_input_cache.wav")
+
+    results = {
+        "audio_s": round(len(audio.frame_data) / audio.sample_width / audio.sample_rate, 3),
+        "disk": time_path(lambda: disk_path(audio, temp_wav), args.repeats),
+        "memory": time_path(lambda: audio_to_float32(audio), args.repeats),
+    }
+    results["saved_ms_p50"] = round(results["disk"]["p50_ms"] - results["memory"]["p50_ms"], 3)
+    results["alias_db"] = {
+        "disk": alias_db(lambda tone: disk_path(tone, temp_wav), audio.sample_rate),
+        "memory": alias_db(audio_to_float32, audio.sample_rate),
+    }
+
+    if args.whisper:
+        asr = ASRProfile.from_config(args.profile)
+        model = asr.load_model()
+
+        def transcribe(source):
+            return asr.transcribe(model, source)[0]
+
+        def transcribe_disk():
+            with open(temp_wav, "wb") as f:
+                f.write(audio.get_wav_data())
+            try:
+                return transcribe(temp_wav)
+            finally:
+                os.remove(temp_wav)
+
+        repeats = max(3, args.repeats // 10)
+        results["whisper_disk"] = time_path(transcribe_disk, repeats)
+        results["whisper_memory"] = time_path(lambda: transcribe(audio_to_float32(audio)), repeats)
+        if args.reference:
+            results["wer"] = {"disk": wer(args.reference, transcribe_disk()),
+                              "memory": wer(args.reference, transcribe(audio_to_float32(audio)))}
+
+    text = json.dumps({"config": vars(args), "results": results}, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# benchmarks/bench_episodic.py
+"""
+Episodic memory retrieval latency vs store size (up to 1M exchanges).
+
+Vectors are synthetic but clustered like real chat (topics + noise) and are
+bulk-loaded with add_many(vectors=...), so building 1M rows takes seconds
+instead of embedding 1M sentences. Each query is a perturbed copy of a
+stored row. Reported per size:
+  - search latency (embedding excluded, measured separately)
+  - exact_scan latency: the same query as a full matrix scan, for comparison
+  - scanned_rate: share of the rows the LSH index hands to the exact re-rank
+  - recall@k of the indexed search vs an exact full scan
+
+Exits non-zero if any indexed size falls below --min-recall.
+
+    python -m benchmarks.bench_episodic
+    python -m benchmarks.bench_episodic --sizes 10000,100000,1000000 --out episodic.json
+"""
+import argparse
+import json
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.bench_storage import summarize
+from src.brain.episodic_memory import EpisodicMemory, HashingEmbedder
+
+
+class _VectorQuery:
+    """Embedder stand-in: the 'query text' is a key into precomputed vectors."""
+
+    def __init__(self, dim):
+        self.dim = dim
+        self.name = f"hashing-{dim}"  # Same name: the store must not re-embed
+        self.vectors = {}
+
+    def embed(self, texts):
+        return np.stack([self.vectors[t] for t in texts])
+
+
+def clustered(rng, n, dim, topics=2000, noise=0.6):
+    centers = rng.standard_normal((topics, dim)).astype(np.float32)
+    vectors = centers[rng.integers(0, topics, n)] + noise * rng.standard_normal((n, dim)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors
+
+
+def bench_size(size, dim, queries, k, chunk=100_000, **index):
+    rng = np.random.default_rng(size)
+    embedder = _VectorQuery(dim)
+    with tempfile.TemporaryDirectory() as tmp:
+        memory = EpisodicMemory(tmp, embedder=embedder, **index)
+        for start in range(0, size, chunk):
+            vectors = clustered(rng, min(chunk, size - start), dim)
+            # The row number is stored as the AI text so hits can be matched to exact ids
+            memory.add_many([("u", str(start + j)) for j in range(len(vectors))], vectors=vectors)
+
+        latency, exact_latency, scanned, overlap = [], [], [], []
+        for i in range(queries):
+            target = memory._matrix[int(rng.integers(0, size))]
+            # Perturbation of norm ~0.3 (per-dimension noise scaled by 1/sqrt(dim))
+            query = target + 0.3 / np.sqrt(dim) * rng.standard_normal(dim).astype(np.float32)
+            embedder.vectors[f"q{i}"] = query / np.linalg.norm(query)
+
+            memory.search(f"q{i}", k=k)  # Warm the page cache for this region
+            started = time.perf_counter()
+            hits = memory.search(f"q{i}", k=k)
+            latency.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            scores = memory._matrix[:size] @ embedder.vectors[f"q{i}"]
+            exact = np.argpartition(-scores, k - 1)[:k]
+            exact_latency.append(time.perf_counter() - started)
+            if size > memory.exact_below:
+                scanned.append(len(memory._candidates(embedder.vectors[f"q{i}"], size)) / size)
+
+            found = np.array([int(ai) for _, _, ai in hits], dtype=np.int64)
+            overlap.append(np.isin(found, exact).sum() / k)
+
+        mode = "exact" if size <= memory.exact_below else "lsh"
+        memory.close()
+    return {"episodes": size, "mode": mode, "search": summarize(latency), "exact_scan": summarize(exact_latency),
+            "scanned_rate": round(float(np.mean(scanned)), 4) if scanned else 1.0,
+            "recall": round(float(np.mean(overlap)), 3)}
+
+
+def bench_embed(repeats):
+    embedder = HashingEmbedder()
+    samples = []
+    for i in range(repeats):
+        text = f"Remember when we talked about my trip to Kyoto and the ramen place number {i}?"
+        started = time.perf_counter()
+        embedder.embed([text])
+        samples.append(time.perf_counter() - started)
+    return summarize(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Episodic memory retrieval benchmark.")
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--dim", type=int, default=128)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=3)
+    parser.add_argument("--lsh-bits", type=int, default=12)
+    parser.add_argument("--lsh-tables", type=int, default=10)
+    parser.add_argument("--min-recall", type=float, default=0.9, help="Fail if an indexed size recalls less (recall@k).")
+    parser.add_argument("--out", help="Write the JSON report here.")
+    args = parser.parse_args()
+
+    report = {
+        "config": vars(args),
+        "results": {
+            "embed_query": bench_embed(args.queries),
+            "search": [bench_size(int(s), args.dim, args.queries, args.k, lsh_bits=args.lsh_bits,
+                                  lsh_tables=args.lsh_tables) for s in args.sizes.split(",")],
+        },
+    }
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    low = [row["episodes"] for row in report["results"]["search"] if row["recall"] < args.min_recall]
+    if low:
+        raise SystemExit(f"recall@{args.k} below {args.min_recall} at {low} episodes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+# benchmarks/bench_limbic.py
+"""
+LimbicSystem microbenchmark: compiled single-regex matcher vs the original
+per-keyword re.search loop, at several keyword-list sizes.
+
+Also checks that both implementations return the same emotion for every
+text, so the speedup is not bought with different answers.
+
+    python -m benchmarks.bench_limbic
+    python -m benchmarks.bench_limbic --keywords 10,50,200 --texts 1000
+"""
+import argparse
+import json
+import random
+import re
+import time
+
+from src.brain.limbic_system import LimbicSystem
+
+EMOTIONS = ["fear", "angry", "tsundere", "whisper", "happy", "critical", "sad", "relaxed"]
+SEED_WORDS = {
+    "fear": ["scared", "afraid", "terrified", "help me", "someone is here"],
+    "angry": ["hate you", "shut up", "stupid", "useless", "idiot"],
+    "tsundere": ["baka", "not like i care", "whatever"],
+    "whisper": ["whisper", "quiet", "be quiet", "shh"],
+    "happy": ["awesome", "great", "love it", "yay", "amazing"],
+    "critical": ["broken", "crash", "error", "emergency"],
+    "sad": ["sad", "lonely", "depressed", "miss her"],
+    "relaxed": ["ugh", "meh", "tired", "annoying"],
+}
+FILLER = ("so today i was thinking about the project and the meeting went on for a while "
+          "then we had lunch and talked about the weather and some code review stuff").split()
+
+
+def legacy_detect(emotions, text):
+    """The original LimbicSystem.detect_emotion loop, kept verbatim for comparison."""
+    priority_order = ["fear", "angry", "tsundere", "whisper", "happy", "critical", "sad"]
+    text = text.lower()
+    for emotion in priority_order:
+        for word in emotions.get(emotion, {}).get("keywords", []):
+            if re.search(r'\b' + re.escape(word) + r'\b', text):
+                return emotion
+    for word in emotions.get("relaxed", {}).get("keywords", []):
+        if re.search(r'\b' + re.escape(word) + r'\b', text):
+            return "relaxed"
+    if "!" in text and "?" not in text:
+        return "happy"
+    if "..." in text:
+        return "relaxed"
+    return "normal"
+
+
+def make_emotions(per_emotion, rng):
+    emotions = {}
+    for emotion in EMOTIONS:
+        keywords = list(SEED_WORDS[emotion])
+        while len(keywords) < per_emotion:
+            keywords.append(f"{emotion[:3]}{rng.randrange(10_000)}word")
+        emotions[emotion] = {"keywords": keywords[:per_emotion]}
+    return emotions
+
+
+def make_texts(emotions, count, rng):
+    texts = []
+    for _ in range(count):
+        words = rng.choices(FILLER, k=rng.randint(5, 30))
+        if rng.random() < 0.4:  # Realistic: most turns carry no emotion keyword
+            emotion = rng.choice(EMOTIONS)
+            words.insert(rng.randrange(len(words) + 1), rng.choice(emotions[emotion]["keywords"]))
+        text = " ".join(words)
+        texts.append(text + rng.choice(["", ".", "!", "?", "..."]))
+    return texts
+
+
+def time_per_text(fn, texts, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for text in texts:
+            fn(text)
+        best = min(best, time.perf_counter() - started)
+    return best / len(texts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LimbicSystem matcher microbenchmark.")
+    parser.add_argument("--keywords", default="5,20,50,100", help="Keywords per emotion.")
+    parser.add_argument("--texts", type=int, default=500)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--out", help="Write the JSON report here.")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    results = []
+    for size in (int(k) for k in args.keywords.split(",")):
+        emotions = make_emotions(size, rng)
+        texts = make_texts(emotions, args.texts, rng)
+        limbic = LimbicSystem(emotions=emotions)
+
+        mismatches = sum(1 for t in texts if limbic.detect_emotion(t) != legacy_detect(emotions, t))
+        legacy_us = time_per_text(lambda t: legacy_detect(emotions, t), texts, args.repeats) * 1e6
+        compiled_us = time_per_text(limbic.detect_emotion, texts, args.repeats) * 1e6
+
+        started = time.perf_counter()
+        limbic.detect_emotions(texts)
+        batch_us = (time.perf_counter() - started) / len(texts) * 1e6
+
+        results.append({
+            "keywords_per_emotion": size,
+            "legacy_us": round(legacy_us, 2),
+            "compiled_us": round(compiled_us, 2),
+            "batch_us": round(batch_us, 2),
+            "speedup": round(legacy_us / compiled_us, 1),
+            "mismatches": mismatches,
+        })
+
+    text = json.dumps({"config": vars(args), "results": results}, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+if __name__ == "__main__":
+    main()
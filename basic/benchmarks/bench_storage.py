@@ -0,0 +1,122 @@
+# benchmarks/bench_storage.py
+"""
+Write cost of one chat turn as the journal grows.
+
+Compares the SQLite/WAL HistoryStore (one INSERT per message) with the old
+strategy of re-serializing the whole history to JSON on every turn. The
+JSON baseline is untrimmed, i.e. what "never lose history" would cost
+with a single file.
+
+    python -m benchmarks.bench_storage
+    python -m benchmarks.bench_storage --sizes 1000,100000,500000 --json-max 20000 --out storage.json
+"""
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+
+from src.brain.history_store import HistoryStore
+
+
+def summarize(samples):
+    """Latency summary in milliseconds (stdlib only: no Brain / SDK imports needed)."""
+    ordered = sorted(samples)
+
+    def pct(q):
+        return round(ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))] * 1000, 3)
+
+    return {"n": len(ordered), "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+            "p50_ms": pct(0.50), "p95_ms": pct(0.95), "max_ms": round(ordered[-1] * 1000, 3)}
+
+
+def message(i):
+    return {"role": "user" if i % 2 == 0 else "model", "text": f"message {i} " * 8}
+
+
+def seed(store, start, stop, chunk=50_000):
+    """Bulk-grows the journal to `stop` rows without timing it."""
+    for lo in range(start, stop, chunk):
+        rows = [(m["role"], m["text"], 0.0) for m in map(message, range(lo, min(stop, lo + chunk)))]
+        with store._transaction():
+            store._conn.executemany("INSERT INTO turns (role, text, ts) VALUES (?, ?, ?)", rows)
+
+
+def bench_sqlite(sizes, turns, window):
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        store = HistoryStore(os.path.join(tmp, "history.db"))
+        history = store.load(window)
+        grown = 0
+        for size in sizes:
+            seed(store, grown, size)
+            grown = size
+
+            samples = []
+            for i in range(turns):
+                # One turn = user + model message appended to a bounded live window
+                history.append(message(size + 2 * i))
+                history.append(message(size + 2 * i + 1))
+                del history[:-window]
+                started = time.perf_counter()
+                store.save(history, window)
+                samples.append(time.perf_counter() - started)
+            grown += 2 * turns
+
+            # Appends land in the -wal file until a checkpoint: it is part of the on-disk cost
+            wal_path = store.db_path + "-wal"
+            wal_bytes = os.path.getsize(wal_path) if os.path.exists(wal_path) else 0
+            results.append({"journal_messages": size,
+                            "db_mb": round((os.path.getsize(store.db_path) + wal_bytes) / 1e6, 1),
+                            "wal_mb": round(wal_bytes / 1e6, 1),
+                            "save_turn": summarize(samples)})
+        store.close()
+    return results
+
+
+def bench_json(sizes, turns, json_max):
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "history.json")
+        for size in (s for s in sizes if s <= json_max):
+            history = [message(i) for i in range(size)]
+            samples = []
+            for i in range(turns):
+                history.append(message(size + 2 * i))
+                history.append(message(size + 2 * i + 1))
+                started = time.perf_counter()
+                with open(path, 'w', encoding='utf-8') as f:
+                    json.dump(history, f, indent=4, ensure_ascii=False)
+                samples.append(time.perf_counter() - started)
+            results.append({"journal_messages": size, "save_turn": summarize(samples)})
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="History storage write-cost benchmark.")
+    parser.add_argument("--sizes", default="1000,10000,100000,300000", help="Journal sizes (messages) to measure at.")
+    parser.add_argument("--turns", type=int, default=200, help="Timed turns per size.")
+    parser.add_argument("--window", type=int, default=200, help="Live history window (MemorySystem.MAX_HISTORY).")
+    parser.add_argument("--json-max", type=int, default=10000, help="Largest size to run the JSON baseline at.")
+    parser.add_argument("--out", help="Write the JSON report here.")
+    args = parser.parse_args()
+
+    sizes = sorted(int(s) for s in args.sizes.split(","))
+    report = {
+        "config": vars(args),
+        "results": {
+            "sqlite_wal": bench_sqlite(sizes, args.turns, args.window),
+            "json_rewrite": bench_json(sizes, args.turns, args.json_max),
+        },
+    }
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+if __name__ == "__main__":
+    main()
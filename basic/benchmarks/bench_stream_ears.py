@@ -0,0 +1,132 @@
+# benchmarks/bench_stream_ears.py
+"""
+Streaming vs record-then-transcribe latency for Ears, replayed through the
+fake microphone (WavFileSource) in real time.
+
+Both modes run the same StreamingTranscriber. "batch" disables chunk commits
+and partials, which is what the old listen() did: wait for the pause, then
+decode the whole phrase. Reported per utterance:
+
+  after_speech_s   last spoken sample -> final text (includes the VAD's end-silence wait)
+  first_partial_s  replay start -> first partial hypothesis (streaming only)
+
+The default ASR is a stand-in whose cost grows with the audio length
+(--rtf, --overhead). --whisper uses the real model of an ASR profile instead.
+
+    python -m benchmarks.bench_stream_ears
+    python -m benchmarks.bench_stream_ears --wav a.wav b.wav --whisper
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+
+from benchmarks.bench_storage import summarize
+from src.senses.asr_profiles import ASRProfile
+from src.senses.audio_stream import SAMPLE_RATE, StreamingTranscriber, WavFileSource
+
+BATCH = {"chunk_s": None, "max_chunk_s": None, "partial_s": None}
+
+
+class FakeASR:
+    """Sleeps overhead + rtf * audio_seconds, returns one 'word' per 0.4 s of audio."""
+
+    def __init__(self, rtf=0.3, overhead=0.15):
+        self.rtf = rtf
+        self.overhead = overhead
+
+    def __call__(self, samples, prompt="", partial=False):
+        seconds = len(samples) / SAMPLE_RATE
+        time.sleep(self.overhead + self.rtf * seconds)
+        return " ".join("word" for _ in range(max(1, int(seconds / 0.4))))
+
+
+def whisper_asr(profile=None):
+    asr = ASRProfile.from_config(profile)
+    model = asr.load_model()
+
+    def transcribe(samples, prompt="", partial=False):
+        return asr.transcribe(model, samples, prompt=prompt, partial=partial)[0]
+    return transcribe
+
+
+def synthetic_utterance(seconds, seed):
+    """Word-like voiced bursts with short gaps and a longer pause every few words."""
+    rng = np.random.default_rng(seed)
+    pieces = []
+    total = 0
+    words = 0
+    while total < seconds * SAMPLE_RATE:
+        n = int(rng.uniform(0.2, 0.45) * SAMPLE_RATE)
+        t = np.arange(n) / SAMPLE_RATE
+        envelope = np.sin(np.pi * np.arange(n) / n)
+        word = 4000 * envelope * np.sin(2 * np.pi * rng.uniform(120, 220) * t) + rng.normal(0, 300, n)
+        words += 1
+        gap = 0.35 if words % 6 == 0 else 0.06
+        pieces += [word, rng.normal(0, 30, int(gap * SAMPLE_RATE))]
+        total += n + int(gap * SAMPLE_RATE)
+    return np.clip(np.concatenate(pieces), -32768, 32767).astype(np.int16)
+
+
+def run_once(source, asr, overrides):
+    streamer = StreamingTranscriber(source, asr, **overrides)
+    first_partial = None
+    final = ""
+    for event in streamer.stream():
+        if event["type"] == "partial" and first_partial is None:
+            first_partial = time.perf_counter() - source._started
+        elif event["type"] == "final":
+            final = event["text"]
+    done_at = time.perf_counter()
+
+    return {
+        "after_speech_s": done_at - source.audio_end_at,
+        "first_partial_s": first_partial,
+        "decodes": streamer.stats["decodes"],
+        "decode_s": streamer.stats["decode_s"],
+        "chars": len(final),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ears streaming vs batch latency benchmark.")
+    parser.add_argument("--wav", nargs="*", help="Recorded utterances (default: synthetic).")
+    parser.add_argument("--seconds", type=float, default=8.0, help="Length of each synthetic utterance.")
+    parser.add_argument("--utterances", type=int, default=3, help="Synthetic utterances to generate.")
+    parser.add_argument("--rtf", type=float, default=0.3, help="Fake ASR: seconds of compute per second of audio.")
+    parser.add_argument("--overhead", type=float, default=0.15, help="Fake ASR: fixed cost per call.")
+    parser.add_argument("--whisper", action="store_true", help="Use a real Whisper model.")
+    parser.add_argument("--profile", help="ASR profile for --whisper (default: ears.profile in config.json).")
+    parser.add_argument("--end-silence-ms", type=int, default=700)
+    parser.add_argument("--out", help="Write the JSON report here.")
+    args = parser.parse_args()
+
+    asr = whisper_asr(args.profile) if args.whisper else FakeASR(args.rtf, args.overhead)
+    if args.wav:
+        make_sources = [lambda path=path: WavFileSource(path=path) for path in args.wav]
+    else:
+        utterances = [synthetic_utterance(args.seconds, seed) for seed in range(args.utterances)]
+        make_sources = [lambda samples=samples: WavFileSource(samples=samples) for samples in utterances]
+
+    results = {}
+    for mode, overrides in (("batch", BATCH), ("streaming", {})):
+        runs = [run_once(make(), asr, {"end_silence_ms": args.end_silence_ms, **overrides}) for make in make_sources]
+        partials = [r["first_partial_s"] for r in runs if r["first_partial_s"] is not None]
+        results[mode] = {
+            "after_speech": summarize([r["after_speech_s"] for r in runs]),
+            "first_partial": summarize(partials) if partials else None,
+            "decodes": sum(r["decodes"] for r in runs),
+            "decode_s": round(sum(r["decode_s"] for r in runs), 3),
+            "chars": [r["chars"] for r in runs],
+        }
+
+    text = json.dumps({"config": vars(args), "results": results}, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+if __name__ == "__main__":
+    main()
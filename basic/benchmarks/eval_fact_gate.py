@@ -0,0 +1,115 @@
+# benchmarks/eval_fact_gate.py
+"""
+Offline evaluation of the FactGate (skip-the-extraction-call pre-filter).
+
+For each threshold it reports, on a labelled corpus:
+  - skipped_rate   share of ALL turns that would not reach the Subconscious
+  - missed_facts   fact-bearing turns that were skipped (false negatives)
+  - precision / recall of "send to extraction"
+
+The default weights were hand-tuned on fixtures/fact_gate_corpus.jsonl, so
+their numbers there are in-sample ("tuning_corpus"). The headline
+"held_out" numbers come from fixtures/fact_gate_holdout.jsonl, which was
+never used to pick weights or thresholds. Keep it that way: tune on the
+corpus, only ever read the hold-out. It deliberately includes facts that
+don't start with "I"/"my" ("Sold half my AMD position", "Pescatarian these
+days"), which is where a cue-based gate misses.
+
+    python -m benchmarks.eval_fact_gate
+    python -m benchmarks.eval_fact_gate --train                      # + trained gate (5-fold CV and hold-out)
+    python -m benchmarks.eval_fact_gate --corpus data/fact_gate_log.jsonl --train --save data/fact_gate.json
+"""
+import argparse
+import json
+import os
+import random
+
+from src.brain.fact_gate import FactGate
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+DEFAULT_CORPUS = os.path.join(FIXTURES, "fact_gate_corpus.jsonl")
+DEFAULT_HOLDOUT = os.path.join(FIXTURES, "fact_gate_holdout.jsonl")
+THRESHOLDS = (0.1, 0.2, 0.35, 0.5, 0.65, 0.8)
+
+
+def evaluate(gate, samples, thresholds=THRESHOLDS):
+    return evaluate_scores([(gate.score(text), label) for text, label in samples], thresholds)
+
+
+def evaluate_scores(scored, thresholds=THRESHOLDS):
+    """scored = [(gate_score, has_facts)]"""
+    positives = sum(1 for _, label in scored if label)
+    rows = []
+    for threshold in thresholds:
+        sent = [(s, label) for s, label in scored if s >= threshold]
+        true_pos = sum(1 for _, label in sent if label)
+        rows.append({
+            "threshold": threshold,
+            "skipped_rate": round(1 - len(sent) / len(scored), 3),
+            "missed_facts": positives - true_pos,
+            "missed_rate": round((positives - true_pos) / positives, 3) if positives else 0.0,
+            "precision": round(true_pos / len(sent), 3) if sent else None,
+            "recall": round(true_pos / positives, 3) if positives else None,
+        })
+    return rows
+
+
+def cross_validate(samples, folds, thresholds=THRESHOLDS):
+    """Trains on k-1 folds, scores the held-out fold, then evaluates all held-out scores together."""
+    shuffled = list(samples)
+    random.Random(0).shuffle(shuffled)
+    held_out = []
+    for k in range(folds):
+        test = shuffled[k::folds]
+        train = [s for i, s in enumerate(shuffled) if i % folds != k]
+        gate = FactGate()
+        gate.train(train)
+        held_out += [(gate.score(text), label) for text, label in test]
+
+    return evaluate_scores(held_out, thresholds)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate the subconscious fact gate.")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="JSONL with {text, facts} rows (fixture or fact_gate_log).")
+    parser.add_argument("--holdout", default=DEFAULT_HOLDOUT, help="Held-out JSONL, never trained or tuned on.")
+    parser.add_argument("--train", action="store_true", help="Also report a cross-validated trained gate.")
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--save", help="Train on the whole corpus and write the model here.")
+    parser.add_argument("--out", help="Write the JSON report here.")
+    args = parser.parse_args()
+
+    samples = FactGate.read_log(args.corpus)
+    held_out = FactGate.read_log(args.holdout)
+    report = {
+        "corpus": args.corpus,
+        "turns": len(samples),
+        "fact_turns": sum(1 for _, label in samples if label),
+        "holdout": args.holdout,
+        "holdout_turns": len(held_out),
+        "default_weights": {
+            "held_out": evaluate(FactGate(), held_out) if held_out else None,
+            "tuning_corpus": evaluate(FactGate(), samples),  # In-sample when the corpus is the fixture
+        },
+    }
+    if args.train:
+        report["trained_cv"] = cross_validate(samples, args.folds)
+        if held_out:
+            gate = FactGate()
+            gate.train(samples)
+            report["trained_held_out"] = evaluate(gate, held_out)
+    if args.save:
+        gate = FactGate()
+        gate.train(samples)
+        gate.save(args.save)
+        report["saved"] = args.save
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+# benchmarks/fake_providers.py
+"""
+Deterministic stand-ins for the Gemini, Groq and Ollama clients.
+
+They implement just the surface Brain touches (generate_content[_stream],
+chat.completions.create, models.get/list, LocalEngine.think[_stream]/probe)
+with configurable latency and failure distributions, so the Brain can be
+benchmarked or served offline:
+
+    brain = Brain(gemini_client=FakeGeminiClient(LatencyModel(0.4)), ...)
+"""
+import random
+import threading
+import time
+from types import SimpleNamespace
+
+
+class FakeProviderError(Exception):
+    def __init__(self, message, status_code=500):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class LatencyModel:
+    """
+    Seeded latency / failure generator.
+      mean, jitter     -> gaussian call latency (seconds, clamped at 0)
+      first_token      -> fraction of the latency spent before the first streamed token
+      failure_rate     -> chance of a plain error (provider-level failover)
+      capacity_rate    -> chance of a 429 (model rotation inside the provider)
+    """
+
+    def __init__(self, mean=0.2, jitter=0.05, first_token=0.3, failure_rate=0.0, capacity_rate=0.0, seed=0):
+        self.mean = mean
+        self.jitter = jitter
+        self.first_token = first_token
+        self.failure_rate = failure_rate
+        self.capacity_rate = capacity_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample(self):
+        """Returns (latency, outcome) where outcome is 'ok', 'error' or 'capacity'."""
+        with self._lock:
+            latency = max(0.0, self._rng.gauss(self.mean, self.jitter))
+            roll = self._rng.random()
+        if roll < self.capacity_rate:
+            return latency, "capacity"
+        if roll < self.capacity_rate + self.failure_rate:
+            return latency, "error"
+        return latency, "ok"
+
+
+def default_reply(prompt_text):
+    """Canned answers that keep every Brain code path happy."""
+    if "Output (JSON ONLY)" in prompt_text:
+        return "{}"
+    if "[RESPONSE FORMAT]" in prompt_text:
+        return '{"reply": "Sure thing. This is a deterministic fake reply.", "action": null, "facts": {}}'
+    if "Updated Summary" in prompt_text:
+        return "The user and ENJO have been chatting about benchmarks."
+    return "Sure thing. This is a deterministic fake reply. Nothing to see here."
+
+
+def _last_text(payload):
+    """Pulls the newest user text out of any payload shape the Brain produces."""
+    if isinstance(payload, str):
+        return payload
+    last = payload[-1]
+    if isinstance(last, dict):
+        return last.get("content", "")
+    parts = getattr(last, "parts", None) or []
+    return " ".join(getattr(p, "text", "") or "" for p in parts)
+
+
+class _FakeBackend:
+    def __init__(self, latency, reply_fn):
+        self.latency = latency or LatencyModel()
+        self.reply_fn = reply_fn or default_reply
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def respond(self, payload):
+        with self._lock:
+            self.calls += 1
+        delay, outcome = self.latency.sample()
+        time.sleep(delay)
+        self._raise_for(outcome)
+        return self.reply_fn(_last_text(payload))
+
+    def stream(self, payload):
+        with self._lock:
+            self.calls += 1
+        delay, outcome = self.latency.sample()
+        time.sleep(delay * self.latency.first_token)
+        self._raise_for(outcome)
+
+        words = self.reply_fn(_last_text(payload)).split(" ")
+        per_token = delay * (1 - self.latency.first_token) / max(1, len(words))
+        for i, word in enumerate(words):
+            if i:
+                time.sleep(per_token)
+            yield word if i == 0 else " " + word
+
+    @staticmethod
+    def _raise_for(outcome):
+        if outcome == "capacity":
+            raise FakeProviderError("429 RESOURCE_EXHAUSTED (fake)", status_code=429)
+        if outcome == "error":
+            raise FakeProviderError("500 fake provider failure", status_code=500)
+
+
+# --- GEMINI (google.genai.Client shape) ---
+class _FakeGeminiModels:
+    def __init__(self, backend, probe_latency):
+        self._backend = backend
+        self._probe_latency = probe_latency
+
+    def generate_content(self, model, contents):
+        return SimpleNamespace(text=self._backend.respond(contents))
+
+    def generate_content_stream(self, model, contents):
+        for token in self._backend.stream(contents):
+            yield SimpleNamespace(text=token)
+
+    def get(self, model):
+        time.sleep(self._probe_latency)
+        return SimpleNamespace(name=model)
+
+
+class FakeGeminiClient:
+    def __init__(self, latency=None, reply_fn=None, probe_latency=0.01):
+        self.backend = _FakeBackend(latency, reply_fn)
+        self.models = _FakeGeminiModels(self.backend, probe_latency)
+
+
+# --- GROQ (groq.Groq shape) ---
+class _FakeGroqCompletions:
+    def __init__(self, backend):
+        self._backend = backend
+
+    def create(self, messages, model, stream=False):
+        if stream:
+            return (
+                SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=token))])
+                for token in self._backend.stream(messages)
+            )
+        text = self._backend.respond(messages)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=text))])
+
+
+class _FakeGroqModels:
+    def __init__(self, probe_latency):
+        self._probe_latency = probe_latency
+
+    def list(self):
+        time.sleep(self._probe_latency)
+        return []
+
+
+class FakeGroqClient:
+    def __init__(self, latency=None, reply_fn=None, probe_latency=0.01):
+        self.backend = _FakeBackend(latency, reply_fn)
+        self.chat = SimpleNamespace(completions=_FakeGroqCompletions(self.backend))
+        self.models = _FakeGroqModels(probe_latency)
+
+
+# --- OLLAMA (LocalEngine shape) ---
+class FakeLocalEngine:
+    def __init__(self, latency=None, reply_fn=None, model_name="llama3", probe_latency=0.005):
+        self.backend = _FakeBackend(latency, reply_fn)
+        self.model_name = model_name
+        self.status = "ready"  # Nothing to warm up
+        self._probe_latency = probe_latency
+
+    def stop(self):
+        pass
+
+    def probe(self):
+        time.sleep(self._probe_latency)
+
+    def think(self, messages):
+        return self.backend.respond(messages)
+
+    def think_stream(self, messages):
+        yield from self.backend.stream(messages)
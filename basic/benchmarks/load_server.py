@@ -0,0 +1,106 @@
+# benchmarks/load_server.py
+"""
+Load generator for server.py.
+
+Opens N concurrent sessions, each sending M turns back to back over HTTP or
+WebSocket, and prints throughput plus latency percentiles as JSON.
+
+    python server.py --fake --fake-latency 0.3 --workers 16
+    python -m benchmarks.load_server --sessions 64 --turns 20 --mode ws
+"""
+import argparse
+import asyncio
+import json
+import time
+
+import aiohttp
+
+
+def percentile(values, q):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+async def http_session(client, base, sid, turns, results):
+    for i in range(turns):
+        started = time.perf_counter()
+        async with client.post(f"{base}/v1/sessions/{sid}/chat", json={"text": f"Turn {i}: tell me something."}) as resp:
+            await resp.read()
+            results["status"][resp.status] = results["status"].get(resp.status, 0) + 1
+            if resp.status == 200:
+                results["latency"].append(time.perf_counter() - started)
+
+
+async def ws_session(client, base, sid, turns, results):
+    async with client.ws_connect(f"{base}/v1/sessions/{sid}/ws") as ws:
+        for i in range(turns):
+            started = time.perf_counter()
+            first = None
+            await ws.send_json({"text": f"Turn {i}: tell me something."})
+            async for msg in ws:
+                event = msg.json()
+                if event["type"] == "sentence" and first is None:
+                    first = time.perf_counter() - started
+                if event["type"] == "busy":
+                    results["status"]["busy"] = results["status"].get("busy", 0) + 1
+                    break
+                if event["type"] == "done":
+                    results["latency"].append(time.perf_counter() - started)
+                    if first is not None:
+                        results["first_sentence"].append(first)
+                    results["status"][200] = results["status"].get(200, 0) + 1
+                    break
+
+
+async def run(args):
+    base = args.url.rstrip("/")
+    results = {"latency": [], "first_sentence": [], "status": {}}
+    worker = ws_session if args.mode == "ws" else http_session
+
+    connector = aiohttp.TCPConnector(limit=args.sessions)
+    async with aiohttp.ClientSession(connector=connector) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            worker(client, base, f"load-{i}", args.turns, results) for i in range(args.sessions)
+        ))
+        elapsed = time.perf_counter() - started
+
+    ok = len(results["latency"])
+    report = {
+        "mode": args.mode,
+        "sessions": args.sessions,
+        "turns_per_session": args.turns,
+        "elapsed_s": round(elapsed, 3),
+        "completed": ok,
+        "throughput_turns_per_s": round(ok / elapsed, 2) if elapsed else None,
+        "status": {str(k): v for k, v in results["status"].items()},
+        "latency_ms": {f"p{int(q * 100)}": round(percentile(results["latency"], q) * 1000, 1) if ok else None
+                       for q in (0.5, 0.95, 0.99)},
+    }
+    if results["first_sentence"]:
+        report["first_sentence_ms"] = {f"p{int(q * 100)}": round(percentile(results["first_sentence"], q) * 1000, 1)
+                                       for q in (0.5, 0.95, 0.99)}
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load generator for the ENJO Brain server.")
+    parser.add_argument("--url", default="http://127.0.0.1:8765")
+    parser.add_argument("--sessions", type=int, default=32)
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--mode", choices=["http", "ws"], default="http")
+    parser.add_argument("--out", help="Also write the JSON report to this file.")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+if __name__ == "__main__":
+    main()
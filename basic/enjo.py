@@ -1,31 +1,44 @@
-from src.brain.core import Brain
-from src.senses.mouth import Mouth
-from src.senses.ears import Ears
+import time
+
+from src.utils.boot import OrganBoot, StartupProfile
 from src.utils.config_manager import ConfigManager
-from src.hands.desktop import DesktopController
+from src.brain.intent_router import IntentRouter
+from src.utils.telemetry import Telemetry
 
 class ENJO:
-    def __init__(self):
+    def __init__(self, parallel_boot=True, profile_startup=False):
         self.config = ConfigManager.load_config()
         version = self.config.get("system", {}).get("version", "1.0-Public")
         name = self.config.get("system", {}).get("name", "Enjo")
 
         print(f"\n>> SYSTEM: Booting {name} v{version}...")
 
-        # Initialize Organs
-        self.brain = Brain()
-        self.mouth = Mouth()
-        self.ears = Ears()
-        self.hands = DesktopController() # Grants control over OS
+        # Initialize Organs (in parallel: boot takes as long as the slowest one, not the sum)
+        self.boot = OrganBoot(parallel=parallel_boot)
+        self.boot.submit("brain", "src.brain.core", "Brain")
+        self.boot.submit("mouth", "src.senses.mouth", "Mouth")
+        self.boot.submit("ears", "src.senses.ears", "Ears")
+        self.boot.submit("hands", "src.hands.desktop", "DesktopController") # Grants control over OS
+        self.reflexes = IntentRouter()   # Local fast-path for plain commands
+
+        self.boot.wait_all()
+        self.brain = self.boot.get("brain")
+        self.mouth = self.boot.get("mouth")
+        self.ears = self.boot.get("ears")
+        self.hands = self.boot.get("hands")
 
         print(">> SYSTEM: All organs online.")
+        if profile_startup:
+            print(StartupProfile.get().report())
 
     def run(self):
         self.mouth.speak("System online.")
+        telemetry = Telemetry.get()
 
         while True:
             try:
                 # --- PHASE 1: SENSORY INPUT ---
+                telemetry.begin_turn()
                 user_input = self.ears.listen()
                 if not user_input:
                     continue
@@ -34,45 +47,53 @@ class ENJO:
                     self.mouth.speak("Shutting down.")
                     break
 
-                # --- PHASE 2: COGNITION (Brain) ---
-                # No emotion override needed for Basic Mode
-                response = self.brain.think(user_input)
-
-                # Clean Response for logs
-                clean_response = response
-                if "]: " in response:
-                    clean_response = response.split("]: ")[-1]
-
-                # --- PHASE 3: ACTION PARSER ---
-                final_text_to_speak = clean_response
-
-                if "[ACTION:" in response:
-                    try:
-                        # Extract Tag
-                        start = response.find("[ACTION:")
-                        end = response.find("]", start)
-                        action_tag = response[start:end+1]
-
-                        # Parse Command
-                        content = action_tag.replace("[ACTION:", "").replace("]", "").strip()
-                        cmd, target = content.split("|")
-
-                        print(f"   (🦾 Action: {cmd.strip().upper()} -> {target.strip()})")
-
-                        # Execute (No Affection Check in Basic Mode)
-                        result = self.hands.execute(cmd.strip(), target.strip())
-                        print(f"   >> System: {result}")
-
-                        # Remove tag from speech
-                        final_text_to_speak = response.replace(action_tag, "").strip()
-
-                    except Exception as e:
-                        print(f"   >> Action Error: {e}")
+                # --- PHASE 1.5: REFLEXES (Plain commands skip the LLM) ---
+                if self._try_reflex(user_input):
+                    telemetry.end_turn(path="reflex", input_chars=len(user_input))
+                    continue
 
-                # --- PHASE 4: SPEAK ---
-                if final_text_to_speak:
-                    print(f"🤖 ENJO: {final_text_to_speak}", flush=True)
-                    self.mouth.speak(final_text_to_speak)
+                # --- PHASE 2: COGNITION (Brain, streamed) ---
+                # No emotion override needed for Basic Mode
+                turn_start = time.perf_counter()
+                self.mouth.begin_utterance()
+                spoke_anything = False
+
+                for event in self.brain.think_stream(user_input):
+                    # --- PHASE 3: ACTION PARSER (Tags arrive already parsed) ---
+                    if event["type"] == "action":
+                        cmd, target = event["command"], event["target"]
+                        print(f"   (🦾 Action: {cmd.upper()} -> {target})")
+                        try:
+                            # Execute (No Affection Check in Basic Mode)
+                            result = self.hands.execute(cmd, target)
+                            print(f"   >> System: {result}")
+                        except Exception as e:
+                            print(f"   >> Action Error: {e}")
+
+                    # --- PHASE 4: SPEAK (Sentence by sentence) ---
+                    elif event["type"] == "sentence":
+                        if not spoke_anything:
+                            print("🤖 ENJO:", end="", flush=True)
+                            spoke_anything = True
+                        print(f" {event['text']}", end="", flush=True)
+                        self.mouth.say(event["text"])
+
+                    elif event["type"] == "error":
+                        print(event["text"])
+
+                if spoke_anything:
+                    print(flush=True)
+                self.mouth.wait_until_done()
+                self._report_latency(turn_start)
+
+                stats = getattr(self.brain, "last_stream_stats", None) or {}
+                telemetry.end_turn(
+                    path="brain",
+                    provider=stats.get("provider"),
+                    model=self.brain.active_model_name,
+                    input_chars=len(user_input),
+                    first_audio_s=round(self.mouth.first_audio_at - turn_start, 6) if self.mouth.first_audio_at else None,
+                )
 
             except KeyboardInterrupt:
                 print("\n>> SYSTEM: Manual Interrupt.")
@@ -80,6 +101,44 @@ class ENJO:
             except Exception as e:
                 print(f">> CRITICAL RUNTIME ERROR: {e}")
 
+        # Let the subconscious finish writing what it learned
+        self.brain.shutdown()
+        print(f">> SYSTEM: {self.reflexes.report()}")
+
+    def _try_reflex(self, user_input):
+        """Executes confident desktop commands directly. Returns True if handled."""
+        intent = self.reflexes.route(user_input)
+        if not intent:
+            return False
+
+        cmd, target, ack = intent
+        print(f"   (⚡ Reflex: {cmd.upper()} -> {target})")
+        try:
+            result = self.hands.execute(cmd, target)
+            print(f"   >> System: {result}")
+        except Exception as e:
+            print(f"   >> Action Error: {e}")
+
+        print(f"🤖 ENJO: {ack}", flush=True)
+        self.mouth.speak(ack)
+
+        # Keep the conversation history continuous, as if the LLM had answered
+        self.brain.remember_turn(user_input, f"[ACTION: {cmd} | {target}] {ack}")
+        return True
+
+    def _report_latency(self, turn_start):
+        """Prints time-to-first-token / first-sentence / first-audio for the last turn."""
+        stats = getattr(self.brain, "last_stream_stats", None) or {}
+        parts = []
+        if stats.get("first_token_s") is not None:
+            parts.append(f"token {stats['first_token_s']:.2f}s")
+        if stats.get("first_sentence_s") is not None:
+            parts.append(f"sentence {stats['first_sentence_s']:.2f}s")
+        if self.mouth.first_audio_at is not None:
+            parts.append(f"audio {self.mouth.first_audio_at - turn_start:.2f}s")
+        if parts:
+            print(f"   (⏱️ First {' | '.join(parts)})")
+
 if __name__ == "__main__":
     bot = ENJO()
     bot.run()
\ No newline at end of file
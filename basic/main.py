@@ -13,11 +13,20 @@
 
 #print(">> DEBUG: main.py has started...")  # If you don't see this, Python isn't running the file.
 
+import argparse
+
 from enjo import ENJO  # noqa: E402
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ENJO - Anthropomorphic AI Assistant")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Print boot time per organ, module import and SDK import.")
+    parser.add_argument("--sequential-boot", action="store_true",
+                        help="Build the organs one after another (for comparison).")
+    args = parser.parse_args()
+
     #print("\n>> DEBUG: Creating ENJO instance...")
-    bot = ENJO()
+    bot = ENJO(parallel_boot=not args.sequential_boot, profile_startup=args.profile_startup)
 
     #print(">> DEBUG: Starting Main Loop...")
     bot.run()  # <--- This is the critical line that keeps it alive
\ No newline at end of file
@@ -0,0 +1,74 @@
+# ENJO - Anthropomorphic AI Assistant
+# Copyright (C) 2026 Sania
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# Runs ENJO's Brain as a shared multi-session service (no mic, speaker or hands).
+# Actions come back to the client as events; they are NOT executed on the server.
+#
+#   python server.py --port 8765
+#   python server.py --fake --fake-latency 0.3     (offline, for load tests)
+
+import argparse
+import os
+import tempfile
+
+from aiohttp import web
+
+from src.brain.core import Brain
+from src.brain.memory import MemorySystem
+from src.server.app import BrainServer
+
+
+def build_brain(args):
+    if not args.fake:
+        return Brain()
+
+    from benchmarks.fake_providers import FakeGeminiClient, FakeGroqClient, FakeLocalEngine, LatencyModel
+
+    def latency(seed):
+        return LatencyModel(mean=args.fake_latency, jitter=args.fake_latency / 5, failure_rate=args.fake_failure_rate, seed=seed)
+
+    # The root Brain only hosts shared clients; keep fake runs away from the real data/ dir
+    return Brain(
+        memory=MemorySystem(data_dir=tempfile.mkdtemp(prefix="enjo-fake-")),
+        gemini_client=FakeGeminiClient(latency(1)),
+        groq_client=FakeGroqClient(latency(2)),
+        local_engine=FakeLocalEngine(latency(3)),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ENJO Brain server (HTTP + WebSocket).")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=8, help="Turns generated at the same time.")
+    parser.add_argument("--max-queue", type=int, default=32, help="Extra turns allowed to wait before 503.")
+    parser.add_argument("--max-sessions", type=int, default=256)
+    parser.add_argument("--sessions-dir", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "sessions"))
+    parser.add_argument("--fake", action="store_true", help="Use deterministic fake providers (offline).")
+    parser.add_argument("--fake-latency", type=float, default=0.3)
+    parser.add_argument("--fake-failure-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = BrainServer(
+        build_brain(args),
+        args.sessions_dir,
+        workers=args.workers,
+        max_queue=args.max_queue,
+        max_sessions=args.max_sessions,
+    )
+    print(f">> SERVER: Listening on http://{args.host}:{args.port} ({args.workers} workers)")
+    web.run_app(server.build_app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
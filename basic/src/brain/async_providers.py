@@ -0,0 +1,212 @@
+# src/brain/async_providers.py
+import asyncio
+
+from src.utils.boot import lazy_import
+
+httpx = lazy_import("httpx")
+genai = lazy_import("google.genai")
+types = lazy_import("google.genai.types")
+groq = lazy_import("groq")
+ollama = lazy_import("ollama")
+
+
+class AsyncProvider:
+    """
+    asyncio-native provider interface.
+    generate() returns the reply text and RAISES on failure, exactly like
+    Brain._call_provider, so the same rotation / failover logic applies.
+    """
+
+    name = "base"
+
+    def __init__(self, timeout=30.0):
+        self.timeout = timeout  # Per-call deadline (seconds)
+
+    async def generate(self, payload, model_name, is_chat=True):
+        return await asyncio.wait_for(self._generate(payload, model_name, is_chat), timeout=self.timeout)
+
+    async def probe(self):
+        await asyncio.wait_for(self._probe(), timeout=self.timeout)
+
+    async def _generate(self, payload, model_name, is_chat):
+        raise NotImplementedError
+
+    async def _probe(self):
+        raise NotImplementedError
+
+    async def aclose(self):
+        pass
+
+
+class AsyncGeminiProvider(AsyncProvider):
+    name = "gemini"
+
+    def __init__(self, api_key=None, base_url=None, timeout=30.0, client=None):
+        super().__init__(timeout)
+        if client is None:
+            http_options = types.HttpOptions(base_url=base_url) if base_url else None
+            client = genai.Client(api_key=api_key, http_options=http_options)
+        # One client per process: the SDK keeps its own pooled async session (client.aio)
+        self.client = client
+
+    async def _generate(self, payload, model_name, is_chat):
+        response = await self.client.aio.models.generate_content(model=model_name, contents=payload)
+        return response.text
+
+    async def _probe(self):
+        await self.client.aio.models.list()
+
+    async def aclose(self):
+        await self.client.aio.aclose()
+
+
+class AsyncGroqProvider(AsyncProvider):
+    name = "groq"
+
+    def __init__(self, api_key, http_client, base_url=None, timeout=30.0):
+        super().__init__(timeout)
+        self.client = groq.AsyncGroq(api_key=api_key, base_url=base_url, http_client=http_client)
+
+    async def _generate(self, payload, model_name, is_chat):
+        if not is_chat:
+            payload = [{"role": "user", "content": payload}]
+        chat = await self.client.chat.completions.create(messages=payload, model=model_name)
+        return chat.choices[0].message.content
+
+    async def _probe(self):
+        await self.client.models.list()
+
+    async def aclose(self):
+        await self.client.close()
+
+
+class AsyncOllamaProvider(AsyncProvider):
+    name = "local"
+
+    def __init__(self, host=None, keep_alive="30m", timeout=60.0, limits=None):
+        super().__init__(timeout)
+        self.keep_alive = keep_alive
+        # Extra kwargs go to the underlying httpx.AsyncClient (keeps its own pool)
+        self.client = ollama.AsyncClient(host=host, limits=limits)
+
+    async def _generate(self, payload, model_name, is_chat):
+        if not is_chat:
+            payload = [{"role": "user", "content": payload}]
+        try:
+            response = await self.client.chat(model=model_name, messages=payload, keep_alive=self.keep_alive)
+            return response['message']['content']
+        # Same contract as LocalEngine.think: Local is the last resort, so errors are spoken
+        except ollama.ResponseError as e:
+            return f"Local Model Error: {e.error}"
+        except (httpx.HTTPError, ConnectionError) as e:
+            return f"CRITICAL: Local Ollama unreachable. Is 'ollama serve' running? ({e})"
+
+    async def _probe(self):
+        await self.client.list()
+
+    async def aclose(self):
+        await self.client.close()  # Releases the httpx session the AsyncClient owns
+
+
+class AsyncThreadedProvider(AsyncProvider):
+    """
+    Adapter for injected synchronous clients (fakes, pre-configured SDK
+    clients): each call runs on a worker thread, under the same timeout.
+    """
+
+    def __init__(self, name, client, timeout=30.0, probe_model=None):
+        super().__init__(timeout)
+        self.name = name
+        self.client = client
+        self.probe_model = probe_model
+
+    async def _generate(self, payload, model_name, is_chat):
+        return await asyncio.get_running_loop().run_in_executor(None, self._call, payload, model_name, is_chat)
+
+    async def _probe(self):
+        await asyncio.get_running_loop().run_in_executor(None, self._sync_probe)
+
+    def _call(self, payload, model_name, is_chat):
+        if self.name == "gemini":
+            return self.client.models.generate_content(model=model_name, contents=payload).text
+        if not is_chat:
+            payload = [{"role": "user", "content": payload}]
+        if self.name == "groq":
+            chat = self.client.chat.completions.create(messages=payload, model=model_name)
+            return chat.choices[0].message.content
+        return self.client.think(payload)  # LocalEngine shape
+
+    def _sync_probe(self):
+        if self.name == "gemini":
+            self.client.models.get(model=f"models/{self.probe_model}")
+        elif self.name == "groq":
+            self.client.models.list()
+        else:
+            self.client.probe()
+
+
+class AsyncProviderPool:
+    """
+    Builds the async providers lazily inside the running event loop and shares
+    one pooled httpx client between the cloud providers that accept it.
+
+    Clients injected into the Brain (clients={"gemini": ..., "groq": ...,
+    "local": ...}) take precedence over the API keys, so the async path talks
+    to the same endpoints (or fakes) as the sync one.
+    """
+
+    def __init__(self, config, gemini_key=None, groq_key=None, clients=None):
+        self.config = config
+        self.gemini_key = gemini_key
+        self.groq_key = groq_key
+        self.clients = {name: client for name, client in (clients or {}).items() if client is not None}
+        self.providers = {}
+        self._http = None
+
+    def get(self, provider):
+        if provider not in self.providers:
+            self.providers[provider] = self._build(provider)
+        return self.providers[provider]
+
+    def _limits(self):
+        return httpx.Limits(
+            max_connections=self.config.async_max_connections,
+            max_keepalive_connections=self.config.async_max_keepalive,
+        )
+
+    def _build(self, provider):
+        timeout = self.config.local_timeout if provider == "local" else self.config.provider_timeout
+        client = self.clients.get(provider)
+        if client is not None:
+            if provider == "gemini" and hasattr(client, "aio"):
+                return AsyncGeminiProvider(client=client, timeout=timeout)
+            probe_model = self.config.gemini_models[0] if provider == "gemini" else None
+            return AsyncThreadedProvider(provider, client, timeout=timeout, probe_model=probe_model)
+
+        if provider == "gemini" and self.gemini_key:
+            return AsyncGeminiProvider(self.gemini_key, base_url=self.config.gemini_base_url, timeout=timeout)
+        if provider == "groq" and self.groq_key:
+            if self._http is None:
+                self._http = httpx.AsyncClient(limits=self._limits(), timeout=timeout)
+            return AsyncGroqProvider(self.groq_key, self._http, base_url=self.config.groq_base_url, timeout=timeout)
+        if provider == "local" and self.config.local_enabled:
+            return AsyncOllamaProvider(
+                host=self.config.ollama_host,
+                keep_alive=self.config.local_keep_alive,
+                timeout=timeout,
+                limits=self._limits(),
+            )
+        return None
+
+    async def aclose(self):
+        """Closes every client the pool opened (keeps going if one of them fails)."""
+        for provider in self.providers.values():
+            if provider:
+                try:
+                    await provider.aclose()
+                except Exception as e:
+                    print(f">> Async: closing {provider.name} failed ({e})")
+        if self._http is not None:
+            await self._http.aclose()
+        self.providers = {}
+        self._http = None
@@ -48,7 +48,7 @@ class Personality:
         Commands:
         - Open Apps: [ACTION: open | chrome], [ACTION: open | notepad], [ACTION: open | spotify]
         - System: [ACTION: system | lock], [ACTION: system | sleep], [ACTION: system | shutdown]
-        - Volume: [ACTION: volume | 50], [ACTION: volume | mute], [ACTION: volume | 100]
+        - Volume: [ACTION: volume | 50], [ACTION: volume | mute], [ACTION: volume | unmute], [ACTION: volume | 100]
         - Media: [ACTION: media | play], [ACTION: media | next]
 
         Example:
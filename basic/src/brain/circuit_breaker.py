@@ -0,0 +1,124 @@
+# src/brain/circuit_breaker.py
+import threading
+import time
+
+
+class CircuitBreaker:
+    """
+    Per-model breaker.
+      closed    -> calls flow normally
+      open      -> model is benched until the cooldown runs out
+      half_open -> ONE trial call is let through; success closes, failure re-opens
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold=3, cooldown=30.0, capacity_cooldown=60.0):
+        self.failure_threshold = failure_threshold  # Plain errors tolerated before opening
+        self.cooldown = cooldown
+        self.capacity_cooldown = capacity_cooldown  # Rate limits / overload open instantly, for longer
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.open_for = cooldown
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """True if a call may go to this model right now (claims the half-open trial)."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.time() - self.opened_at >= self.open_for:
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self.state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def is_available(self):
+        """Read-only version of allow(), for routing decisions."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                return time.time() - self.opened_at >= self.open_for
+            return not self._trial_in_flight
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self, capacity=False):
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if capacity or self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.time()
+                self.open_for = self.capacity_cooldown if capacity else self.cooldown
+
+
+class ModelRouter:
+    """
+    Owns one CircuitBreaker per (provider, model) and decides which model of a
+    provider's list to try next. Cheap internal calls start from the provider's
+    lightest model instead of its flagship.
+    """
+
+    # Substrings that mean "this model is busy, try a sibling" rather than "provider is down"
+    CAPACITY_MARKERS = ("429", "503", "529", "resource_exhausted", "rate limit", "rate_limit",
+                        "quota", "overloaded", "unavailable", "too many requests")
+
+    def __init__(self, model_lists, light_models=None, failure_threshold=3, cooldown=30.0, capacity_cooldown=60.0):
+        self.model_lists = model_lists          # provider -> [model, ...] in preference order
+        self.light_models = light_models or {}  # provider -> cheapest model
+        self.breakers = {
+            (provider, model): CircuitBreaker(failure_threshold, cooldown, capacity_cooldown)
+            for provider, models in model_lists.items()
+            for model in models
+        }
+        self.rotations = 0  # Times we moved to a sibling model instead of another provider
+
+    def breaker(self, provider, model_name):
+        key = (provider, model_name)
+        if key not in self.breakers:
+            self.breakers[key] = CircuitBreaker()
+        return self.breakers[key]
+
+    def primary(self, provider):
+        """First model in the list whose breaker is not open."""
+        models = self.model_lists.get(provider, [])
+        for model in models:
+            if self.breaker(provider, model).is_available():
+                return model
+        return models[0] if models else None
+
+    def light_model(self, provider):
+        light = self.light_models.get(provider)
+        if light and self.breaker(provider, light).is_available():
+            return light
+        return self.primary(provider)
+
+    def candidates(self, provider, first=None):
+        """Models to try in order: the requested one, then the rest of the list."""
+        models = list(self.model_lists.get(provider, []))
+        if first is not None:
+            models = [first] + [m for m in models if m != first]
+        return models
+
+    @classmethod
+    def is_capacity_error(cls, error):
+        code = getattr(error, "status_code", None) or getattr(error, "code", None)
+        if code in (429, 503, 529):
+            return True
+        message = str(error).lower()
+        return any(marker in message for marker in cls.CAPACITY_MARKERS)
+
+    def snapshot(self):
+        return {f"{p}/{m}": b.state for (p, m), b in self.breakers.items()}
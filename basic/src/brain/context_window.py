@@ -0,0 +1,131 @@
+# src/brain/context_window.py
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+def approx_tokens(text):
+    """Default tokenizer: ~4 characters per token (good enough for budgeting)."""
+    return max(1, math.ceil(len(text) / 4))
+
+
+class ContextWindow:
+    """
+    Token-budgeted view of the chat history.
+
+    fit() returns the rolling summary plus the newest messages that fit the
+    budget. When the history overflows, the window jumps forward to a low-water
+    mark (so the prompt prefix stays stable for many turns) and the messages it
+    left behind are folded into the summary on a background thread. Once that
+    lands, the summarized messages are removed from the live history.
+    """
+
+    def __init__(self, tokenizer=None, summarize_fn=None, summary="", low_water=0.6, fallback_share=0.25):
+        self.tokenizer = tokenizer or approx_tokens
+        self.summarize_fn = summarize_fn   # (previous_summary, messages) -> new summary or None
+        self.summary = summary
+        self.low_water = low_water
+        self.fallback_share = fallback_share  # Cap on the extractive fallback summary, as a share of the budget
+
+        self._skip = 0          # Messages at the head of history excluded from the prompt
+        self._compacted = 0     # Messages folded into the summary, not yet removed from history
+        self._counts = {}       # id(message) -> token count
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="enjo-compactor")
+        self.stats = {"compactions": 0, "messages_compacted": 0, "fallback_summaries": 0}
+
+    def count(self, text):
+        return self.tokenizer(text)
+
+    def fit(self, history, budget):
+        """
+        Returns (summary, window_messages) for a history budget in tokens.
+        May shrink `history` in place once a background compaction has landed.
+        """
+        self._land(history)
+
+        window_tokens = sum(self._tokens(m) for m in history[self._skip:]) + self.count(self.summary or "")
+        if window_tokens > budget:
+            self._advance(history, budget)
+
+        return self.summary, history[self._skip:]
+
+    def drain(self, timeout=None):
+        """Waits for pending compactions (shutdown / tests)."""
+        done = threading.Event()
+        self._executor.submit(done.set)
+        return done.wait(timeout)
+
+    # --- INTERNALS ---
+    def _tokens(self, message):
+        key = id(message)
+        if key not in self._counts:
+            self._counts[key] = self.count(message["text"])
+        return self._counts[key]
+
+    def _land(self, history):
+        with self._lock:
+            n = self._compacted
+            self._compacted = 0
+        if not n:
+            return
+        for message in history[:n]:
+            self._counts.pop(id(message), None)
+        del history[:n]
+        self._skip -= n
+
+    def _advance(self, history, budget):
+        target = budget * self.low_water - self.count(self.summary or "")
+        total = sum(self._tokens(m) for m in history[self._skip:])
+        start = self._skip
+
+        # Drop oldest messages until we are under the low-water mark...
+        while start < len(history) - 1 and total > target:
+            total -= self._tokens(history[start])
+            start += 1
+        # ...and never start the window on a model reply
+        while start < len(history) - 1 and history[start]["role"] != "user":
+            start += 1
+
+        overflow = history[self._skip:start]
+        self._skip = start
+        if overflow:
+            self._executor.submit(self._compact, overflow, budget)
+
+    def _compact(self, messages, budget):
+        new_summary = None
+        if self.summarize_fn:
+            try:
+                new_summary = self.summarize_fn(self.summary, messages)
+            except Exception:
+                new_summary = None
+
+        if not new_summary:
+            # No model available: keep a crude extractive trace rather than nothing
+            self.stats["fallback_summaries"] += 1
+            gist = " | ".join(m["text"].split(".")[0][:80] for m in messages if m["role"] == "user")
+            new_summary = (self.summary + "\n" if self.summary else "") + f"Earlier the user said: {gist}"
+            new_summary = self._cap(new_summary, budget)
+
+        with self._lock:
+            self.summary = new_summary.strip()
+            self._compacted += len(messages)
+            self.stats["compactions"] += 1
+            self.stats["messages_compacted"] += len(messages)
+
+    def _cap(self, summary, budget):
+        """Keeps only the newest part of a fallback summary that fits its share of the budget."""
+        limit = max(1, int(budget * self.fallback_share))
+        lines = summary.split("\n")
+        while len(lines) > 1 and self.count("\n".join(lines)) > limit:
+            lines.pop(0)
+        head, sep, gist = lines[-1].rpartition(": ")
+        items = gist.split(" | ")
+        # One line left: drop its oldest gists...
+        while len(items) > 1 and self.count("\n".join(lines[:-1] + [head + sep + " | ".join(items)])) > limit:
+            items.pop(0)
+        text = "\n".join(lines[:-1] + [head + sep + " | ".join(items)])
+        # ...and as a last resort cut characters off its oldest end
+        while len(text) > 1 and self.count(text) > limit:
+            text = text[-max(1, len(text) * limit // self.count(text)):]
+        return text
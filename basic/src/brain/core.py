@@ -1,55 +1,143 @@
 # src/brain/core.py
+import copy
+import itertools
+import os
+import threading
 import time
-from google import genai
-from google.genai import types
-from groq import Groq
 
 from src.brain.local_engine import LocalEngine
 from src.brain.model_loader import ModelConfig
-import src.brain.bot_personality as Personality
 from src.brain.memory import MemorySystem
 from src.brain.subconscious import Subconscious
-
+from src.brain.subconscious_worker import SubconsciousWorker
+from src.brain.stream_parser import ActionTagDetector, SentenceChunker
+from src.brain.profile_index import ProfileIndex
+from src.brain.prompt_builder import PayloadBuilder
+from src.brain.fact_gate import FactGate
+from src.brain.fused_turn import FusedReplyStream, FusedTurn
+from src.brain.health_monitor import HealthMonitor
+from src.brain.hedging import HedgedExecutor
+from src.brain.circuit_breaker import ModelRouter
+from src.brain.context_window import ContextWindow, approx_tokens
+from src.brain.async_providers import AsyncProviderPool
+
+from src.utils.boot import lazy_import
 from src.utils.config_manager import ConfigManager
+from src.utils.telemetry import Telemetry
+
+# Provider SDKs load on first use: a Brain that only ever talks to Groq never imports google.genai
+genai = lazy_import("google.genai")
+groq = lazy_import("groq")
 
 class Brain:
-    def __init__(self):
+    def __init__(self, memory=None, gemini_client=None, groq_client=None, local_engine=None):
+        """
+        All arguments are optional injection points (server sessions, benchmarks).
+        By default the Brain builds everything itself from .env and data/.
+        """
         print(">> Brain: Initializing Unified Neural Core...")
 
         # 1. LOAD RESOURCES
         self.config = ModelConfig()
-        self.memory = MemorySystem()
+        self.memory = memory or MemorySystem()
         self.subconscious = Subconscious()
         self.profile = self.memory.load_profile()
+        self._profile_version = self.memory.profile_version
         self.history = self.memory.load_history()
+        self.payload_builder = PayloadBuilder("default")
+        self.profile_index = ProfileIndex()
+        self._indexed_profile = None
+        self._profile_query = ""
+        self.profile_stats = {"turns": 0, "tokens_full": 0, "tokens_injected": 0}
+        self._turn_recall = ""  # Long-term memories picked for the current turn
+        self.context = ContextWindow(
+            summarize_fn=self._summarize_turns,
+            summary=self.memory.load_summary(),
+        )
 
         # 2. INIT CLOUD CLIENTS
-        self.gemini_client = None
-        if self.config.gemini_key:
+        self.gemini_client = gemini_client
+        if self.gemini_client is None and self.config.gemini_key:
             try:
                 self.gemini_client = genai.Client(api_key=self.config.gemini_key)
             except Exception:
                 pass
 
-        self.groq_client = None
-        if self.config.groq_key:
+        self.groq_client = groq_client
+        if self.groq_client is None and self.config.groq_key:
             try:
-                self.groq_client = Groq(api_key=self.config.groq_key)
+                self.groq_client = groq.Groq(api_key=self.config.groq_key)
             except Exception:
                 pass
 
-        # 3. INIT LOCAL ENGINE
-        self.local_engine = None
+        # Async twins of the clients above, built lazily inside the event loop
+        self.async_providers = AsyncProviderPool(
+            self.config, self.config.gemini_key, self.config.groq_key,
+            clients={"gemini": gemini_client, "groq": groq_client, "local": local_engine},  # Injected ones only
+        )
+
+        # 3. INIT LOCAL ENGINE (Pre-warmed in the background so failover lands on a hot model)
+        self.local_engine = local_engine
+        if self.local_engine is None and self.config.local_prewarm and self._ensure_local_engine():
+            self.local_engine.start_warmup()
+
+        # Per-model circuit breakers over the FULL model lists
+        self.router = ModelRouter(
+            {
+                "gemini": self.config.gemini_models,
+                "groq": self.config.groq_models,
+                "local": [self.config.local_model_name],
+            },
+            light_models=self.config.light_models,
+            cooldown=self.config.breaker_cooldown,
+            capacity_cooldown=self.config.breaker_capacity_cooldown,
+        )
 
         # 4. STARTUP CONNECTION
         self.active_provider = "none"
         self.active_model_name = "Unknown"
-        self.last_cloud_check = time.time() # Start the timer now
+
+        # Probes run concurrently in the background from now on;
+        # boot only waits for the FIRST provider to answer.
+        self.health = HealthMonitor(
+            interval=self.config.health_interval,
+            fast_interval=self.config.health_fast_interval,
+            probe_timeout=self.config.health_probe_timeout,
+        )
+        self._register_probes()
+        self.health.start()
+
+        # Hedged generation (opt-in via ModelConfig.hedging_enabled)
+        self.hedger = HedgedExecutor(
+            percentile=self.config.hedge_percentile,
+            min_delay=self.config.hedge_min_delay,
+            max_delay=self.config.hedge_max_delay,
+        )
+
+        # Single-call turns (opt-in via ModelConfig.fused_turns)
+        self.fused = FusedTurn(max_failures=self.config.fused_max_failures)
 
         # Initial Check (Run once at startup)
         self._refresh_connection_status()
         self._update_system_prompt()
 
+        # 5. SUBCONSCIOUS THREAD (Fact extraction runs off the critical path)
+        # The fact gate skips the extraction call for turns like "hello" or "mute"
+        self.fact_gate = FactGate.load(
+            os.path.join(self.memory.data_dir, "fact_gate.json"),
+            threshold=self.config.fact_gate_threshold,
+            explore_rate=self.config.fact_gate_explore_rate,
+            log_path=os.path.join(self.memory.data_dir, "fact_gate_log.jsonl") if self.config.fact_gate_log else None,
+            log_max_bytes=self.config.fact_gate_log_max_bytes,
+        )
+        self._profile_lock = threading.Lock()
+        self.subconscious_worker = SubconsciousWorker(
+            self.subconscious,
+            generate_fn=self._generate_light,
+            apply_fn=self._apply_facts,
+            observe_fn=self._observe_extraction,
+        )
+
     def _update_system_prompt(self):
             """Re-injects profile data into the personality."""
 
@@ -61,61 +149,213 @@ class Brain:
                 f"Projects: {self.profile.get('projects', [])}"
             )
 
-            # Add any extra fields found in memory
-            if self.profile:
-                for k, v in self.profile.items():
-                    if k not in ["name", "stocks", "projects"]:
-                        profile_text += f"\n{k.capitalize()}: {v}"
-
-            # 2. Load Base Personality (Rules are now hidden inside here!)
-            base_system = Personality.Personality.get_system_prompt("default")
-
-            # 3. Combine
-            self.system_prompt = base_system + profile_text
-
-    def _engage_local_mode(self):
-        print(" Switching to Local Core.")
-        if self.local_engine is None:
+            # Add the extra fields relevant to this turn (all of them while the profile is small)
+            if self.profile is not self._indexed_profile:
+                self.profile_index.build(self.profile)
+                self._indexed_profile = self.profile
+            facts = self.profile_index.facts
+            if len(facts) > self.config.profile_top_k:
+                facts = self.profile_index.search(self._profile_query, k=self.config.profile_top_k)
+            extras = [self.profile_index.format_fact(k, v) for k, v in facts]
+            profile_text += "".join(extras)
+            self._profile_extra_tokens = sum(approx_tokens(line) for line in extras)
+
+            # 2. Hand it to the payload builder. The base personality is cached there
+            # and never rebuilt, so only this block changes when a fact is learned.
+            self.payload_builder.set_profile_text(profile_text)
+
+            # 3. Combined view (kept for logs / diagnostics)
+            self.system_prompt = self.payload_builder.system_prompt
+
+    def _select_profile(self, user_input):
+        """Per-turn profile block: core fields + the facts that match what the user said."""
+        with self._profile_lock:
+            self._profile_query = user_input
+            self._update_system_prompt()
+            self.profile_stats["turns"] += 1
+            self.profile_stats["tokens_full"] += self.profile_index.full_tokens
+            self.profile_stats["tokens_injected"] += self._profile_extra_tokens
+
+    def _generate_light(self, prompt):
+        """Cheap internal calls (fact extraction) go to the provider's lightest model."""
+        provider = self.active_provider
+        return self._generate_text(prompt, is_chat=False, provider=provider, model_name=self.router.light_model(provider))
+
+    def _summarize_turns(self, previous_summary, messages):
+        """Background compaction: folds old turns into the rolling summary (light model)."""
+        return self._generate_light(self.subconscious.get_summary_prompt(previous_summary, messages))
+
+    def _apply_facts(self, new_facts):
+        """Called from the subconscious thread. Merges facts and swaps in the new prompt."""
+        with self._profile_lock:
+            self.memory.update_profile(new_facts)
+            self.profile = self.memory.load_profile()  # RAM copy, no disk read
+            self._profile_version = self.memory.profile_version
+            # _update_system_prompt builds the full string before assigning it,
+            # so the conscious side never sees a half-built prompt.
+            self._update_system_prompt()
+
+    def _sync_profile(self):
+        """Picks up hand edits to profile.json (a throttled stat, not a read)."""
+        self.memory.check_external_edit()
+        if self.memory.profile_version != self._profile_version:
+            with self._profile_lock:
+                self.profile = self.memory.load_profile()
+                self._profile_version = self.memory.profile_version
+                self._update_system_prompt()
+
+    def _observe_extraction(self, batch, facts):
+        """Single-turn extractions are clean labels for the fact gate."""
+        if len(batch) == 1:
+            self.fact_gate.log(batch[0], facts)
+
+    def flush_subconscious(self, timeout=None):
+        """Waits for pending fact extraction to land (tests / shutdown)."""
+        return self.subconscious_worker.flush(timeout)
+
+    def spawn_session(self, memory):
+        """
+        Lightweight Brain for one server session.
+        Shares clients, health monitor, breakers and hedger with this Brain,
+        but owns its memory, history, profile, prompt caches and subconscious.
+        """
+        session = copy.copy(self)
+        session.memory = memory
+        session.profile = memory.load_profile()
+        session._profile_version = memory.profile_version
+        session.history = memory.load_history()
+        session.payload_builder = PayloadBuilder("default")
+        session.profile_index = ProfileIndex()
+        session._indexed_profile = None
+        session._profile_query = ""
+        session.profile_stats = {"turns": 0, "tokens_full": 0, "tokens_injected": 0}
+        session.context = ContextWindow(summarize_fn=session._summarize_turns, summary=memory.load_summary())
+        session._profile_lock = threading.Lock()
+        session._update_system_prompt()
+        session.subconscious_worker = SubconsciousWorker(
+            session.subconscious,
+            generate_fn=session._generate_light,
+            apply_fn=session._apply_facts,
+            observe_fn=session._observe_extraction,
+        )
+        return session
+
+    def warm_up(self):
+        """
+        Builds one throwaway payload per configured cloud provider.
+        The SDK types are lazy imports (~0.8s for google.genai.types); paying
+        that here keeps it off the first turn of every session that starts cold.
+        """
+        builder = PayloadBuilder("default")
+        for provider, client in (("gemini", self.gemini_client), ("groq", self.groq_client)):
+            if client:
+                builder.build(provider, [], "")
+
+    def close_session(self):
+        """Flushes this conversation's background work (keeps shared resources running)."""
+        self.subconscious_worker.stop()
+        if self.context.drain(timeout=5.0):
+            self._fit_context(self.active_model_name)  # Lands + persists the last compaction
+        self.memory.flush()  # Profile write-behind: nothing learned is left in RAM only
+
+    def shutdown(self):
+        """Drains the subconscious so no learned facts are lost on exit."""
+        self.health.stop()
+        self.close_session()
+        if self.local_engine:
+            self.local_engine.stop()
+        stats = self.subconscious_worker.snapshot()
+        print(f">> Brain: Subconscious saved {stats['calls_saved']} extraction calls by batching.")
+        if self.config.fact_gate_enabled:
+            print(f">> Brain: Fact gate skipped {self.fact_gate.stats['skipped']} extraction calls "
+                  f"(passed {self.fact_gate.stats['passed']}, explored {self.fact_gate.stats['explored']}).")
+        if self.config.hedging_enabled:
+            for provider, counters in self.hedger.snapshot().items():
+                print(f">> Brain: Hedge [{provider}] {counters}")
+        print(f">> Brain: Model rotations inside a provider: {self.router.rotations}")
+        if self.config.fused_turns:
+            print(f">> Brain: Fused turns {self.fused.stats['fused']} / two-call fallbacks {self.fused.stats['fallbacks']}.")
+        prompt_stats = self.payload_builder.snapshot()
+        print(f">> Brain: Prompt prefix bytes reused {prompt_stats['prefix_bytes_reused']} / rebuilt {prompt_stats['prefix_bytes_rebuilt']}.")
+        saved = self.profile_stats["tokens_full"] - self.profile_stats["tokens_injected"]
+        print(f">> Brain: Profile index saved ~{saved} prompt tokens over {self.profile_stats['turns']} turns.")
+
+    def _ensure_local_engine(self):
+        if self.local_engine is None and self.config.local_enabled:
             try:
-                self.local_engine = LocalEngine(preferred_model=self.config.local_model_name)
+                self.local_engine = LocalEngine(
+                    preferred_model=self.config.local_model_name,
+                    keep_alive=self.config.local_keep_alive,
+                    host=self.config.ollama_host,
+                    timeout=self.config.local_timeout,
+                    repin_interval=self.config.local_repin_interval,
+                )
             except Exception as e:
                 print(f"!! CRITICAL: Local Engine failed ({e})")
-                self.active_provider = "none"
-                return
+        return self.local_engine is not None
+
+    def _engage_local_mode(self):
+        if not self._ensure_local_engine():
+            print(" Switching to Local Core.")
+            self.active_provider = "none"
+            return
+
+        print(f" Switching to Local Core ({self.local_engine.status}).")
 
         self.active_provider = "local"
         self.active_model_name = self.local_engine.model_name
 
+    def _register_probes(self):
+        if self.gemini_client:
+            model = self.config.gemini_models[0]
+            self.health.register("gemini", model, lambda: self.gemini_client.models.get(model=f"models/{model}"))
+        if self.groq_client:
+            self.health.register("groq", self.config.groq_models[0], lambda: self.groq_client.models.list())
+        if self.config.local_enabled:
+            self.health.register("local", self.config.local_model_name, self._probe_local)
+
+    def _probe_local(self):
+        if not self._ensure_local_engine():
+            raise RuntimeError("Local Engine unavailable")
+        self.local_engine.probe()
+
+    def _primary_model(self, provider):
+        """Preferred model of a provider whose circuit breaker is not open."""
+        return self.router.primary(provider) or self.config.local_model_name
+
     def _refresh_connection_status(self):
         # This function prints, so we only call it when necessary
         print(">> Brain: Checking connectivity matrix...", end="", flush=True)
 
-        # A. Try Gemini
-        if self.gemini_client:
-            try:
-                self.gemini_client.models.get(model=f"models/{self.config.gemini_models[0]}")
-                self.active_provider = "gemini"
-                self.active_model_name = self.config.gemini_models[0]
-                print(" Connected (Gemini).")
-                return
-            except Exception:
-                pass
+        # Wait for the first probe to land (not the slowest one)
+        self.health.wait_for_first(self.config.boot_probe_timeout)
 
-        # B. Try Groq
-        if self.groq_client:
-            try:
-                self.groq_client.models.list()
-                self.active_provider = "groq"
-                self.active_model_name = self.config.groq_models[0]
-                print(" Connected (Groq).")
-                return
-            except Exception:
-                pass
+        if self._apply_routing(announce=" Connected"):
+            return
 
-        # C. Fallback to Local
+        # Fallback to Local
         print(" Offline.", end="")
         self._engage_local_mode()
 
+    def _apply_routing(self, announce="\n>> Brain: Rerouted"):
+        """
+        Non-blocking: reads the health monitor and moves to the best provider.
+        Returns False if the monitor has no healthy provider yet.
+        """
+        best = self.health.best_provider()
+        if best is None:
+            return False
+        if best == self.active_provider:
+            return True
+
+        if best == "local":
+            self._engage_local_mode()
+        else:
+            self.active_provider = best
+            self.active_model_name = self._primary_model(best)
+            print(f"{announce} ({best.capitalize()}).")
+        return True
+
     def _switch_provider(self):
         """Silent Failover: Gemini -> Groq -> Local"""
         # We print a warning, but we DO NOT re-run the full connection check
@@ -124,7 +364,7 @@ class Brain:
         if self.active_provider == "gemini":
             if self.groq_client:
                 self.active_provider = "groq"
-                self.active_model_name = self.config.groq_models[0]
+                self.active_model_name = self._primary_model("groq")
                 print(" Switched to Groq.")
             else:
                 self._engage_local_mode()
@@ -136,35 +376,123 @@ class Brain:
             print(" All brains exhausted.")
             self.active_provider = "none"
 
-    def _generate_text(self, payload, is_chat=True):
+    def _generate_text(self, payload, is_chat=True, provider=None, model_name=None):
+        # Snapshot the route: the subconscious thread calls this too,
+        # and the conscious side may switch providers mid-call.
+        # Hedged calls pass an explicit provider/model instead.
+        if provider is None:
+            provider = self.active_provider
+            model_name = self.active_model_name
+
+        return self._with_model_rotation(
+            provider, model_name,
+            lambda model: self._call_provider(provider, model, payload, is_chat),
+        )
+
+    def _with_model_rotation(self, provider, model_name, call):
+        """Runs call(model) under the shared _model_rotation policy. Returns the result or None."""
+        if provider == "none":
+            return None
+
+        rotation = self._model_rotation(provider, model_name)
         try:
-            if self.active_provider == "gemini":
-                if is_chat:
-                    return self.gemini_client.models.generate_content(model=self.active_model_name, contents=payload).text
-                else:
-                    return self.gemini_client.models.generate_content(model=self.active_model_name, contents=payload).text
-
-            elif self.active_provider == "groq":
-                if not is_chat:
-                    payload = [{"role": "user", "content": payload}]
-                chat = self.groq_client.chat.completions.create(messages=payload, model=self.active_model_name)
-                return chat.choices[0].message.content
-
-            elif self.active_provider == "local":
-                if not is_chat:
-                    payload = [{"role": "user", "content": payload}]
-                return self.local_engine.think(payload)
-
-        except Exception:
-            return None # Return None to trigger failover
-
-    def think(self, user_input, emotion_override=None):
-        # 1. SMART RECONNECT (Cloud check logic)
-        if self.active_provider == "local":
-            if (time.time() - self.last_cloud_check > 1800):
-                print(">> Brain: Scheduled network check...")
-                self._refresh_connection_status()
-                self.last_cloud_check = time.time()
+            model = next(rotation)
+            while True:
+                started = time.perf_counter()
+                try:
+                    result, error = call(model), None
+                except Exception as e:
+                    result, error = None, e
+                model = rotation.send((time.perf_counter() - started, result, error))
+        except StopIteration as done:
+            return done.value
+
+    def _model_rotation(self, provider, model_name):
+        """
+        Model rotation + circuit breakers, shared by the sync and async call paths.
+        A generator: yields the next model to try, gets (seconds, result, error) sent
+        back, and returns the final result (StopIteration.value), or None to fail over.
+        Rate-limit / overload errors rotate to the next model of the SAME provider;
+        anything else (or running out of models) returns None so the caller fails over.
+        """
+        for model in self.router.candidates(provider, first=model_name):
+            breaker = self.router.breaker(provider, model)
+            if not breaker.allow():
+                continue
+
+            seconds, result, error = yield model
+            # Real traffic feeds the health window (its latency is kept apart from the probes')
+            self.health.record(provider, model, seconds, error is None and result is not None)
+            if error is not None:
+                # asyncio.TimeoutError counts as a plain failure: fail over
+                capacity = self.router.is_capacity_error(error)
+                breaker.record_failure(capacity=capacity)
+                if not capacity:
+                    return None # Return None to trigger failover
+                self.router.rotations += 1
+                continue
+
+            if result is None:
+                breaker.record_failure()
+                return None
+
+            breaker.record_success()
+            if provider == self.active_provider and model != self.active_model_name and model_name == self.active_model_name:
+                print(f"\n>> Brain: {model_name} busy, rotated to {model}.")
+                self.active_model_name = model
+            return result
+
+        return None
+
+    def _call_provider(self, provider, model_name, payload, is_chat):
+        """One raw provider call. Raises on error (classified by _with_model_rotation)."""
+        telemetry = Telemetry.get()
+        if not telemetry.enabled:
+            return self._raw_call(provider, model_name, payload, is_chat)
+
+        kind = "chat" if is_chat else "internal"
+        with telemetry.span("brain.generate", provider=provider, model=model_name, kind=kind,
+                            prompt_chars=self._payload_chars(payload)) as span:
+            text = self._raw_call(provider, model_name, payload, is_chat)
+            span.set(response_chars=len(text or ""))
+            return text
+
+    @staticmethod
+    def _payload_chars(payload):
+        if isinstance(payload, str):
+            return len(payload)
+        total = 0
+        for msg in payload:
+            if isinstance(msg, dict):
+                total += len(msg.get("content", ""))
+            else:
+                total += sum(len(part.text or "") for part in msg.parts)
+        return total
+
+    def _raw_call(self, provider, model_name, payload, is_chat):
+        if provider == "gemini":
+            return self.gemini_client.models.generate_content(model=model_name, contents=payload).text
+
+        elif provider == "groq":
+            if not is_chat:
+                payload = [{"role": "user", "content": payload}]
+            chat = self.groq_client.chat.completions.create(messages=payload, model=model_name)
+            return chat.choices[0].message.content
+
+        elif provider == "local":
+            if not is_chat:
+                payload = [{"role": "user", "content": payload}]
+            return self.local_engine.think(payload)
+
+        return None
+
+    def _prepare_turn(self, user_input, emotion_override=None, fused=False):
+        """Shared front half of think/think_stream. Returns the final user prompt."""
+        # 1. SMART RECONNECT (Instant: the health monitor already did the probing)
+        self._apply_routing()
+        self._sync_profile()
+        self._select_profile(user_input)
+        self._turn_recall = self._recall_episodes(user_input)
 
         # 2. LOAD DEFENSE PROTOCOLS (From Config)
         config = ConfigManager.load_config()
@@ -178,45 +506,322 @@ class Brain:
         final_prompt = user_input + system_directive
 
         # --- SUBCONSCIOUS (Facts) ---
-        if self.active_provider != "none":
-            # ... (Subconscious logic remains the same) ...
-            try:
-                analysis_prompt = self.subconscious.get_analysis_prompt(user_input)
-                raw_analysis = self._generate_text(analysis_prompt, is_chat=False)
-                if raw_analysis:
-                    new_facts = self.subconscious.parse_result(raw_analysis)
-                    if new_facts:
-                        self.memory.update_profile(new_facts)
-                        self.profile = self.memory.load_profile()
-                        self._update_system_prompt()
-            except Exception:
-                pass
+        # Queued for the background worker; facts land in the prompt on a later turn.
+        # Fused turns extract facts in the reply itself (the worker is the fallback).
+        if fused:
+            return self.fused.wrap(final_prompt)
+        if self.active_provider != "none" and (not self.config.fact_gate_enabled or self.fact_gate.should_extract(user_input)):
+            self.subconscious_worker.submit(user_input)
+
+        return final_prompt
+
+    # --- FUSED TURNS (Reply + action + facts in one call) ---
+    def _use_fused(self):
+        return (self.config.fused_turns and not self.config.hedging_enabled
+                and self.fused.supports(self.active_model_name))
+
+    def _unfuse(self, user_input, response_text):
+        """Splits a fused response. Off-schema replies fall back to the two-call path."""
+        parsed = self.fused.parse(response_text)
+        self.fused.record(self.active_model_name, parsed is not None)
+        if parsed is None:
+            self.subconscious_worker.submit(user_input)
+            return self.fused.salvage(response_text)
+
+        reply, facts = parsed
+        if facts:
+            self._apply_facts(facts)
+        return reply
+
+    def _unfuse_stream(self, user_input, deltas):
+        """Streaming _unfuse: yields the reply text as it arrives, then applies the facts."""
+        decoder = FusedReplyStream()
+        try:
+            for delta in deltas:
+                text = decoder.feed(delta)
+                if text:
+                    yield text
+        finally:
+            # Also on a mid-reply drop (the parse fails and the worker takes over)
+            parsed = self.fused.parse(decoder.raw)
+            self.fused.record(self.active_model_name, parsed is not None)
+            if parsed is None:
+                self.subconscious_worker.submit(user_input)
+            elif parsed[1]:
+                self._apply_facts(parsed[1])
+
+        if parsed is None:
+            if not decoder.started:
+                yield self.fused.salvage(decoder.raw)  # Off-schema: nothing was spoken yet
+        elif parsed[0].startswith("[ACTION:") and not decoder.action_sent:
+            yield " " + parsed[0][:parsed[0].index("]") + 1]  # Action came after the reply
+
+    def _build_payload(self, final_prompt):
+        # Cached prefix + cached history + (profile, prompt). Only the delta is new work.
+        return self._payload_for(self.active_provider, self.active_model_name, final_prompt)
+
+    def _payload_for(self, provider, model_name, final_prompt):
+        summary, window = self._fit_context(model_name)
+        return self.payload_builder.build(provider, window, final_prompt, summary, recall=self._turn_recall)
+
+    def _recall_episodes(self, user_input):
+        """Relevant exchanges from long-term memory (older than the live history)."""
+        if not self.config.episodic_enabled:
+            return ""
+
+        with Telemetry.get().span("memory.recall") as span:
+            hits = self.memory.recall(
+                user_input,
+                k=self.config.episodic_top_k,
+                exclude_recent=len(self.history) // 2,  # Those exchanges are already in the prompt
+                min_score=self.config.episodic_min_score,
+            )
+            span.set(hits=len(hits))
+
+        if not hits:
+            return ""
+        lines = ["[RELEVANT PAST EXCHANGES]"]
+        for _, user, ai in hits:
+            lines.append(f"User: {user}\nENJO: {ai}")
+        return "\n".join(lines)
+
+    def _fit_context(self, model_name):
+        """Token-budgeted slice of history for this model (older turns live in the summary)."""
+        fixed = (self.context.count(self.payload_builder.system_prompt) + self.context.count(self._turn_recall)
+                 + self.config.reply_reserve_tokens)
+        budget = max(256, self.config.context_budget(model_name) - fixed)
+
+        before = len(self.history)
+        summary, window = self.context.fit(self.history, budget)
+        if len(self.history) != before:
+            # A background compaction landed: persist the shorter history + new summary
+            self.memory.save_summary(summary)
+            self.memory.save_history(self.history)
+        return summary, window
+
+    def think(self, user_input, emotion_override=None):
+        with Telemetry.get().span("brain.think", input_chars=len(user_input)) as span:
+            reply = self._think(user_input, emotion_override)
+            span.set(provider=self.active_provider, model=self.active_model_name)
+            return reply
+
+    def _think(self, user_input, emotion_override=None):
+        fused = self._use_fused()
+        final_prompt = self._prepare_turn(user_input, emotion_override, fused=fused)
 
         # --- CONSCIOUS (Generation) ---
-        # ... (Failover loop remains the same) ...
-        # Just ensure you are using 'final_prompt' in the payload construction!
+        if self.config.hedging_enabled:
+            return self._think_hedged(user_input, final_prompt)
 
-        # (Copy the existing failover loop here, ensuring 'final_prompt' is used)
         attempts = 0
         while attempts < 3:
             if self.active_provider == "none":
                 return ">> System Error: No AI models available."
 
-            if self.active_provider == "gemini":
-                payload = [types.Content(role="user", parts=[types.Part.from_text(text=self.system_prompt)])]
-                for msg in self.history:
-                    payload.append(types.Content(role=msg["role"], parts=[types.Part.from_text(text=msg["text"])]))
-                payload.append(types.Content(role="user", parts=[types.Part.from_text(text=final_prompt)]))
+            payload = self._build_payload(final_prompt)
+            response_text = self._generate_text(payload, is_chat=True)
+
+            if response_text:
+                if fused:
+                    response_text = self._unfuse(user_input, response_text)
+                self._update_memory(user_input, response_text)
+                return f"\n[{self.active_provider}]: {response_text}"
             else:
-                payload = [{"role": "system", "content": self.system_prompt}]
-                for msg in self.history:
-                    role = "assistant" if msg["role"] == "model" else "user"
-                    payload.append({"role": role, "content": msg["text"]})
-                payload.append({"role": "user", "content": final_prompt})
+                self._switch_provider()
+                attempts += 1
 
-            response_text = self._generate_text(payload, is_chat=True)
+        return ">> Error: Network Unstable."
+
+    # --- HEDGING (Opt-in tail-latency insurance) ---
+    def _failover_chain(self):
+        """Providers in _switch_provider order, starting from the active one."""
+        chain = []
+        if self.gemini_client:
+            chain.append("gemini")
+        if self.groq_client:
+            chain.append("groq")
+        # Local answers errors as text, so only race it when it is known to be up
+        if self.health.stats("local")["healthy"] and self._ensure_local_engine():
+            chain.append("local")
+
+        if self.active_provider in chain:
+            chain = chain[chain.index(self.active_provider):]
+        return chain
+
+    def _hedge_plan(self, final_prompt, make_call):
+        """Builds (provider, fn) attempts up front (PayloadBuilder is not thread-safe) plus the hedge delay."""
+        chain = self._failover_chain()
+        attempts = []
+        for provider in chain:
+            model_name = self._primary_model(provider)
+            payload = self._payload_for(provider, model_name, final_prompt)
+            attempts.append((provider, make_call(provider, model_name, payload)))
+
+        delay = None
+        if chain:
+            delay = self.hedger.hedge_delay(self.health.latencies(chain[0], self._primary_model(chain[0])))
+        return attempts, delay
+
+    def _think_hedged(self, user_input, final_prompt):
+        def make_call(provider, model_name, payload):
+            return lambda: self._generate_text(payload, is_chat=True, provider=provider, model_name=model_name)
+
+        attempts, delay = self._hedge_plan(final_prompt, make_call)
+        if not attempts:
+            return ">> System Error: No AI models available."
+
+        provider, response_text = self.hedger.run(attempts, delay)
+        if not response_text:
+            return ">> Error: Network Unstable."
+
+        # Only the winner is remembered
+        self._update_memory(user_input, response_text)
+        return f"\n[{provider}]: {response_text}"
+
+    # --- STREAMING (Low time-to-first-audio) ---
+    def _stream_text(self, payload, provider=None, model_name=None):
+        """Yields raw text deltas from the active provider. Raises on failure."""
+        if provider is None:
+            provider = self.active_provider
+            model_name = self.active_model_name
+
+        if provider == "gemini":
+            for chunk in self.gemini_client.models.generate_content_stream(model=model_name, contents=payload):
+                if chunk.text:
+                    yield chunk.text
+
+        elif provider == "groq":
+            stream = self.groq_client.chat.completions.create(messages=payload, model=model_name, stream=True)
+            for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    yield delta
+
+        elif provider == "local":
+            yield from self.local_engine.think_stream(payload)
+
+    def _open_stream(self, payload, provider, model_name):
+        """Starts a stream and waits for its first delta. Returns (first, stream) or None."""
+        def start(model):
+            stream = self._stream_text(payload, provider, model)
+            with Telemetry.get().span("brain.first_token", provider=provider, model=model):
+                try:
+                    return next(stream), stream
+                except StopIteration:
+                    # Empty reply: not a capacity problem, fail over
+                    return None
+
+        return self._with_model_rotation(provider, model_name, start)
+
+    def think_stream(self, user_input, emotion_override=None):
+        """
+        Streaming twin of think(). Yields events as soon as they are ready:
+          {"type": "action", "command": ..., "target": ...}
+          {"type": "sentence", "text": ...}
+          {"type": "error", "text": ...}
+        Timings for the turn end up in self.last_stream_stats.
+        """
+        started = time.perf_counter()
+        self.last_stream_stats = {"provider": None, "first_token_s": None, "first_sentence_s": None, "total_s": None}
+        fused = self._use_fused()
+        final_prompt = self._prepare_turn(user_input, emotion_override, fused=fused)
+
+        if self.config.hedging_enabled:
+            # Race the providers on time-to-first-token; losers' streams are closed
+            def make_call(provider, model_name, payload):
+                return lambda: self._open_stream(payload, provider, model_name)
+
+            attempts, delay = self._hedge_plan(final_prompt, make_call)
+            provider, opened = self.hedger.run(attempts, delay, discard_fn=lambda result: result[1].close()) if attempts else (None, None)
+            if not opened:
+                yield {"type": "error", "text": ">> Error: Network Unstable."}
+                return
+
+            first, stream = opened
+            reply = yield from self._emit_stream(itertools.chain([first], stream), started)
+            self._finish_stream(user_input, reply, provider, started)
+            return
+
+        attempts = 0
+        while attempts < 3:
+            if self.active_provider == "none":
+                yield {"type": "error", "text": ">> System Error: No AI models available."}
+                return
+
+            opened = self._open_stream(self._build_payload(final_prompt), self.active_provider, self.active_model_name)
+            if not opened:
+                # Nothing reached the user yet: fail over silently and retry
+                self._switch_provider()
+                attempts += 1
+                continue
+
+            first, stream = opened
+            deltas = itertools.chain([first], stream)
+            if fused:
+                deltas = self._unfuse_stream(user_input, deltas)
+            reply = yield from self._emit_stream(deltas, started)
+            self._finish_stream(user_input, reply, self.active_provider, started)
+            return
+
+        yield {"type": "error", "text": ">> Error: Network Unstable."}
+
+    def _emit_stream(self, deltas, started):
+        """Turns raw deltas into action/sentence events. Returns the full reply text."""
+        detector = ActionTagDetector()
+        chunker = SentenceChunker()
+        pieces = []
+
+        try:
+            for delta in deltas:
+                if not pieces:
+                    self.last_stream_stats["first_token_s"] = time.perf_counter() - started
+                pieces.append(delta)
+
+                clean, actions = detector.feed(delta)
+                for cmd, target in actions:
+                    yield {"type": "action", "command": cmd, "target": target}
+                for sentence in chunker.feed(clean):
+                    yield self._sentence_event(sentence, started)
+        except Exception:
+            # Mid-reply drop: keep what was already said
+            pass
+
+        for sentence in chunker.feed(detector.flush()):
+            yield self._sentence_event(sentence, started)
+        tail = chunker.flush()
+        if tail:
+            yield self._sentence_event(tail, started)
+
+        return "".join(pieces)
+
+    def _finish_stream(self, user_input, reply, provider, started):
+        self.last_stream_stats["provider"] = provider
+        self.last_stream_stats["total_s"] = time.perf_counter() - started
+        Telemetry.get().record("brain.stream", self.last_stream_stats["total_s"], provider=provider,
+                               model=self.active_model_name, response_chars=len(reply))
+        self._update_memory(user_input, reply)
+
+    def _sentence_event(self, sentence, started):
+        if self.last_stream_stats["first_sentence_s"] is None:
+            self.last_stream_stats["first_sentence_s"] = time.perf_counter() - started
+        return {"type": "sentence", "text": sentence}
+
+    # --- ASYNC (Same failover semantics as think, on an event loop) ---
+    async def athink(self, user_input, emotion_override=None):
+        fused = self._use_fused()
+        final_prompt = self._prepare_turn(user_input, emotion_override, fused=fused)
+
+        attempts = 0
+        while attempts < 3:
+            if self.active_provider == "none":
+                return ">> System Error: No AI models available."
+
+            payload = self._build_payload(final_prompt)
+            response_text = await self._agenerate_text(payload, is_chat=True)
 
             if response_text:
+                if fused:
+                    response_text = self._unfuse(user_input, response_text)
                 self._update_memory(user_input, response_text)
                 return f"\n[{self.active_provider}]: {response_text}"
             else:
@@ -225,7 +830,48 @@ class Brain:
 
         return ">> Error: Network Unstable."
 
+    async def _agenerate_text(self, payload, is_chat=True, provider=None, model_name=None):
+        """Async twin of _generate_text: pooled clients, per-call timeouts, same _model_rotation policy."""
+        if provider is None:
+            provider = self.active_provider
+            model_name = self.active_model_name
+        if provider == "none":
+            return None
+
+        try:
+            client = self.async_providers.get(provider)
+        except Exception as e:
+            # A client that cannot even be built (bad key, missing SDK) fails over like a failed call
+            print(f"\n>> Brain: async {provider} client unavailable ({e})")
+            self.health.record(provider, model_name, 0.0, False)
+            return None
+        if client is None:
+            return None
+
+        rotation = self._model_rotation(provider, model_name)
+        try:
+            model = next(rotation)
+            while True:
+                started = time.perf_counter()
+                try:
+                    result, error = await client.generate(payload, model, is_chat), None
+                except Exception as e:
+                    result, error = None, e
+                model = rotation.send((time.perf_counter() - started, result, error))
+        except StopIteration as done:
+            return done.value
+
+    async def aclose(self):
+        """Closes the pooled async clients (call from the loop that used them)."""
+        await self.async_providers.aclose()
+
+    def remember_turn(self, user, ai):
+        """Records a turn that was answered outside the Brain (e.g. a reflex)."""
+        self._update_memory(user, ai)
+
     def _update_memory(self, user, ai):
         self.history.append({"role": "user", "text": user})
         self.history.append({"role": "model", "text": ai})
-        self.memory.save_history(self.history)
\ No newline at end of file
+        self.memory.save_history(self.history)
+        if self.config.episodic_enabled:
+            self.memory.remember_episode(user, ai)
\ No newline at end of file
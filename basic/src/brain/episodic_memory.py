@@ -0,0 +1,267 @@
+# src/brain/episodic_memory.py
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+
+import numpy as np
+
+_TOKEN = re.compile(r"[a-z0-9']+")
+_STOPWORDS = frozenset(
+    "a an the i im i'm me my you your is are was were be been to of and or in on at it its "
+    "that this for with do does did so just can will would what how".split()
+)
+
+
+class HashingEmbedder:
+    """
+    Offline default embedder: signed feature hashing of words and word
+    bigrams, log-scaled counts, L2-normalized. No model download, no network.
+
+    Anything with `name`, `dim` and `embed(texts) -> float32 array (n, dim)`
+    can be plugged into EpisodicMemory instead.
+    """
+
+    def __init__(self, dim=128):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    def embed(self, texts):
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            words = [w for w in _TOKEN.findall(text.lower()) if w not in _STOPWORDS]
+            for feature, weight in self._features(words):
+                h = zlib.crc32(feature.encode("utf-8"))
+                matrix[row, h % self.dim] += weight if h & 0x80000000 else -weight
+
+        # Damp repeated words, then unit length (so dot product == cosine)
+        np.copysign(np.log1p(np.abs(matrix)), matrix, out=matrix)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
+
+    @staticmethod
+    def _features(words):
+        for word in words:
+            yield word, 1.0
+        for a, b in zip(words, words[1:]):
+            yield f"{a} {b}", 0.5
+
+
+class EpisodicMemory:
+    """
+    Long-term memory of every exchange (user + ENJO reply).
+
+    Storage (inside the memory's data_dir):
+        episodes.f32  contiguous float32 matrix (n, dim), memory-mapped
+        episodes.db   SQLite (WAL): the texts; row i <-> matrix row i
+
+    search() is a vectorized cosine top-k. Small stores are scanned exactly.
+    Above `exact_below` rows, `lsh_tables` independent random-hyperplane
+    tables each contribute the query's bucket and its 1-bit neighbours; the
+    union (plus any rows not indexed yet) is re-ranked exactly. One table
+    alone misses most true neighbours, several together find ~90%+ of them
+    while scanning a few percent of the matrix (see bench_episodic).
+    """
+
+    GROW_ROWS = 4096        # Minimum rows added when the matrix file grows
+    SYNC_EVERY = 256        # Matrix flushes (msync) at most every N episodes
+
+    def __init__(self, data_dir, embedder=None, lsh_bits=12, lsh_tables=10, exact_below=50_000):
+        self.embedder = embedder or HashingEmbedder()
+        self.dim = self.embedder.dim
+        self.matrix_path = os.path.join(data_dir, "episodes.f32")
+        self.exact_below = exact_below
+        self._lock = threading.Lock()
+
+        # 1. TEXT STORE
+        self._db = sqlite3.connect(os.path.join(data_dir, "episodes.db"), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS episodes (id INTEGER PRIMARY KEY, user TEXT, ai TEXT, ts REAL);
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+        """)
+        self.count = self._db.execute("SELECT COUNT(*) FROM episodes").fetchone()[0]
+
+        # 2. VECTOR MATRIX
+        self.lsh_bits = lsh_bits
+        self.lsh_tables = lsh_tables
+        self.capacity = 0
+        self._matrix = None
+        self._codes = np.zeros((0, lsh_tables), dtype=np.uint16)  # LSH bucket of every row, per table
+        self._ensure_capacity(max(self.count, self.GROW_ROWS))
+
+        # 3. LSH INDEX (fixed seed: bucket codes are reproducible across runs)
+        planes = np.random.default_rng(0).standard_normal((self.dim, lsh_tables * lsh_bits)).astype(np.float32)
+        self._planes = planes
+        self._weights = (1 << np.arange(lsh_bits)).astype(np.int64)
+        self._order = None       # Per table: row ids sorted by bucket code
+        self._starts = None      # Per table: _order[t][_starts[t][c]:_starts[t][c + 1]] = rows in bucket c
+        self._indexed = 0        # Rows covered by _order; newer rows are scanned exactly
+
+        # 4. RECOVERY: re-embed rows whose vectors never reached the disk (crash / new embedder)
+        if self._get_meta("embedder") != self.embedder.name:
+            synced = 0
+        else:
+            synced = int(self._get_meta("synced") or 0)
+        if synced < self.count:
+            print(f">> Memory: Re-embedding {self.count - synced} episodes...")
+            self._reembed(synced)
+        self._set_meta("embedder", self.embedder.name)
+        self._unsynced = 0
+
+        for start in range(0, self.count, 100_000):
+            stop = min(self.count, start + 100_000)
+            self._codes[start:stop] = self._bucket_codes(self._matrix[start:stop])
+
+    # --- WRITE ---
+    def add(self, user, ai):
+        self.add_many([(user, ai)])
+
+    def add_many(self, pairs, vectors=None):
+        """Appends exchanges. `vectors` (n, dim) skips embedding (bulk imports, benchmarks)."""
+        if not pairs:
+            return
+        if vectors is None:
+            vectors = self.embedder.embed([f"{user}\n{ai}" for user, ai in pairs])
+
+        with self._lock:
+            start = self.count
+            stop = start + len(pairs)
+            self._ensure_capacity(stop)
+            self._matrix[start:stop] = vectors
+            self._codes[start:stop] = self._bucket_codes(vectors)
+
+            now = time.time()
+            self._db.execute("BEGIN")
+            self._db.executemany(
+                "INSERT INTO episodes (id, user, ai, ts) VALUES (?, ?, ?, ?)",
+                [(start + i, user, ai, now) for i, (user, ai) in enumerate(pairs)],
+            )
+            self._db.execute("COMMIT")
+            self.count = stop
+
+            self._unsynced += len(pairs)
+            if self._unsynced >= self.SYNC_EVERY:
+                self._sync()
+
+    # --- READ ---
+    def search(self, query, k=3, before=None, min_score=0.0):
+        """
+        Top-k most similar past exchanges as [(score, user, ai)], best first.
+        `before` hides rows >= that id (e.g. turns already in the prompt).
+        """
+        q = self.embedder.embed([query])[0]
+        if not q.any():
+            return []
+
+        with self._lock:
+            n = self.count if before is None else max(0, min(before, self.count))
+            if n == 0:
+                return []
+
+            if n <= self.exact_below:
+                ids = None
+                scores = self._matrix[:n] @ q
+            else:
+                ids = self._candidates(q, n)
+                scores = self._matrix[ids] @ q
+
+            take = min(k, len(scores))
+            if take == 0:
+                return []
+            top = np.argpartition(-scores, take - 1)[:take]
+            top = top[np.argsort(-scores[top])]
+
+            hits = []
+            for i in top:
+                score = float(scores[i])
+                if score < min_score:
+                    break
+                row_id = int(i) if ids is None else int(ids[i])
+                user, ai = self._db.execute("SELECT user, ai FROM episodes WHERE id = ?", (row_id,)).fetchone()
+                hits.append((score, user, ai))
+            return hits
+
+    def close(self):
+        with self._lock:
+            self._sync()
+            self._db.close()
+            self._matrix = None
+
+    # --- INTERNALS ---
+    def _candidates(self, q, n):
+        # Index rebuilds are amortized: only once the unindexed tail is large
+        if self._order is None or n - self._indexed > max(self.exact_below, self._indexed // 10):
+            self._rebuild_index(n)
+
+        hit = np.zeros(n, dtype=bool)
+        hit[self._indexed:n] = True
+        for table, code in enumerate(self._bucket_codes(q[None, :])[0]):
+            order, starts = self._order[table], self._starts[table]
+            for c in [int(code)] + [int(code) ^ (1 << bit) for bit in range(self.lsh_bits)]:
+                hit[order[starts[c]:starts[c + 1]]] = True
+        return np.flatnonzero(hit)  # Sorted: sequential-ish reads from the memmap
+
+    def _rebuild_index(self, n):
+        self._order, self._starts = [], []
+        buckets = np.arange((1 << self.lsh_bits) + 1)
+        for table in range(self.lsh_tables):
+            codes = self._codes[:n, table]
+            order = np.argsort(codes, kind="stable").astype(np.int32)
+            self._order.append(order)
+            self._starts.append(np.searchsorted(codes[order], buckets))
+        self._indexed = n
+
+    def _bucket_codes(self, vectors):
+        """(n, lsh_tables) bucket codes."""
+        bits = (vectors @ self._planes > 0).reshape(len(vectors), self.lsh_tables, self.lsh_bits)
+        return (bits @ self._weights).astype(np.uint16)
+
+    def _ensure_capacity(self, rows):
+        if rows <= self.capacity:
+            return
+        capacity = max(rows, self.capacity * 2, self.GROW_ROWS)
+        if self._matrix is not None:
+            self._matrix.flush()
+            self._matrix = None
+
+        with open(self.matrix_path, "a+b") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() < capacity * self.dim * 4:
+                f.truncate(capacity * self.dim * 4)
+        self._matrix = np.memmap(self.matrix_path, dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+
+        codes = np.zeros((capacity, self.lsh_tables), dtype=np.uint16)
+        codes[:self.capacity] = self._codes[:self.capacity]
+        self._codes = codes
+        self.capacity = capacity
+
+    def _reembed(self, start, batch=2048):
+        cursor = self._db.execute("SELECT id, user, ai FROM episodes WHERE id >= ? ORDER BY id", (start,))
+        while True:
+            rows = cursor.fetchmany(batch)
+            if not rows:
+                break
+            vectors = self.embedder.embed([f"{user}\n{ai}" for _, user, ai in rows])
+            self._matrix[rows[0][0]:rows[-1][0] + 1] = vectors
+        self._sync()
+
+    def _sync(self):
+        """Vectors hit the disk BEFORE we claim them as synced (crash => re-embed the tail)."""
+        self._matrix.flush()
+        self._set_meta("synced", self.count)
+        self._unsynced = 0
+
+    def _get_meta(self, key):
+        row = self._db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key, value):
+        self._db.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, str(value)),
+        )
@@ -0,0 +1,173 @@
+# src/brain/fact_gate.py
+import json
+import math
+import os
+import random
+import re
+import threading
+import zlib
+
+# Hand-written cues. Weights below are the untrained defaults; train() refits them.
+PATTERNS = {
+    "i_am": r"\b(?:i am|i'm|im)\s+(?:a|an|from|allergic|vegan|vegetarian|married|single|\d+)\b",
+    "my_x_is": r"\bmy\s+\w+(?:\s+\w+)?\s+(?:is|are|was|were)\b|\bmy\s+\w+'s\b",
+    "i_verb": r"\bi\s+(?:live|work|study|own|have|had|bought|sold|moved|like|love|hate|prefer|use|play|drive|speak|got"
+              r"|started|quit|switched|invested|usually|always|never)\b",
+    "statement": r"^\s*(?:i|i'm|im|i've|ive|we|we're|our)\b[^?]*$",
+    "filler": r"^\s*i\s+(?:think|guess|see|know|mean|don't know)\b|^\s*i'm\s+(?:bored|tired|fine|good|ok|okay|done|back|here)\b",
+    "name": r"\b(?:call me|my name|name's)\b",
+    "my": r"\bmy\b",
+    "remember": r"\b(?:remember|remind me|don't forget|note that|for the record)\b",
+    # Facts without an "I"/"my" in front: "Allergic to shellfish btw", "Picked up some AAPL"
+    "bare_fact": r"^\s*(?:allergic|vegan|vegetarian|married|engaged|divorced|pregnant|retired|born|raised|working|living"
+                 r"|moving|moved|started|starting|picked up|bought|sold|switched|quit|holding)\b",
+    "holdings": r"\b(?:shares|stake|portfolio|holding|invested|picked up|bought|sold)\b",
+    "money": r"[$€£¥]\s?\d|\b\d[\d,.]*\s?(?:k|grand|bucks|dollars|euros|pounds|yen|usd)\b",
+    "project": r"\b(?:project|startup|working on|building)\b",
+    "personal": r"\b(?:birthday|anniversary|allergy|wife|husband|girlfriend|boyfriend|partner|sister|brother|mom|dad"
+                r"|son|daughter|kids?)\b",
+    "command": r"^\s*(?:open|launch|start|play|pause|stop|mute|unmute|volume|set|turn|close|lock|sleep|shutdown|next|skip)\b",
+    "greeting": r"^\s*(?:hi|hello|hey|yo|thanks|thank you|ok|okay|cool|nice|bye|good (?:morning|night))\b",
+    "question": r"\?\s*$",
+}
+
+DEFAULT_WEIGHTS = {
+    "bias": -1.5,
+    "i_am": 2.5,
+    "my_x_is": 3.0,
+    "i_verb": 2.5,
+    "statement": 1.5,
+    "filler": -2.5,
+    "name": 3.0,
+    "my": 1.0,
+    "remember": 2.0,
+    "bare_fact": 2.5,
+    "holdings": 2.0,
+    "money": 1.5,
+    "project": 2.0,
+    "personal": 1.5,
+    "ticker": 1.0,
+    "command": -2.5,
+    "greeting": -2.0,
+    "question": -1.0,
+    "short": -2.0,
+}
+
+_WORD = re.compile(r"[a-z']+")
+_TICKER = re.compile(r"\b[A-Z]{2,5}\b")  # Matched on the raw text: "AAPL", "NVDA"
+_NOT_TICKERS = {"ENJO", "AI", "OK", "TV", "PC", "USA", "UK", "BTW", "LOL", "OMG"}
+
+
+class FactGate:
+    """
+    Local pre-filter in front of the Subconscious.
+
+    A logistic scorer over a few compiled regex cues plus hashed word
+    features. Turns scoring below `threshold` skip the extraction call
+    ("hello", "open spotify", "mute"). Raise the threshold to save more
+    calls, lower it to miss fewer facts.
+
+    Learns from the Brain's own logs: every single-turn extraction is logged
+    with whether it found facts, and train() refits the weights on that log.
+    """
+
+    HASH_BUCKETS = 512
+
+    def __init__(self, weights=None, threshold=0.35, explore_rate=0.05, log_path=None, log_max_bytes=1_000_000):
+        self.weights = dict(DEFAULT_WEIGHTS)
+        self.weights.update(weights or {})
+        self.threshold = threshold
+        self.explore_rate = explore_rate  # Skipped turns still sent, so the log sees false negatives
+        self.log_path = log_path
+        self.log_max_bytes = log_max_bytes  # Log holds raw user text: capped, one rotated backup (.1)
+        self.stats = {"passed": 0, "skipped": 0, "explored": 0}
+
+        self._patterns = [(name, re.compile(rx)) for name, rx in PATTERNS.items()]
+        self._rng = random.Random()
+        self._log_lock = threading.Lock()
+
+    # --- PERSISTENCE ---
+    @classmethod
+    def load(cls, model_path, **kwargs):
+        weights = None
+        try:
+            with open(model_path, 'r', encoding='utf-8') as f:
+                weights = json.load(f).get("weights")
+        except Exception:
+            pass  # No trained model yet: defaults
+        return cls(weights=weights, **kwargs)
+
+    def save(self, model_path):
+        with open(model_path, 'w', encoding='utf-8') as f:
+            json.dump({"weights": self.weights, "threshold": self.threshold}, f, indent=2)
+
+    # --- SCORING ---
+    def features(self, text):
+        lowered = text.lower().strip()
+        feats = {"bias": 1.0}
+        for name, pattern in self._patterns:
+            if pattern.search(lowered):
+                feats[name] = 1.0
+        if any(t not in _NOT_TICKERS for t in _TICKER.findall(text)):
+            feats["ticker"] = 1.0
+        words = _WORD.findall(lowered)
+        if len(words) <= 2:
+            feats["short"] = 1.0
+        for word in words:
+            feats[f"w{zlib.crc32(word.encode('utf-8')) % self.HASH_BUCKETS}"] = 1.0
+        return feats
+
+    def score(self, text):
+        z = sum(self.weights.get(name, 0.0) * value for name, value in self.features(text).items())
+        return 1.0 / (1.0 + math.exp(-max(-30.0, min(30.0, z))))
+
+    def should_extract(self, text):
+        if self.score(text) >= self.threshold:
+            self.stats["passed"] += 1
+            return True
+        if self._rng.random() < self.explore_rate:
+            self.stats["explored"] += 1
+            return True
+        self.stats["skipped"] += 1
+        return False
+
+    # --- LEARNING ---
+    def log(self, text, found_facts):
+        """Appends one labelled turn (text, did the extraction find anything)."""
+        if not self.log_path:
+            return
+        try:
+            with self._log_lock:
+                if os.path.exists(self.log_path) and os.path.getsize(self.log_path) > self.log_max_bytes:
+                    os.replace(self.log_path, self.log_path + ".1")  # Older backup is dropped
+                with open(self.log_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps({"text": text, "facts": bool(found_facts)}, ensure_ascii=False) + "\n")
+        except Exception as e:
+            print(f">> Fact Gate: Log failed ({e})")
+
+    def train(self, samples, epochs=30, lr=0.3, l2=1e-3, seed=0):
+        """Logistic regression by SGD over [(text, has_facts)]. Starts from the current weights."""
+        data = [(self.features(text), 1.0 if label else 0.0) for text, label in samples]
+        rng = random.Random(seed)
+        for _ in range(epochs):
+            rng.shuffle(data)
+            for feats, label in data:
+                z = sum(self.weights.get(name, 0.0) * value for name, value in feats.items())
+                error = 1.0 / (1.0 + math.exp(-max(-30.0, min(30.0, z)))) - label
+                for name, value in feats.items():
+                    w = self.weights.get(name, 0.0)
+                    self.weights[name] = w - lr * (error * value + l2 * w)
+
+    @staticmethod
+    def read_log(path):
+        samples = []
+        if not os.path.exists(path):
+            return samples
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    row = json.loads(line)
+                    samples.append((row["text"], bool(row.get("facts", row.get("label")))))
+                except (ValueError, KeyError):
+                    continue
+        return samples
@@ -0,0 +1,158 @@
+# src/brain/fused_turn.py
+import json
+import re
+
+# Appended to the user's message (NOT the system prompt) so the cached prefix stays byte-stable.
+FUSED_INSTRUCTION = """
+
+[RESPONSE FORMAT]
+Answer with ONE JSON object and nothing else:
+{"action": "<command | target>" or null, "reply": "<what you say out loud>", "facts": {<NEW permanent facts about the user>}}
+- "facts" uses short snake_case keys (e.g. {"location": "Tokyo"}). Use {} if there is nothing new.
+- Do not put [ACTION: ...] tags inside "reply"; use the "action" field."""
+
+_DECODER = json.JSONDecoder()
+_REPLY_FIELD = re.compile(r'"reply"\s*:\s*"((?:[^"\\]|\\.)*)"', re.DOTALL)
+_REPLY_START = re.compile(r'"reply"\s*:\s*"')
+_ACTION_FIELD = re.compile(r'"action"\s*:\s*"((?:[^"\\]|\\.)*)"', re.DOTALL)
+
+
+def extract_json(text):
+    """
+    Finds the first JSON object in a model response.
+    Survives ```json fences, chatty preambles ("Sure! {...}") and trailing text.
+    Returns a dict, or None if there is no valid object.
+    """
+    if not text:
+        return None
+
+    start = text.find("{")
+    while start != -1:
+        try:
+            data, _ = _DECODER.raw_decode(text, start)
+            if isinstance(data, dict):
+                return data
+        except ValueError:
+            pass
+        start = text.find("{", start + 1)
+    return None
+
+
+def _action_tag(action):
+    action = action.replace("[ACTION:", "").strip(" []")
+    return f"[ACTION: {action}]"
+
+
+class FusedReplyStream:
+    """
+    Pulls the "reply" string out of a fused JSON response while it streams,
+    so think_stream can speak it sentence by sentence. The action is asked
+    for BEFORE the reply, and goes out as an [ACTION: ...] tag ahead of the
+    first spoken words, like a two-call reply. The whole raw text is kept
+    for parse() once the stream ends.
+    """
+
+    def __init__(self):
+        self.raw = ""
+        self.started = False    # Inside the reply string
+        self.finished = False   # Closing quote seen
+        self.action_sent = False
+        self._pos = 0           # Next raw index of the reply string to decode
+
+    def feed(self, delta):
+        """Returns the newly decoded reply text ("" while there is none)."""
+        self.raw += delta
+        out = ""
+        if not self.started:
+            match = _REPLY_START.search(self.raw)
+            if not match:
+                return ""
+            self.started = True
+            self._pos = match.end()
+            action = _ACTION_FIELD.search(self.raw, 0, match.start())
+            if action and "|" in action.group(1):
+                self.action_sent = True
+                out = _action_tag(json.loads(f'"{action.group(1)}"')) + " "
+        if self.finished:
+            return out
+
+        i = self._pos
+        while i < len(self.raw):
+            char = self.raw[i]
+            if char == '"':
+                self.finished = True
+                break
+            if char == "\\":
+                size = 6 if self.raw[i + 1:i + 2] == "u" else 2
+                if i + size > len(self.raw):
+                    break  # Escape split across deltas: wait for the rest
+                i += size
+            else:
+                i += 1
+        try:
+            out += json.loads(f'"{self.raw[self._pos:i]}"')
+        except ValueError:
+            out += self.raw[self._pos:i]
+        self._pos = i + 1 if self.finished else i
+        return out
+
+
+class FusedTurn:
+    """
+    Single-call turns: the conscious reply, the optional action and the new
+    profile facts come back in ONE structured generation, so the Subconscious
+    extraction call is skipped. Models that can't follow the schema are
+    benched after `max_failures` misses and go back to the two-call path.
+    """
+
+    def __init__(self, max_failures=2):
+        self.max_failures = max_failures
+        self.failures = {}  # model -> consecutive schema misses
+        self.stats = {"fused": 0, "fallbacks": 0}
+
+    def supports(self, model_name):
+        return self.failures.get(model_name, 0) < self.max_failures
+
+    def wrap(self, final_prompt):
+        return final_prompt + FUSED_INSTRUCTION
+
+    def parse(self, text):
+        """Returns (spoken_text, facts) or None if the response breaks the schema."""
+        data = extract_json(text)
+        if data is None:
+            return None
+
+        reply = data.get("reply")
+        if not isinstance(reply, str) or not reply.strip():
+            return None
+
+        facts = data.get("facts") or {}
+        if not isinstance(facts, dict):
+            facts = {}
+
+        # Re-emit the action as a tag so enjo.py / the stream parser see the usual format
+        action = data.get("action")
+        if isinstance(action, str) and "|" in action:
+            reply = f"{_action_tag(action)} {reply.strip()}"
+
+        return reply.strip(), facts
+
+    def salvage(self, text):
+        """Best-effort spoken text from a response that broke the schema."""
+        match = _REPLY_FIELD.search(text)
+        if match:
+            try:
+                return json.loads(f'"{match.group(1)}"')
+            except ValueError:
+                pass
+        return text.replace("```json", "").replace("```", "").strip()
+
+    def record(self, model_name, ok):
+        if ok:
+            self.failures[model_name] = 0
+            self.stats["fused"] += 1
+        else:
+            self.failures[model_name] = self.failures.get(model_name, 0) + 1
+            self.stats["fallbacks"] += 1
+            if not self.supports(model_name):
+                print(f"\n>> Brain: {model_name} can't follow the fused format. Using two calls.")
@@ -0,0 +1,227 @@
+# src/brain/health_monitor.py
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+
+
+class HealthMonitor:
+    """
+    Background connectivity matrix.
+    Probes every provider at the same time on its own thread, keeps a rolling
+    health window per (provider, model) and answers "who should we route to?"
+    instantly, so a user turn never waits on a network check.
+
+    Probes and real traffic both feed the health (ok / failed) window, but
+    their latencies live in separate windows: a "list models" probe and a
+    full generation measure different things and are never compared.
+
+    Probes are plain callables (raise = unhealthy), which makes the monitor
+    easy to point at fake local endpoints.
+    """
+
+    # Routing tiers in priority order. Latency only reorders providers
+    # INSIDE a tier; a lower tier is used only when no higher one is healthy.
+    TIERS = [["gemini", "groq"], ["local"]]
+    PRIORITY = [provider for tier in TIERS for provider in tier]
+
+    def __init__(self, interval=30.0, fast_interval=5.0, window=20, probe_timeout=5.0,
+                 max_error_rate=0.5, latency_slack=3.0):
+        self.interval = interval            # Normal probe period
+        self.fast_interval = fast_interval  # Used while a preferred provider is down
+        self.window = window
+        self.probe_timeout = probe_timeout
+        self.max_error_rate = max_error_rate
+        self.latency_slack = latency_slack  # How much faster a same-tier provider must be to jump the queue
+
+        self.probes = {}        # provider -> (model_name, probe_fn)
+        self.samples = {}       # (provider, model) -> deque[ok]      (probes + traffic)
+        self.latency = {"probe": {}, "generation": {}}  # kind -> (provider, model) -> deque[seconds]
+        self._in_flight = {}    # provider -> Future (never stack probes on a hung endpoint)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._round_done = threading.Event()
+        self._pool = None
+        self._thread = None
+
+    # --- SETUP ---
+    def register(self, provider, model_name, probe_fn):
+        self.probes[provider] = (model_name, probe_fn)
+
+    def start(self):
+        if self._thread or not self.probes:
+            return
+        self._pool = ThreadPoolExecutor(max_workers=len(self.probes), thread_name_prefix="enjo-probe")
+        self._thread = threading.Thread(target=self._run, name="enjo-health", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._pool:
+            self._pool.shutdown(wait=False)
+
+    def reset(self):
+        """Forgets every sample (benchmarks use this between scenarios)."""
+        with self._lock:
+            self.samples.clear()
+            for windows in self.latency.values():
+                windows.clear()
+
+    def wait_for_first(self, timeout):
+        """
+        Boot helper: returns as soon as routing is decided, i.e. the
+        highest-priority provider that has answered is healthy and every
+        provider above it has failed (or the first round ends).
+        A fast local answer never wins over a cloud probe still in flight.
+        """
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if self._settled() or self._round_done.is_set():
+                break
+            time.sleep(0.02)
+        return self.best_provider() is not None
+
+    def _settled(self):
+        for provider in self.PRIORITY:
+            if provider not in self.probes:
+                continue
+            healthy = self.stats(provider)["healthy"]
+            if healthy is None:
+                return False  # Still waiting on a better provider
+            if healthy:
+                return True
+        return True  # Everybody answered and failed
+
+    # --- RECORDING ---
+    def record(self, provider, model_name, latency, ok, kind="generation"):
+        """kind: 'generation' for real traffic, 'probe' for health checks."""
+        key = (provider, model_name)
+        with self._lock:
+            if key not in self.samples:
+                self.samples[key] = deque(maxlen=self.window)
+            self.samples[key].append(ok)
+            if ok:
+                windows = self.latency[kind]
+                if key not in windows:
+                    windows[key] = deque(maxlen=self.window)
+                windows[key].append(latency)
+
+    # --- QUERIES ---
+    def stats(self, provider, model_name=None):
+        with self._lock:
+            windows = [w for (p, m), w in self.samples.items()
+                       if p == provider and (model_name is None or m == model_name) and w]
+            entries = [ok for w in windows for ok in w]
+            # Healthy right now = the latest sample of at least one model succeeded
+            last_ok = any(w[-1] for w in windows)
+
+        if not entries:
+            return {"samples": 0, "error_rate": None, "p50": None, "p95": None,
+                    "probe_p50": None, "probe_p95": None, "healthy": None}
+
+        error_rate = entries.count(False) / len(entries)
+        generation = self.latencies(provider, model_name)
+        probe = self.latencies(provider, model_name, kind="probe")
+        return {
+            "samples": len(entries),
+            "error_rate": error_rate,
+            "p50": self._percentile(generation, 0.50),
+            "p95": self._percentile(generation, 0.95),
+            "probe_p50": self._percentile(probe, 0.50),
+            "probe_p95": self._percentile(probe, 0.95),
+            "healthy": bool(last_ok) and error_rate < self.max_error_rate,
+        }
+
+    def latencies(self, provider, model_name=None, kind="generation"):
+        """Successful latencies of one kind in the window (generation ones drive hedge delays)."""
+        with self._lock:
+            return sorted(
+                lat for (p, m), window in self.latency[kind].items()
+                if p == provider and (model_name is None or m == model_name)
+                for lat in window
+            )
+
+    def best_provider(self, candidates=None):
+        """
+        Highest-priority healthy provider. Inside a tier a lower-priority
+        provider wins only if it is dramatically faster (latency_slack) on
+        the same kind of latency. Returns None if nobody is healthy.
+        """
+        candidates = candidates or self.PRIORITY
+        for tier in self.TIERS:
+            healthy = [p for p in tier if p in candidates and self.stats(p)["healthy"]]
+            if healthy:
+                return self._fastest_in_tier(healthy)
+        return None
+
+    def _fastest_in_tier(self, providers):
+        # Compare generation latencies when every provider has some, else probe latencies
+        kind = "generation" if all(self.latencies(p) for p in providers) else "probe"
+        p50s = [self._percentile(self.latencies(p, kind=kind), 0.50) for p in providers]
+
+        best, best_latency = providers[0], p50s[0]
+        for provider, latency in zip(providers[1:], p50s[1:]):
+            if best_latency and latency and latency * self.latency_slack < best_latency:
+                best, best_latency = provider, latency
+        return best
+
+    def snapshot(self):
+        return {provider: self.stats(provider) for provider in self.probes}
+
+    # --- PROBE LOOP ---
+    def _run(self):
+        while not self._stop.is_set():
+            self.probe_all()
+            self._round_done.set()
+
+            preferred = next((p for p in self.PRIORITY if p in self.probes), None)
+            degraded = preferred is not None and self.best_provider() != preferred
+            self._stop.wait(self.fast_interval if degraded else self.interval)
+
+    def probe_all(self):
+        """One concurrent round. Slow or hung endpoints count as failures."""
+        futures = {}
+        for provider, (model_name, probe_fn) in self.probes.items():
+            running = self._in_flight.get(provider)
+            if running is not None and not running.done():
+                continue
+            claim = [False]  # Whoever resolves the probe first (result or timeout) records it
+            future = self._pool.submit(self._timed_probe, provider, model_name, probe_fn, claim)
+            self._in_flight[provider] = future
+            futures[future] = (provider, model_name, claim)
+
+        if not futures:
+            return
+
+        # Results are recorded the moment each probe lands (see _timed_probe),
+        # so the fastest provider is routable before the slowest one answers.
+        _, not_done = wait(futures, timeout=self.probe_timeout)
+        for future in not_done:
+            provider, model_name, claim = futures[future]
+            if self._claim(claim):
+                self.record(provider, model_name, self.probe_timeout, False, kind="probe")
+
+    def _timed_probe(self, provider, model_name, probe_fn, claim):
+        start = time.perf_counter()
+        try:
+            probe_fn()
+            ok = True
+        except Exception:
+            ok = False
+        # A probe that already timed out was recorded as a failure; drop the late result
+        if self._claim(claim):
+            self.record(provider, model_name, time.perf_counter() - start, ok, kind="probe")
+
+    def _claim(self, claim):
+        with self._lock:
+            if claim[0]:
+                return False
+            claim[0] = True
+            return True
+
+    @staticmethod
+    def _percentile(sorted_values, q):
+        if not sorted_values:
+            return None
+        index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+        return sorted_values[index]
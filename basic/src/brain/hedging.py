@@ -0,0 +1,117 @@
+# src/brain/hedging.py
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class HedgedExecutor:
+    """
+    Tail-latency insurance for the conscious generation.
+    Fires the request at the primary provider; if it has not answered within
+    the hedge delay (a latency percentile of that provider), fires the SAME
+    payload at the next provider in the failover chain. First good answer
+    wins, everything else is discarded.
+    """
+
+    def __init__(self, percentile=0.95, min_delay=0.3, max_delay=4.0, default_delay=1.5, max_workers=4):
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.default_delay = default_delay   # Used until a provider has latency history
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="enjo-hedge")
+        self._lock = threading.Lock()
+        self.stats = {}  # provider -> counters
+
+    def hedge_delay(self, latencies):
+        """Percentile of the primary's recent successful latencies, clamped."""
+        if not latencies:
+            return self.default_delay
+        ordered = sorted(latencies)
+        index = min(len(ordered) - 1, int(round(self.percentile * (len(ordered) - 1))))
+        return max(self.min_delay, min(self.max_delay, ordered[index]))
+
+    def run(self, attempts, delay, discard_fn=None):
+        """
+        attempts: ordered list of (provider, fn). fn() returns a result or None (= failed).
+        discard_fn(result): called for good results that lost the race (e.g. to close a stream).
+        Returns (provider, result) of the winner, or (None, None) if every attempt failed.
+        """
+        pending = {}
+        launched = 0
+        winner = None
+        next_launch_at = time.perf_counter()
+
+        while True:
+            # 1. Launch the next hedge if it is due (or nothing is in flight)
+            now = time.perf_counter()
+            if launched < len(attempts) and (now >= next_launch_at or not pending):
+                provider, fn = attempts[launched]
+                pending[self._pool.submit(fn)] = provider
+                self._bump(provider, "launched")
+                if launched > 0:
+                    self._bump(provider, "hedges_fired")
+                launched += 1
+                next_launch_at = time.perf_counter() + delay
+
+            if not pending:
+                return None, None
+
+            # 2. Wait for a result or for the next hedge to become due
+            timeout = None
+            if launched < len(attempts):
+                timeout = max(0.0, next_launch_at - time.perf_counter())
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                provider = pending.pop(future)
+                result = self._result(future)
+                if result is not None and winner is None:
+                    winner = (provider, result)
+                    self._bump(provider, "wins")
+                else:
+                    self._bump(provider, "losses")
+                    if result is not None:
+                        self._bump(provider, "wasted")
+                        if discard_fn:
+                            discard_fn(result)
+                    elif winner is None:
+                        # Hard failure: don't wait out the delay, hedge right away
+                        next_launch_at = time.perf_counter()
+
+            if winner:
+                break
+
+        # 3. Losers still in flight: cancel if possible, otherwise discard on arrival
+        for future, provider in pending.items():
+            self._bump(provider, "losses")
+            if not future.cancel():
+                future.add_done_callback(lambda f, p=provider: self._discard_late(f, p, discard_fn))
+
+        return winner
+
+    def snapshot(self):
+        with self._lock:
+            return {provider: dict(counters) for provider, counters in self.stats.items()}
+
+    def _discard_late(self, future, provider, discard_fn):
+        """A loser landed after the race: only a good result was actually wasted."""
+        result = self._result(future)
+        if result is None:
+            return
+        self._bump(provider, "wasted")
+        if discard_fn:
+            discard_fn(result)
+
+    @staticmethod
+    def _result(future):
+        try:
+            return future.result()
+        except Exception:
+            return None
+
+    def _bump(self, provider, key):
+        with self._lock:
+            counters = self.stats.setdefault(
+                provider, {"launched": 0, "hedges_fired": 0, "wins": 0, "losses": 0, "wasted": 0}
+            )
+            counters[key] += 1
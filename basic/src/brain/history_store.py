@@ -0,0 +1,215 @@
+# src/brain/history_store.py
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+class HistoryStore:
+    """
+    Append-only chat journal on SQLite (WAL mode).
+
+    Every message ever said is one row in `turns` and is never deleted.
+    The "live" history the Brain sees is just a pointer (`window_start`)
+    into that log, so saving a turn is one INSERT, not a rewrite of the
+    whole file, and trimming / compacting / wiping only moves the pointer.
+
+    save(history) diffs the Brain's in-memory list against what was already
+    written (by object identity), so callers keep the old save_history
+    contract: "here is the whole list".
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS turns (
+            id   INTEGER PRIMARY KEY AUTOINCREMENT,
+            role TEXT NOT NULL,
+            text TEXT NOT NULL,
+            ts   REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS meta (
+            key   TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        # WAL + NORMAL: appends don't block readers and a crash never corrupts the log
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+
+        self._row_of = {}   # id(message dict) -> row id, for messages we wrote or loaded
+        self._refs = []     # Keeps those dicts alive so their id() stays unique
+
+    # --- HISTORY ---
+    def load(self, limit):
+        """Newest `limit` messages of the live window, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, role, text FROM turns WHERE id >= ? ORDER BY id DESC LIMIT ?",
+                (self._window_start(), limit),
+            ).fetchall()
+
+            history = []
+            for row_id, role, text in reversed(rows):
+                message = {"role": role, "text": text}
+                self._track(message, row_id)
+                history.append(message)
+            return history
+
+    def save(self, history, limit):
+        """Appends the new tail of `history` and moves the live window to its head."""
+        with self._lock:
+            # 1. New messages = the tail we have never seen (usually exactly one turn)
+            fresh = 0
+            while fresh < len(history) and id(history[-1 - fresh]) not in self._row_of:
+                fresh += 1
+
+            now = time.time()
+            with self._transaction():
+                for message in history[len(history) - fresh:]:
+                    cursor = self._conn.execute(
+                        "INSERT INTO turns (role, text, ts) VALUES (?, ?, ?)",
+                        (message.get("role", "user"), message.get("text", ""), now),
+                    )
+                    self._track(message, cursor.lastrowid)
+
+                # 2. Live window starts at the oldest message still in memory (capped at `limit`)
+                live = history[-limit:]
+                if live:
+                    self._set_meta("window_start", self._row_of[id(live[0])])
+                else:
+                    self._set_meta("window_start", self._last_row() + 1)
+
+            self._forget(live)
+
+    def wipe(self):
+        """Empties the live window. The journal itself is kept."""
+        with self._lock, self._transaction():
+            self._set_meta("window_start", self._last_row() + 1)
+            self._set_meta("summary", "")
+        self._row_of.clear()
+        self._refs.clear()
+
+    def iter_messages(self, batch=2048):
+        """
+        Every message in the journal, oldest first (live + archived).
+        Fetched a batch at a time; the lock is never held while the caller
+        runs, so saving a turn mid-iteration does not block.
+        """
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT id, role, text FROM turns WHERE id > ? ORDER BY id LIMIT ?", (last_id, batch),
+                ).fetchall()
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            for _, role, text in rows:
+                yield {"role": role, "text": text}
+
+    def count(self):
+        """Total messages in the journal (live + archived)."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM turns").fetchone()[0]
+
+    # --- SUMMARY ---
+    def load_summary(self):
+        with self._lock:
+            return self._get_meta("summary") or ""
+
+    def save_summary(self, summary):
+        with self._lock, self._transaction():
+            self._set_meta("summary", summary)
+
+    # --- MIGRATION (history.json / summary.json -> SQLite, once) ---
+    def migrate_json(self, history_path, summary_path):
+        with self._lock:
+            if self._get_meta("migrated"):
+                return 0
+
+            history, summary = [], None
+            try:
+                if os.path.exists(history_path):
+                    with open(history_path, 'r', encoding='utf-8') as f:
+                        history = json.load(f) or []
+                if os.path.exists(summary_path):
+                    with open(summary_path, 'r', encoding='utf-8') as f:
+                        summary = json.load(f).get("summary", "")
+            except Exception as e:
+                print(f">> Memory: Migration skipped, unreadable JSON ({e})")
+                return 0
+
+            now = time.time()
+            with self._transaction():
+                first = self._last_row() + 1
+                self._conn.executemany(
+                    "INSERT INTO turns (role, text, ts) VALUES (?, ?, ?)",
+                    [(m.get("role", "user"), m.get("text", ""), now) for m in history],
+                )
+                self._set_meta("window_start", first)
+                if summary is not None:
+                    self._set_meta("summary", summary)
+                self._set_meta("migrated", str(now))
+
+        # Old files stay on disk as a backup, out of the way of any future loader
+        for path in (history_path, summary_path):
+            if os.path.exists(path):
+                os.replace(path, path + ".migrated")
+        return len(history)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # --- INTERNALS ---
+    def _transaction(self):
+        return _Transaction(self._conn)
+
+    def _track(self, message, row_id):
+        self._row_of[id(message)] = row_id
+        self._refs.append(message)
+
+    def _forget(self, live):
+        """Drops bookkeeping for messages that left the live window (keeps memory flat)."""
+        if len(self._refs) > 2 * max(len(live), 1):
+            keep = {id(m) for m in live}
+            self._refs = [m for m in self._refs if id(m) in keep]
+            self._row_of = {k: v for k, v in self._row_of.items() if k in keep}
+
+    def _window_start(self):
+        value = self._get_meta("window_start")
+        return int(value) if value is not None else 0
+
+    def _last_row(self):
+        return self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM turns").fetchone()[0]
+
+    def _get_meta(self, key):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key, value):
+        self._conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, str(value)),
+        )
+
+
+class _Transaction:
+    """BEGIN/COMMIT around a block (ROLLBACK on error). The connection runs in autocommit."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
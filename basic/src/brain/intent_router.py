@@ -0,0 +1,114 @@
+# src/brain/intent_router.py
+import random
+import re
+import time
+
+import src.brain.bot_personality as Personality
+from src.utils.config_manager import ConfigManager
+
+
+class IntentRouter:
+    """
+    Reflex arc: plain desktop commands ("open spotify", "mute", "volume 50")
+    skip the LLM entirely and go straight to the Hands.
+
+    The vocabulary is compiled from the action protocol in bot_personality.py
+    and the app_paths keys in data/config.json, so it stays in sync with what
+    the LLM itself is allowed to do. Only whole-utterance matches fire;
+    anything fuzzier falls through to Brain.think.
+    """
+
+    # Commands DesktopController actually implements. 'system | shutdown' is
+    # deliberately left to the LLM: too destructive for a reflex.
+    SUPPORTED = {"open", "system", "volume"}
+    BLOCKED = {("system", "shutdown")}
+
+    ACKS = {
+        "open": ["On it, boss.", "Opening {target}.", "{target}, coming right up."],
+        "system": ["Done.", "Consider it done."],
+        "volume": ["Volume set.", "Done."],
+    }
+
+    _TAG = re.compile(r'\[ACTION:\s*(\w+)\s*\|\s*([^\]]+?)\s*\]')
+    _WAKE = re.compile(r'^(?:hey\s+|ok\s+)?enjo[\s,:]*', re.IGNORECASE)
+    _TRAILING = re.compile(r'[\s.!?]+$')
+
+    def __init__(self):
+        config = ConfigManager.load_config()
+
+        # 1. Vocabulary from the action protocol ([ACTION: cmd | target] examples)
+        protocol = Personality.Personality.get_system_prompt("default")
+        self.vocabulary = {}
+        for cmd, target in self._TAG.findall(protocol):
+            cmd, target = cmd.lower(), target.lower()
+            if cmd in self.SUPPORTED and (cmd, target) not in self.BLOCKED:
+                self.vocabulary.setdefault(cmd, set()).add(target)
+
+        # 2. Every mapped app is a valid 'open' target
+        self.vocabulary.setdefault("open", set()).update(k.lower() for k in config.get("app_paths", {}))
+
+        self._compile()
+        self.stats = {"hits": 0, "misses": 0, "total_ms": 0.0}
+
+    def _compile(self):
+        apps = "|".join(sorted((re.escape(a) for a in self.vocabulary.get("open", ())), key=len, reverse=True))
+        system_targets = self.vocabulary.get("system", set())
+
+        self.patterns = []
+        if apps:
+            self.patterns.append((
+                "open",
+                re.compile(rf'^(?:please\s+)?(?:open|launch|start|run)\s+(?:the\s+|up\s+)?(?P<target>{apps})(?:\s+app)?(?:\s+please)?$'),
+            ))
+        if "volume" in self.vocabulary:
+            self.patterns += [
+                ("volume", re.compile(r'^(?:set\s+)?(?:the\s+)?volume\s+(?:to\s+)?(?P<target>\d{1,3})\s*(?:%|percent)?$')),
+                ("volume", re.compile(r'^(?P<target>mute|unmute)(?:\s+(?:the\s+)?(?:volume|sound|audio))?$')),
+                ("volume", re.compile(r'^volume\s+(?:to\s+)?(?P<target>max)$')),
+                ("volume", re.compile(r'^(?P<target>max)(?:imum)?\s+volume$')),
+            ]
+        if "lock" in system_targets:
+            self.patterns.append(("system", re.compile(r'^(?P<target>lock)(?:\s+(?:the\s+|my\s+)?(?:computer|pc|screen|system))?$')))
+        if "sleep" in system_targets:
+            # Only when the machine is named: a bare "go to sleep" may be said to ENJO, not about the PC
+            self.patterns += [
+                ("system", re.compile(r'^(?P<target>sleep)\s+(?:the\s+|my\s+)?(?:computer|pc|system)$')),
+                ("system", re.compile(r'^(?:put\s+)?(?:the\s+|my\s+)?(?:computer|pc|system)\s+to\s+(?P<target>sleep)$')),
+            ]
+
+    def route(self, text):
+        """Returns (command, target, spoken_ack) on a confident match, else None."""
+        started = time.perf_counter()
+        utterance = self._normalize(text)
+        match = None
+
+        for command, pattern in self.patterns:
+            found = pattern.match(utterance)
+            if found:
+                target = found.group("target") or ""
+                if command == "volume" and target.isdigit() and int(target) > 100:
+                    target = None  # Out of range: let the LLM talk the user down
+                if target:
+                    match = (command, target, self._ack(command, target))
+                break
+
+        self.stats["hits" if match else "misses"] += 1
+        self.stats["total_ms"] += (time.perf_counter() - started) * 1000
+        return match
+
+    def hit_rate(self):
+        total = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / total if total else 0.0
+
+    def report(self):
+        total = self.stats["hits"] + self.stats["misses"]
+        avg_ms = self.stats["total_ms"] / total if total else 0.0
+        return f"Reflex hits {self.stats['hits']}/{total} ({self.hit_rate():.0%}), avg match {avg_ms:.3f} ms"
+
+    def _normalize(self, text):
+        text = self._WAKE.sub("", text.strip())
+        text = self._TRAILING.sub("", text)
+        return re.sub(r'\s+', ' ', text).lower()
+
+    def _ack(self, command, target):
+        return random.choice(self.ACKS[command]).format(target=target.capitalize())
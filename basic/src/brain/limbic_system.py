@@ -7,34 +7,66 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.config_manager import ConfigManager
 
 class LimbicSystem:
-    def __init__(self):
+    def __init__(self, emotions=None):
         # 1. Load from Config (Single Source of Truth)
         self.config = ConfigManager.load_config()
-        self.emotions = self.config.get("emotions", {})
+        self._fixed_emotions = emotions is not None  # Explicit emotions never follow config reloads
+        self.emotions = emotions if emotions is not None else self.config.get("emotions", {})
 
         # 2. Pre-sort categories for priority (The Aurora Protocol Logic)
         # We manually define priority checks here since JSON order isn't guaranteed
         self.priority_order = ["fear", "angry", "tsundere", "whisper", "happy", "critical", "sad"]
 
-        # 'Relaxed' is the catch-all for mild frustration, checked separately
+        # 'Relaxed' is the catch-all for mild frustration, ranked after every priority tier
+        self._ranking = self.priority_order + ["relaxed"]
+        self._rank = {emotion: i for i, emotion in enumerate(self._ranking)}
+
+        # 3. Compile every keyword of every emotion into ONE regex
+        self._pattern = None
+        self._compiled_from = None
+        self._compile()
+
+    def _compile(self):
+        """
+        One alternation with a named group per emotion, wrapped in a lookahead so
+        finditer() reports every (even overlapping) match position. Groups are
+        listed in priority order, so at the same position the higher tier wins.
+        """
+        branches = []
+        for emotion in self._ranking:
+            keywords = [w for w in self.emotions.get(emotion, {}).get("keywords", []) if w]
+            if keywords:
+                alternation = "|".join(re.escape(w) for w in keywords)
+                branches.append(f"(?P<{emotion}>(?:{alternation})\\b)")
+
+        # The leading \b is shared by every keyword, so most positions fail on one check
+        self._pattern = re.compile(r"(?=\b(?:" + "|".join(branches) + "))") if branches else None
+        self._compiled_from = self.emotions
+
+    def refresh(self):
+        """Rebuilds the matcher if the 'emotions' config changed (ConfigManager.reload)."""
+        if not self._fixed_emotions:
+            self.config = ConfigManager.load_config()
+            self.emotions = self.config.get("emotions", {})
+        if self.emotions is not self._compiled_from:
+            self._compile()
 
     def detect_emotion(self, text):
+        self.refresh()
+        return self._classify(text)
+
+    def detect_emotions(self, texts):
+        """Batch version for whole conversation logs (one config check for all texts)."""
+        self.refresh()
+        return [self._classify(text) for text in texts]
+
+    def _classify(self, text):
         text = text.lower()
 
-        # --- CHECK 1: PRIORITY TIERS ---
-        for emotion in self.priority_order:
-            keywords = self.emotions.get(emotion, {}).get("keywords", [])
-            for word in keywords:
-                # Regex match whole words
-                if re.search(r'\b' + re.escape(word) + r'\b', text):
-                    return emotion
-
-        # --- CHECK 2: MILD FRUSTRATION (Relaxed) ---
-        # If no priority emotion found, check if it's just mild venting
-        relaxed_keywords = self.emotions.get("relaxed", {}).get("keywords", [])
-        for word in relaxed_keywords:
-             if re.search(r'\b' + re.escape(word) + r'\b', text):
-                 return "relaxed"
+        # --- CHECK 1 + 2: PRIORITY TIERS, THEN MILD FRUSTRATION (Relaxed) ---
+        emotion = self._best_match(text)
+        if emotion:
+            return emotion
 
         # --- CHECK 3: CONTEXT CLUES ---
         if "!" in text and "?" not in text:
@@ -42,4 +74,17 @@ class LimbicSystem:
         if "..." in text:
             return "relaxed"
 
-        return "normal"
\ No newline at end of file
+        return "normal"
+
+    def _best_match(self, text):
+        if self._pattern is None:
+            return None
+
+        best = None
+        for match in self._pattern.finditer(text):
+            rank = self._rank[match.lastgroup]
+            if best is None or rank < best:
+                best = rank
+                if rank == 0:
+                    break  # Nothing outranks the top tier
+        return self._ranking[best] if best is not None else None
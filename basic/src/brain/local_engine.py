@@ -1,8 +1,14 @@
 # src/brain/local_engine.py
-from ollama import chat, ResponseError
+import threading
+import time
+
+from src.utils.boot import lazy_import
+
+ollama = lazy_import("ollama")
+
 
 class LocalEngine:
-    def __init__(self, preferred_model="llama3"):
+    def __init__(self, preferred_model="llama3", keep_alive="30m", host=None, timeout=60.0, repin_interval=None):
         # We store the model name the Brain asks for
         self.model_name = preferred_model
 
@@ -10,24 +16,129 @@ class LocalEngine:
         if not self.model_name:
             self.model_name = "llama3"
 
+        # Keeping the model loaded lets Ollama reuse the KV cache of our
+        # byte-stable prompt prefix instead of re-reading it every turn.
+        # Use -1 to pin the model in memory forever.
+        self.keep_alive = keep_alive
+
+        # One persistent client (pooled HTTP connection + per-call timeout)
+        # instead of the module-level ollama.chat helper. Built on first use
+        # (usually the warm-up thread), so the SDK import stays off the boot path.
+        self.host = host
+        self.timeout = timeout
+        self._client = None
+        self._client_lock = threading.Lock()
+
+        # Warm-up state: cold -> warming -> ready | failed
+        self.status = "cold"
+        self.ready = threading.Event()
+        self.warmup_seconds = None
+        self.repin_interval = repin_interval  # Re-touch the model before keep_alive expires
+        self._stop = threading.Event()
+        self._warm_thread = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = ollama.Client(host=self.host, timeout=self.timeout)
+        return self._client
+
+    # --- WARM-UP (So failover lands on a hot model) ---
+    def start_warmup(self):
+        """Loads the model in the background. Returns immediately."""
+        if self._warm_thread is None:
+            self._warm_thread = threading.Thread(target=self._warm_loop, name="enjo-local-warmup", daemon=True)
+            self._warm_thread.start()
+
+    def warm_up(self):
+        """
+        Blocking warm-up:
+          1. Preload the weights (empty prompt) and pin them with keep_alive.
+          2. Run a 1-token generation so the runner and prompt path are hot too.
+        """
+        self.status = "warming"
+        started = time.perf_counter()
+        try:
+            self.client.generate(model=self.model_name, prompt="", keep_alive=self.keep_alive)
+            self.client.chat(
+                model=self.model_name,
+                messages=[{"role": "user", "content": "hi"}],
+                options={"num_predict": 1},
+                keep_alive=self.keep_alive,
+            )
+        except Exception as e:
+            self.status = "failed"
+            print(f"\n>> Local: Warm-up of {self.model_name} failed ({e})")
+            return False
+
+        self.warmup_seconds = time.perf_counter() - started
+        self.status = "ready"
+        self.ready.set()
+        print(f"\n>> Local: {self.model_name} is warm ({self.warmup_seconds:.1f}s).")
+        return True
+
+    def wait_ready(self, timeout=None):
+        return self.ready.wait(timeout)
+
+    def stop(self):
+        self._stop.set()
+
+    def _warm_loop(self):
+        self.warm_up()
+        while self.repin_interval and not self._stop.wait(self.repin_interval):
+            try:
+                # Empty prompt = just refresh keep_alive, no generation
+                self.client.generate(model=self.model_name, prompt="", keep_alive=self.keep_alive)
+                if self.status != "ready":
+                    self.status = "ready"
+                    self.ready.set()
+            except Exception:
+                self.status = "failed"
+                self.ready.clear()
+
+    def probe(self):
+        """Health check: raises if the Ollama server is not answering."""
+        self.client.list()
+
     def think(self, messages):
         """
         Receives the FULL context from core.py (System Prompt + History + User Input)
         and feeds it directly to the local model.
         """
-        print(f"⚡ [Local] Thinking with {self.model_name}...")
+        print(f"⚡ [Local] Thinking with {self.model_name}... ({self.status})")
 
         try:
             # We pass the 'messages' list directly.
             # This list ALREADY contains the System Prompt from bot_personality.py
-            response = chat(
+            response = self.client.chat(
                 model=self.model_name,
-                messages=messages
+                messages=messages,
+                keep_alive=self.keep_alive
             )
 
             return response['message']['content']
 
-        except ResponseError as e:
+        except ollama.ResponseError as e:
             return f"Local Model Error: {e.error}"
         except Exception as e:
-            return f"CRITICAL: Local Ollama unreachable. Is 'ollama serve' running? ({e})"
\ No newline at end of file
+            return f"CRITICAL: Local Ollama unreachable. Is 'ollama serve' running? ({e})"
+
+    def think_stream(self, messages):
+        """
+        Streaming version of think(). Yields text deltas as Ollama produces them.
+        Errors are yielded as text too (Local is the last resort, so we speak them).
+        """
+        print(f"⚡ [Local] Streaming with {self.model_name}... ({self.status})")
+
+        try:
+            for chunk in self.client.chat(model=self.model_name, messages=messages, stream=True, keep_alive=self.keep_alive):
+                delta = chunk['message']['content']
+                if delta:
+                    yield delta
+
+        except ollama.ResponseError as e:
+            yield f"Local Model Error: {e.error}"
+        except Exception as e:
+            yield f"CRITICAL: Local Ollama unreachable. Is 'ollama serve' running? ({e})"
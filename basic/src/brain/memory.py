@@ -1,18 +1,36 @@
 # v0.2/src/brain/memory.py
+import copy
 import json
 import os
+import threading
+import time
+
+from src.brain.episodic_memory import EpisodicMemory
+from src.brain.history_store import HistoryStore
 
 class MemorySystem:
-    def __init__(self):
+    # Size of the live window loaded back into the Brain. The journal on disk
+    # keeps everything; the prompt is bounded by the token-budgeted ContextWindow.
+    MAX_HISTORY = 200
+
+    # Profile write-behind: learned facts are coalesced into one write per delay
+    PROFILE_FLUSH_DELAY = 1.0
+    # How often load_profile stats profile.json for hand edits (seconds)
+    PROFILE_MTIME_CHECK = 2.0
+
+    def __init__(self, data_dir=None):
         # 1. Calculate Path
         # Logic: brain -> src -> v0.2 -> data
         current_dir = os.path.dirname(os.path.abspath(__file__)) # .../src/brain
         src_dir = os.path.dirname(current_dir)                   # .../src
         v02_dir = os.path.dirname(src_dir)                       # .../v0.2
 
-        self.data_dir = os.path.join(v02_dir, "data")
+        # Server sessions pass their own folder (data/sessions/<id>)
+        self.data_dir = data_dir or os.path.join(v02_dir, "data")
         self.profile_path = os.path.join(self.data_dir, "profile.json")
         self.history_path = os.path.join(self.data_dir, "history.json")
+        self.summary_path = os.path.join(self.data_dir, "summary.json")
+        self.db_path = os.path.join(self.data_dir, "history.db")
 
         # 2. DEBUG: Tell us where you are looking
         print(f">> DEBUG: Memory initializing at: {self.data_dir}")
@@ -20,6 +38,31 @@ class MemorySystem:
         # 3. Ensure folder & files exist NOW
         self._initialize_storage()
 
+        # 4. Chat history + summary live in an append-only SQLite journal.
+        # One-shot import of the old history.json / summary.json.
+        self.store = HistoryStore(self.db_path)
+        migrated = self.store.migrate_json(self.history_path, self.summary_path)
+        if migrated:
+            print(f">> Memory: Migrated {migrated} messages from history.json to history.db")
+
+        # 5. Long-term episodic memory (every exchange, embedded for similarity search)
+        self.episodes = EpisodicMemory(self.data_dir)
+        if self.episodes.count == 0 and self.store.count():
+            self._backfill_episodes()
+
+        # 6. Profile lives in RAM; a writer thread persists it (debounced)
+        self._profile_lock = threading.RLock()
+        self._profile = {}
+        self._pending = {}          # Facts merged since the last flush (re-applied over hand edits)
+        self._profile_mtime = None
+        self._last_mtime_check = 0.0
+        self.profile_version = 0    # Bumped on every change, so the Brain knows when to rebuild its prompt
+        self._reload_profile()
+
+        self._dirty = threading.Event()
+        self._closed = threading.Event()
+        self._writer = threading.Thread(target=self._write_behind, name="enjo-profile-writer", daemon=True)
+        self._writer.start()
 
 
     def _initialize_storage(self):
@@ -36,31 +79,92 @@ class MemorySystem:
                 with open(self.profile_path, 'w', encoding='utf-8') as f:
                     json.dump({"name": None, "stocks": [], "projects": []}, f, indent=4)
 
-            # Create History JSON if missing
-            if not os.path.exists(self.history_path):
-                print(">> Memory: Creating empty history.json...")
-                with open(self.history_path, 'w', encoding='utf-8') as f:
-                    json.dump([], f, indent=4)
-
         except Exception as e:
             print(f">> MEMORY CRASH: Could not create files. {e}")
 
     # --- PERMANENT MEMORY (Profile) ---
     def load_profile(self):
-        try:
-            with open(self.profile_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception:
-            return {}
+        """Copy of the cached profile (no disk read; picks up hand edits via mtime)."""
+        with self._profile_lock:
+            self.check_external_edit()
+            return copy.deepcopy(self._profile)
 
     def update_profile(self, new_data_dict):
 
         """
         Merges a dictionary of new facts into the permanent profile.
         Example input: {'location': 'Tokyo', 'hobby': 'Coding'}
+        The write to profile.json happens later, on the writer thread.
         """
-        current_data = self.load_profile()
+        with self._profile_lock:
+            self.check_external_edit()
+            self._merge(self._profile, new_data_dict)
+            self._merge(self._pending, new_data_dict)
+            self.profile_version += 1
+        self._dirty.set()
+
+        print(f">> Memory: Profile merged updates -> {list(new_data_dict.keys())}")
 
+    def check_external_edit(self):
+        """Reloads profile.json if someone edited it by hand (throttled stat)."""
+        now = time.monotonic()
+        if now - self._last_mtime_check < self.PROFILE_MTIME_CHECK:
+            return False
+        self._last_mtime_check = now
+
+        with self._profile_lock:
+            if self._mtime() == self._profile_mtime:
+                return False
+            print(">> Memory: profile.json changed on disk. Reloading.")
+            self._reload_profile()
+            # Facts learned but not yet written still win over the file
+            self._merge(self._profile, self._pending)
+            return True
+
+    def flush(self):
+        """Writes the profile now if it has unsaved changes (shutdown / tests)."""
+        with self._profile_lock:
+            if not self._pending:
+                return False
+            try:
+                tmp = self.profile_path + ".tmp"
+                with open(tmp, 'w', encoding='utf-8') as f:
+                    json.dump(self._profile, f, indent=4, sort_keys=True)
+                os.replace(tmp, self.profile_path)  # Atomic: a crash never leaves half a file
+                self._profile_mtime = self._mtime()
+            except Exception as e:
+                # Facts stay pending: they survive a reload and the writer retries after the delay
+                print(f">> Memory Save Error: {e}")
+                self._dirty.set()
+                return False
+            self._pending = {}
+        return True
+
+    def _write_behind(self):
+        while not self._closed.is_set():
+            self._dirty.wait()
+            self._dirty.clear()
+            # Debounce: facts arriving within the delay share one write
+            self._closed.wait(self.PROFILE_FLUSH_DELAY)
+            self.flush()
+
+    def _reload_profile(self):
+        try:
+            with open(self.profile_path, 'r', encoding='utf-8') as f:
+                self._profile = json.load(f)
+        except Exception:
+            self._profile = {}
+        self._profile_mtime = self._mtime()
+        self.profile_version += 1
+
+    def _mtime(self):
+        try:
+            return os.stat(self.profile_path).st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def _merge(current_data, new_data_dict):
         # Loop through new facts and update/overwrite
         for key, value in new_data_dict.items():
             # If it's a list (like stocks), append to it instead of overwriting
@@ -73,32 +177,72 @@ class MemorySystem:
                 # Standard overwrite (e.g. Location changed from London to Tokyo)
                 current_data[key] = value
 
-        with open(self.profile_path, 'w', encoding='utf-8') as f:
-            json.dump(current_data, f, indent=4, sort_keys=True)
-
-        print(f">> Memory: Profile merged updates -> {list(new_data_dict.keys())}")
-
     # --- TEMPORARY MEMORY (Chat History) ---
     def load_history(self):
         try:
-            with open(self.history_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception:
+            return self.store.load(self.MAX_HISTORY)
+        except Exception as e:
+            print(f">> Memory Load Error: {e}")
             return []
 
     def save_history(self, history):
-        # Save last 20 messages
-        trimmed = history[-10:]
+        # Appends only the new messages; older turns stay in the journal (and in the summary)
+        try:
+            self.store.save(history, self.MAX_HISTORY)
+        except Exception as e:
+            print(f">> Memory Save Error: {e}")
+
+    # --- ROLLING SUMMARY (Compacted history) ---
+    def load_summary(self):
+        try:
+            return self.store.load_summary()
+        except Exception:
+            return ""
+
+    def save_summary(self, summary):
         try:
-            with open(self.history_path, 'w', encoding='utf-8') as f:
-                json.dump(trimmed, f, indent=4, ensure_ascii=False)
+            self.store.save_summary(summary)
         except Exception as e:
             print(f">> Memory Save Error: {e}")
 
+    # --- EPISODIC MEMORY (Everything ever said, searchable) ---
+    def remember_episode(self, user, ai):
+        try:
+            self.episodes.add(user, ai)
+        except Exception as e:
+            print(f">> Memory Save Error: {e}")
+
+    def recall(self, query, k=3, exclude_recent=0, min_score=0.0):
+        """Past exchanges most similar to `query`, skipping the newest `exclude_recent`."""
+        try:
+            return self.episodes.search(query, k=k, before=self.episodes.count - exclude_recent, min_score=min_score)
+        except Exception as e:
+            print(f">> Memory Recall Error: {e}")
+            return []
+
+    def _backfill_episodes(self):
+        """One-shot: turns already in the journal become episodes (user message + the reply after it)."""
+        pairs, pending_user = [], None
+        for message in self.store.iter_messages():
+            if message["role"] == "user":
+                pending_user = message["text"]
+            elif pending_user is not None:
+                pairs.append((pending_user, message["text"]))
+                pending_user = None
+        for start in range(0, len(pairs), 2048):
+            self.episodes.add_many(pairs[start:start + 2048])
+        print(f">> Memory: Indexed {len(pairs)} past exchanges into episodic memory.")
+
     def wipe_temporary(self):
-        if os.path.exists(self.history_path):
-            os.remove(self.history_path)
-            # Re-create empty file immediately
-            with open(self.history_path, 'w', encoding='utf-8') as f:
-                json.dump([], f, indent=4)
-        print(">> Memory: Short-term cache cleared.")
\ No newline at end of file
+        # Starts a fresh live window; the journal on disk is never truncated
+        self.store.wipe()
+        print(">> Memory: Short-term cache cleared.")
+
+    def close(self):
+        """Flushes the profile and releases the journal (server sessions are closed when evicted)."""
+        self._closed.set()
+        self._dirty.set()
+        self._writer.join(timeout=5.0)
+        self.flush()
+        self.episodes.close()
+        self.store.close()
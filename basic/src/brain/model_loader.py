@@ -10,6 +10,11 @@ class ModelConfig:
         self.gemini_key = os.getenv("GOOGLE_API_KEY")
         self.groq_key = os.getenv("GROQ_API_KEY")
 
+        # Endpoint overrides (None = SDK default). Handy for local stub servers.
+        self.gemini_base_url = os.getenv("GEMINI_BASE_URL")
+        self.groq_base_url = os.getenv("GROQ_BASE_URL")
+        self.ollama_host = os.getenv("OLLAMA_HOST")
+
 
         self.gemini_models = [
             "gemini-2.5-flash",       # Fastest, Newest
@@ -27,6 +32,79 @@ class ModelConfig:
             "llama-3.3-70b-versatile"      # Fast fallback
         ]
 
+        # Prompt budget per model (tokens). Deliberately far below the real
+        # context limits: prompt size is what drives latency and cost.
+        self.context_budgets = {
+            "gemini-2.5-flash": 8000,
+            "gemini-2.5-flash-lite": 6000,
+            "gemini-3-flash-preview": 8000,
+            "gemini-3-pro-preview": 12000,
+            "gemini-2.5-pro": 12000,
+            "openai/gpt-oss-120b": 6000,
+            "openai/gpt-oss-20b": 6000,
+            "llama-3.1-8b-instant": 4000,
+            "llama-3.3-70b-versatile": 6000,
+        }
+        self.default_context_budget = 3000   # Local models (llama3 = 8k window)
+        self.reply_reserve_tokens = 512      # Headroom left for the answer
+
+        # Cheapest model per provider, used for internal calls (fact extraction)
+        self.light_models = {
+            "gemini": "gemini-2.5-flash-lite",
+            "groq": "llama-3.1-8b-instant",
+        }
+
+        # Circuit breakers (seconds a failing model is benched)
+        self.breaker_cooldown = 30.0
+        self.breaker_capacity_cooldown = 60.0   # Rate limit / overload
+
         # 2. Local Configuration
         # We only define the PREFERENCE here. The Engine handles the rest.
-        self.local_model_name = "llama3"
\ No newline at end of file
+        self.local_enabled = True           # False = no Ollama on this machine (no probes, no local failover)
+        self.local_model_name = "llama3"
+        # How long Ollama keeps the model (and its prompt KV cache) resident between turns
+        # (-1 pins it forever). The warm-up thread loads it at boot so the
+        # first failover does not pay the cold start.
+        self.local_keep_alive = "30m"
+        self.local_prewarm = True
+        self.local_repin_interval = 600.0  # Re-touch the model before keep_alive expires (None = off)
+
+        # 3. Health Monitor (seconds)
+        self.health_interval = 30.0        # Probe period while everything is fine
+        self.health_fast_interval = 5.0    # Probe period while a preferred provider is down
+        self.health_probe_timeout = 5.0    # A probe slower than this counts as a failure
+        self.boot_probe_timeout = 3.0      # Max time boot waits for the first healthy provider
+
+        # 4. Hedged Requests (Race the next provider if the primary is slow)
+        self.hedging_enabled = False
+        self.hedge_percentile = 0.95       # Hedge after the primary's p95 latency...
+        self.hedge_min_delay = 0.3         # ...but never sooner than this
+        self.hedge_max_delay = 4.0         # ...and never later than this
+
+        # 5. Async Provider Layer (Brain.athink)
+        self.provider_timeout = 30.0       # Per-call deadline for cloud providers
+        self.local_timeout = 60.0          # Local models are slower to answer
+        self.async_max_connections = 20    # Shared pool size
+        self.async_max_keepalive = 10
+
+        # 6. Fused Turns (Reply + action + facts in ONE call instead of chat + Subconscious)
+        self.fused_turns = False
+        self.fused_max_failures = 2        # Schema misses before a model goes back to two calls
+
+        # 7. Episodic Memory (Similar past exchanges injected into the prompt)
+        self.episodic_enabled = True
+        self.episodic_top_k = 3
+        self.episodic_min_score = 0.35     # Cosine similarity floor; weaker matches are noise
+
+        # 8. Profile Injection (Core fields + the top-k facts relevant to the turn)
+        self.profile_top_k = 8
+
+        # 9. Fact Gate (Local pre-filter: skip extraction on fact-free turns)
+        self.fact_gate_enabled = False     # Opt-in: a skipped turn is a fact never learned (see eval_fact_gate)
+        self.fact_gate_threshold = 0.35    # Higher = fewer calls, more missed facts
+        self.fact_gate_explore_rate = 0.05 # Skipped turns still sent, to keep the training log honest
+        self.fact_gate_log = False         # Logs single-turn extraction results WITH the raw user text (data/fact_gate_log.jsonl)
+        self.fact_gate_log_max_bytes = 1_000_000  # Rotated to fact_gate_log.jsonl.1 past this size
+
+    def context_budget(self, model_name):
+        return self.context_budgets.get(model_name, self.default_context_budget)
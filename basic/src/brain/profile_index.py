@@ -0,0 +1,88 @@
+# src/brain/profile_index.py
+import math
+import re
+
+from src.brain.context_window import approx_tokens
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an the i me my you your is are was were be to of and or in on at it that this "
+    "for with do does did so just what how who where when can will would".split()
+)
+
+# Always injected, whatever the user says (the rest of the profile is searched)
+CORE_FIELDS = ("name", "stocks", "projects")
+
+
+def tokenize(text):
+    tokens = []
+    for word in _TOKEN.findall(text.lower()):
+        if word in _STOPWORDS:
+            continue
+        # Poor man's stemming: "pets" matches "pet", "allergies" matches "allergy"
+        if len(word) > 4 and word.endswith("ies"):
+            word = word[:-3] + "y"
+        elif len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        tokens.append(word)
+    return tokens
+
+
+class ProfileIndex:
+    """
+    BM25 inverted index over the non-core profile facts.
+
+    Each fact ("pets": "Dog named Rover") is one document made of its key
+    words and value words. search() scores only the postings of the query
+    terms, so a turn costs the same whether the profile holds 20 facts or
+    5,000.
+    """
+
+    def __init__(self, k1=1.2, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self.facts = []        # [(key, value)]
+        self.postings = {}     # term -> [(fact_index, term_frequency)]
+        self.lengths = []
+        self.avg_length = 0.0
+        self.full_tokens = 0   # Prompt cost if every fact were injected
+
+    def build(self, profile):
+        self.facts = [(k, v) for k, v in profile.items() if k not in CORE_FIELDS]
+        self.postings = {}
+        self.lengths = []
+
+        for i, (key, value) in enumerate(self.facts):
+            terms = tokenize(key.replace("_", " ")) + tokenize(str(value))
+            self.lengths.append(len(terms))
+            counts = {}
+            for term in terms:
+                counts[term] = counts.get(term, 0) + 1
+            for term, tf in counts.items():
+                self.postings.setdefault(term, []).append((i, tf))
+
+        self.avg_length = (sum(self.lengths) / len(self.lengths)) if self.lengths else 0.0
+        self.full_tokens = sum(approx_tokens(self.format_fact(k, v)) for k, v in self.facts)
+
+    def search(self, query, k=8):
+        """Top-k (key, value) facts for the query, best first. Empty if nothing matches."""
+        n = len(self.facts)
+        if n == 0:
+            return []
+
+        scores = {}
+        for term in set(tokenize(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+            for i, tf in postings:
+                norm = self.k1 * (1 - self.b + self.b * self.lengths[i] / self.avg_length)
+                scores[i] = scores.get(i, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+
+        best = sorted(scores, key=scores.get, reverse=True)[:k]
+        return [self.facts[i] for i in best]
+
+    @staticmethod
+    def format_fact(key, value):
+        return f"\n{key.capitalize()}: {value}"
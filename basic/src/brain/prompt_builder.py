@@ -0,0 +1,133 @@
+# src/brain/prompt_builder.py
+import src.brain.bot_personality as Personality
+from src.utils.boot import lazy_import
+
+types = lazy_import("google.genai.types")
+
+# Groq and Ollama both speak the OpenAI-style message dict format
+PROVIDER_FORMATS = {"gemini": "gemini", "groq": "chat", "local": "chat"}
+
+
+class PayloadBuilder:
+    """
+    Incremental, prefix-stable payload construction.
+
+    Layout of every payload (oldest bytes first):
+        [static personality + action protocol]   <- built once, never changes
+        [rolling summary of older turns]          <- changes only on compaction
+        [history messages]                        <- converted once, only appended
+        [profile block] [recalled exchanges] [user prompt]   <- the only per-turn bytes
+
+    Keeping the volatile profile block AFTER the history means a learned fact
+    no longer invalidates the whole prompt, so Ollama's keep-alive KV cache and
+    Gemini's implicit context caching can reuse everything before it.
+    """
+
+    def __init__(self, personality_type="default"):
+        # 1. STATIC PREFIX (Cached for the life of the process)
+        self.static_prefix = Personality.Personality.get_system_prompt(personality_type)
+        self._prefix_bytes = len(self.static_prefix.encode("utf-8"))
+        self._prefix_message = {}  # Per format, built on first use (no Gemini types unless Gemini is used)
+
+        # 2. CONVERTED HISTORY (Per provider format)
+        self._converted = {"gemini": [], "chat": []}
+        self._converted_bytes = {"gemini": 0, "chat": 0}
+        self._source = {"gemini": [], "chat": []}  # The history dicts each entry came from
+
+        # 3. ROLLING SUMMARY (Rebuilt only when the ContextWindow compacts)
+        self._summary_text = ""
+        self._summary_message = {}
+
+        # 4. VOLATILE TAIL
+        self.profile_text = ""
+
+        self.stats = {"builds": 0, "prefix_bytes_reused": 0, "prefix_bytes_rebuilt": 0, "messages_converted": 0}
+
+    def set_profile_text(self, profile_text):
+        self.profile_text = profile_text
+
+    @property
+    def system_prompt(self):
+        """The classic 'personality + profile' string, for logs and debugging."""
+        return self.static_prefix + self.profile_text
+
+    def build(self, provider, history, final_prompt, summary="", recall=""):
+        fmt = PROVIDER_FORMATS.get(provider, "chat")
+        reused, rebuilt = self._sync(fmt, history)
+
+        summary_bytes = len(summary.encode("utf-8"))
+        if summary != self._summary_text:
+            self._set_summary(summary)
+            rebuilt += summary_bytes
+        else:
+            reused += summary_bytes
+
+        # The static prefix is only 'rebuilt' the very first time it is sent
+        if self.stats["builds"] == 0:
+            rebuilt += self._prefix_bytes
+        else:
+            reused += self._prefix_bytes
+
+        self.stats["builds"] += 1
+        self.stats["prefix_bytes_reused"] += reused
+        self.stats["prefix_bytes_rebuilt"] += rebuilt
+
+        if fmt not in self._prefix_message:
+            self._prefix_message[fmt] = self._system_message(fmt, self.static_prefix)
+        payload = [self._prefix_message[fmt]]
+        if self._summary_text:
+            if fmt not in self._summary_message:
+                self._summary_message[fmt] = self._system_message(fmt, f"[EARLIER IN THIS CONVERSATION]\n{self._summary_text}")
+            payload.append(self._summary_message[fmt])
+        payload += self._converted[fmt]
+        if fmt == "gemini":
+            parts = [types.Part.from_text(text=text) for text in (self.profile_text, recall) if text]
+            parts.append(types.Part.from_text(text=final_prompt))
+            payload.append(types.Content(role="user", parts=parts))
+        else:
+            for text in (self.profile_text, recall):
+                if text:
+                    payload.append({"role": "system", "content": text})
+            payload.append({"role": "user", "content": final_prompt})
+        return payload
+
+    def snapshot(self):
+        return dict(self.stats)
+
+    def _set_summary(self, summary):
+        self._summary_text = summary
+        self._summary_message = {}
+
+    @staticmethod
+    def _system_message(fmt, text):
+        if fmt == "gemini":
+            return types.Content(role="user", parts=[types.Part.from_text(text=text)])
+        return {"role": "system", "content": text}
+
+    def _sync(self, fmt, history):
+        """Converts only the history messages we have not seen yet. Returns (reused, rebuilt) bytes."""
+        source = self._source[fmt]
+
+        # If the history was trimmed or replaced, the cached prefix is void
+        if source and (len(history) < len(source) or history[0] is not source[0] or history[len(source) - 1] is not source[-1]):
+            self._converted[fmt] = []
+            self._converted_bytes[fmt] = 0
+            self._source[fmt] = source = []
+
+        reused = self._converted_bytes[fmt]
+        rebuilt = 0
+        for msg in history[len(source):]:
+            self._converted[fmt].append(self._convert(fmt, msg))
+            size = len(msg["text"].encode("utf-8"))
+            self._converted_bytes[fmt] += size
+            source.append(msg)
+            rebuilt += size
+            self.stats["messages_converted"] += 1
+        return reused, rebuilt
+
+    @staticmethod
+    def _convert(fmt, msg):
+        if fmt == "gemini":
+            return types.Content(role=msg["role"], parts=[types.Part.from_text(text=msg["text"])])
+        role = "assistant" if msg["role"] == "model" else "user"
+        return {"role": role, "content": msg["text"]}
@@ -0,0 +1,120 @@
+# src/brain/stream_parser.py
+import re
+
+ACTION_OPEN = "[ACTION:"
+
+
+class ActionTagDetector:
+    """
+    Incremental [ACTION: command | target] detector.
+    Feed it raw tokens as they stream in; it hands back the speakable text and
+    any completed actions. Text that MIGHT be the start of a tag is held back
+    until we know for sure, so the tag never leaks into TTS.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+
+    def feed(self, chunk):
+        """Returns (clean_text, [(command, target), ...])."""
+        self.buffer += chunk
+        clean_parts = []
+        actions = []
+
+        while self.buffer:
+            start = self.buffer.find(ACTION_OPEN)
+
+            if start == -1:
+                # No tag yet. Hold back a tail that could still grow into "[ACTION:"
+                hold = self._partial_open_length(self.buffer)
+                cut = len(self.buffer) - hold
+                clean_parts.append(self.buffer[:cut])
+                self.buffer = self.buffer[cut:]
+                break
+
+            end = self.buffer.find("]", start)
+            if end == -1:
+                # Tag opened but not closed: release the text before it, wait for more
+                clean_parts.append(self.buffer[:start])
+                self.buffer = self.buffer[start:]
+                break
+
+            clean_parts.append(self.buffer[:start])
+            action = self._parse_tag(self.buffer[start:end + 1])
+            if action:
+                actions.append(action)
+            self.buffer = self.buffer[end + 1:]
+
+        return "".join(clean_parts), actions
+
+    def flush(self):
+        """End of stream: whatever is still held is plain text after all."""
+        rest = self.buffer
+        self.buffer = ""
+        if rest.startswith(ACTION_OPEN):
+            # An unterminated tag is never worth speaking
+            return ""
+        return rest
+
+    @staticmethod
+    def _partial_open_length(text):
+        for size in range(min(len(ACTION_OPEN) - 1, len(text)), 0, -1):
+            if ACTION_OPEN.startswith(text[-size:]):
+                return size
+        return 0
+
+    @staticmethod
+    def _parse_tag(tag):
+        content = tag.replace(ACTION_OPEN, "").replace("]", "").strip()
+        if "|" not in content:
+            return None
+        cmd, target = content.split("|", 1)
+        return cmd.strip(), target.strip()
+
+
+class SentenceChunker:
+    """
+    Cuts streamed text into whole sentences so TTS can start on the first one
+    while the model is still writing the rest.
+    """
+
+    # A sentence ends at . ! ? (or a newline) followed by whitespace
+    _BOUNDARY = re.compile(r'([.!?]+["\')\]]*)\s+|\n+')
+    _ABBREVIATIONS = ("mr.", "mrs.", "ms.", "dr.", "st.", "vs.", "e.g.", "i.e.", "etc.")
+
+    def __init__(self, min_chars=2):
+        self.buffer = ""
+        self.min_chars = min_chars
+
+    def feed(self, text):
+        """Returns a list of finished sentences (may be empty)."""
+        self.buffer += text
+        sentences = []
+        search_from = 0
+
+        while True:
+            match = self._BOUNDARY.search(self.buffer, search_from)
+            if not match:
+                break
+
+            end = match.end(1) if match.group(1) else match.start()
+            candidate = self.buffer[:end].strip()
+
+            if self._ends_with_abbreviation(candidate) or len(candidate) < self.min_chars:
+                search_from = match.end()
+                continue
+
+            sentences.append(candidate)
+            self.buffer = self.buffer[match.end():]
+            search_from = 0
+
+        return sentences
+
+    def flush(self):
+        rest = self.buffer.strip()
+        self.buffer = ""
+        return rest
+
+    def _ends_with_abbreviation(self, text):
+        lowered = text.lower()
+        return any(lowered.endswith(" " + abbr) or lowered == abbr for abbr in self._ABBREVIATIONS)
@@ -1,4 +1,4 @@
-import json
+from src.brain.fused_turn import extract_json
 
 class Subconscious:
     """
@@ -29,12 +29,59 @@ class Subconscious:
         Output (JSON ONLY):
         """
 
+    def get_batch_analysis_prompt(self, user_texts):
+        """
+        Same job as get_analysis_prompt, but for several queued turns at once.
+        The model returns ONE merged dictionary (later turns win on conflicts).
+        """
+        numbered = "\n".join(f'        {i}. "{text}"' for i, text in enumerate(user_texts, start=1))
+        return f"""
+        Analyze the following user inputs (oldest first) for ANY permanent facts, preferences, or life details.
+        Return ONE JSON dictionary that merges everything you found:
+        - Keys are short, standardized category names (snake_case).
+        - Values are the specific details.
+        - If two inputs disagree, the later input wins.
+
+        Examples:
+        - "I'm allergic to nuts" -> {{"allergies": ["nuts"]}}
+        - "My dog is Rover" -> {{"pets": "Dog named Rover"}}
+        - "I live in Tokyo" -> {{"location": "Tokyo"}}
+
+        Rules:
+        1. If no permanent facts are found, return {{}}.
+        2. Use existing categories if possible (name, stocks, projects).
+        3. Create NEW categories if needed.
+
+        User Inputs:
+{numbered}
+
+        Output (JSON ONLY):
+        """
+
+    def get_summary_prompt(self, previous_summary, messages):
+        """Folds old chat turns into the rolling conversation summary."""
+        transcript = "\n".join(
+            f"        {'User' if m['role'] == 'user' else 'ENJO'}: {m['text']}" for m in messages
+        )
+        return f"""
+        You maintain a running summary of a conversation between the user and ENJO.
+        Update the summary with the new turns below.
+
+        Rules:
+        1. Keep it under 120 words, plain prose, no lists.
+        2. Keep names, decisions, open questions and anything the user may refer back to.
+        3. Drop greetings, small talk and anything already stored as a permanent fact.
+
+        Current Summary:
+        {previous_summary or "(empty)"}
+
+        New Turns:
+{transcript}
+
+        Updated Summary (TEXT ONLY):
+        """
+
     def parse_result(self, llm_response_text):
-        try:
-            clean_text = llm_response_text.replace("```json", "").replace("```", "").strip()
-            data = json.loads(clean_text)
-
-            return data if data else None
-        
-        except Exception:
-            return None
\ No newline at end of file
+        # Tolerates fences, preambles and trailing chatter around the JSON
+        data = extract_json(llm_response_text)
+        return data if data else None
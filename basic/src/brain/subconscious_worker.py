@@ -0,0 +1,151 @@
+# src/brain/subconscious_worker.py
+import queue
+import threading
+import time
+
+
+class SubconsciousWorker:
+    """
+    Background fact extraction.
+    Brain.think drops every user turn into a bounded queue and returns to the
+    conversation immediately. This thread drains whatever is pending, runs ONE
+    analysis call for the whole batch and hands the facts back to the Brain.
+    """
+
+    def __init__(self, subconscious, generate_fn, apply_fn, observe_fn=None, max_queue=32, max_batch=8, batch_window=0.25):
+        # generate_fn(prompt) -> raw LLM text (or None)
+        # apply_fn(facts_dict) -> merges facts into memory + system prompt
+        # observe_fn(batch, facts_or_None) -> sees every extraction result (fact gate training log)
+        self.subconscious = subconscious
+        self.generate_fn = generate_fn
+        self.apply_fn = apply_fn
+        self.observe_fn = observe_fn
+        self.max_batch = max_batch
+        self.batch_window = batch_window
+
+        self.queue = queue.Queue(maxsize=max_queue)
+        self._stop_token = object()
+        self._lock = threading.Lock()
+
+        # Counters (read them via snapshot())
+        self.stats = {
+            "turns_queued": 0,
+            "turns_dropped": 0,
+            "extraction_calls": 0,
+            "calls_saved": 0,   # Turns that rode along in someone else's batch
+            "facts_applied": 0,
+            "errors": 0,
+        }
+
+        self._thread = threading.Thread(target=self._run, name="enjo-subconscious", daemon=True)
+        self._thread.start()
+
+    # --- PRODUCER SIDE (Brain.think) ---
+    def submit(self, user_text):
+        """Queues a turn for analysis. Never blocks the conversation."""
+        if not user_text:
+            return
+
+        while True:
+            try:
+                self.queue.put_nowait(user_text)
+                self._bump("turns_queued")
+                return
+            except queue.Full:
+                # Backlog is full: forget the OLDEST pending turn, keep the fresh one
+                try:
+                    self.queue.get_nowait()
+                    self.queue.task_done()
+                    self._bump("turns_dropped")
+                except queue.Empty:
+                    pass
+
+    def flush(self, timeout=None):
+        """
+        Blocks until every queued turn has been analysed and applied.
+        Returns False if the timeout ran out first.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        with self.queue.all_tasks_done:
+            while self.queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self.queue.all_tasks_done.wait(remaining)
+        return True
+
+    def stop(self, timeout=5.0):
+        """Drains pending turns, then shuts the thread down (used at shutdown)."""
+        self.flush(timeout)
+        if self._thread.is_alive():
+            self.queue.put(self._stop_token)
+            self._thread.join(timeout)
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self.stats)
+
+    # --- CONSUMER SIDE (Worker thread) ---
+    def _bump(self, key, amount=1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def _collect_batch(self):
+        first = self.queue.get()
+        if first is self._stop_token:
+            return None
+
+        # Give the user a moment to keep talking, then take everything pending
+        batch = [first]
+        deadline = time.time() + self.batch_window
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            try:
+                item = self.queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is self._stop_token:
+                # Finish this batch first, then stop on the next loop
+                self.queue.task_done()
+                self.queue.put(item)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect_batch()
+            if batch is None:
+                self.queue.task_done()
+                return
+
+            try:
+                self._process(batch)
+            except Exception as e:
+                self._bump("errors")
+                print(f"\n>> Subconscious: Batch failed ({e})")
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+    def _process(self, batch):
+        if len(batch) == 1:
+            prompt = self.subconscious.get_analysis_prompt(batch[0])
+        else:
+            prompt = self.subconscious.get_batch_analysis_prompt(batch)
+
+        self._bump("extraction_calls")
+        self._bump("calls_saved", len(batch) - 1)
+
+        raw_analysis = self.generate_fn(prompt)
+        if not raw_analysis:
+            return
+
+        new_facts = self.subconscious.parse_result(raw_analysis)
+        if self.observe_fn:
+            self.observe_fn(batch, new_facts)
+        if new_facts:
+            self.apply_fn(new_facts)
+            self._bump("facts_applied", len(new_facts))
@@ -2,8 +2,11 @@ import os
 import ctypes
 import subprocess
 
-# Audio libraries
-from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+from src.utils.boot import lazy_import
+from src.utils.telemetry import Telemetry
+
+# Audio libraries (COM bindings load on the first volume command)
+pycaw = lazy_import("pycaw.pycaw")
 
 class DesktopController:
     def __init__(self):
@@ -20,12 +23,13 @@ class DesktopController:
         if target:
             target = target.lower()
 
-        if command == "open":
-            return self._open_app(target)
-        elif command == "system":
-            return self._system_cmd(target)
-        elif command == "volume":
-            return self._volume_control(target)
+        with Telemetry.get().span("hands.execute", command=command):
+            if command == "open":
+                return self._open_app(target)
+            elif command == "system":
+                return self._system_cmd(target)
+            elif command == "volume":
+                return self._volume_control(target)
 
         return ">> Error: Unknown Hand Command."
 
@@ -69,14 +73,16 @@ class DesktopController:
 
     def _volume_control(self, level):
         try:
-            devices = AudioUtilities.GetSpeakers()
-            interface = devices.Activate(IAudioEndpointVolume._iid_, clsctx=ctypes.CLSCTX_ALL, activation_params=None)
-            volume = ctypes.cast(interface, ctypes.POINTER(IAudioEndpointVolume))
+            devices = pycaw.AudioUtilities.GetSpeakers()
+            interface = devices.Activate(pycaw.IAudioEndpointVolume._iid_, clsctx=ctypes.CLSCTX_ALL, activation_params=None)
+            volume = ctypes.cast(interface, ctypes.POINTER(pycaw.IAudioEndpointVolume))
 
-            if level == "mute":
-                current = volume.GetMute()
-                volume.SetMute(not current, None) # Toggle
-                return "Volume Muted/Unmuted."
+            if level in ("mute", "unmute"):
+                # Explicit states, not a toggle: "unmute" must never mute the speakers
+                muted = level == "mute"
+                if volume.GetMute() != muted:
+                    volume.SetMute(muted, None)
+                return "Volume Muted." if muted else "Volume Unmuted."
 
             if level == "max":
                 volume.SetMasterVolumeLevelScalar(1.0, None)
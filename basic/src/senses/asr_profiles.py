@@ -0,0 +1,95 @@
+# src/senses/asr_profiles.py
+from src.utils.boot import lazy_import
+from src.utils.config_manager import ConfigManager
+
+faster_whisper = lazy_import("faster_whisper")
+
+# Fallback when data/config.json has no "ears.profiles" section.
+# "default" is the original hard-coded setup (base.en, beam 5).
+FULL_FALLBACK = [0.0, 0.2, 0.4, 0.6, 0.8, 1.0]
+DEFAULT_PROFILES = {
+    "default": {"model": "base.en", "compute_type": "int8", "beam_size": 5, "vad_filter": False,
+                "temperature": FULL_FALLBACK},
+    "fast": {"model": "tiny.en", "compute_type": "int8", "beam_size": 1, "vad_filter": True,
+             "temperature": [0.0]},
+    "balanced": {"model": "base.en", "compute_type": "int8", "beam_size": 1, "vad_filter": True,
+                 "temperature": [0.0, 0.4, 0.8]},
+    "accurate": {"model": "small.en", "compute_type": "int8", "beam_size": 5, "vad_filter": True,
+                 "temperature": FULL_FALLBACK},
+}
+
+
+class ASRProfile:
+    """
+    One named Whisper setup, picked with "ears.profile" in data/config.json.
+
+      model, device, compute_type   which weights and how they are stored (int8 = fastest on CPU)
+      cpu_threads, num_workers      CTranslate2 threading (cpu_threads 0 = library default)
+      beam_size                     1 = greedy (fastest), 5 = more accurate
+      vad_filter                    drop silence before decoding
+      temperature                   fallback ladder; [0.0] never re-decodes a bad segment
+
+    Use benchmarks/bench_asr_profiles.py to pick one for a given machine.
+    """
+
+    def __init__(self, name="default", model="base.en", device="cpu", compute_type="int8", cpu_threads=0,
+                 num_workers=1, beam_size=5, vad_filter=False, temperature=None):
+        self.name = name
+        self.model = model
+        self.device = device
+        self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
+        self.num_workers = num_workers
+        self.beam_size = beam_size
+        self.vad_filter = vad_filter
+        self.temperature = list(temperature) if temperature is not None else list(FULL_FALLBACK)
+
+    @staticmethod
+    def profiles(conf=None):
+        conf = ConfigManager.load_config().get("ears", {}) if conf is None else conf
+        return conf.get("profiles") or DEFAULT_PROFILES
+
+    @classmethod
+    def from_config(cls, name=None, conf=None, **overrides):
+        """The named profile (default: "ears.profile"), with optional field overrides."""
+        conf = ConfigManager.load_config().get("ears", {}) if conf is None else conf
+        profiles = cls.profiles(conf)
+        name = name or conf.get("profile", "default")
+        if name not in profiles:
+            print(f">> Ears: Unknown ASR profile '{name}', falling back to 'default'.")
+            name = "default"
+        settings = dict(profiles.get(name) or DEFAULT_PROFILES["default"])
+        settings.update(overrides)
+        return cls(name=name, **settings)
+
+    def load_model(self):
+        """The one place a WhisperModel gets built (Ears, benchmarks, batch transcription)."""
+        return faster_whisper.WhisperModel(
+            self.model,
+            device=self.device,
+            compute_type=self.compute_type,
+            cpu_threads=self.cpu_threads,
+            num_workers=self.num_workers,
+        )
+
+    def transcribe(self, model, audio, prompt=None, partial=False):
+        """
+        audio: float32 samples at 16 kHz or a file path. Returns (text, info).
+        Partials (streaming hypotheses) are thrown away anyway, so they are
+        always greedy and never fall back to higher temperatures.
+        """
+        segments, info = model.transcribe(
+            audio,
+            beam_size=1 if partial else self.beam_size,
+            temperature=0.0 if partial else self.temperature,
+            vad_filter=self.vad_filter,
+            initial_prompt=prompt or None,
+        )
+        # segments is lazy: decoding happens here
+        return " ".join(segment.text for segment in segments).strip(), info
+
+    def describe(self):
+        return {
+            "model": self.model, "compute_type": self.compute_type, "cpu_threads": self.cpu_threads,
+            "beam_size": self.beam_size, "vad_filter": self.vad_filter, "temperature": self.temperature,
+        }
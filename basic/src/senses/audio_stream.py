@@ -0,0 +1,345 @@
+# src/senses/audio_stream.py
+import threading
+import time
+import wave
+
+import numpy as np
+import speech_recognition as sr
+
+# Captured straight at Whisper's rate, so no resampling between mic and model
+SAMPLE_RATE = 16000
+FRAME_MS = 30
+FRAME_SAMPLES = SAMPLE_RATE * FRAME_MS // 1000
+
+
+def resample(samples, rate, target=SAMPLE_RATE):
+    """
+    Band-limited resampling through the spectrum (same idea as scipy.signal.resample).
+    Everything above the target's Nyquist is dropped instead of folding back
+    into the speech band, which is what audioop.ratecv / np.interp do.
+    Returns float32 in the input's scale.
+    """
+    samples = np.asarray(samples, dtype=np.float32)
+    if rate == target or not len(samples):
+        return samples
+    length = int(round(len(samples) * target / rate))
+    return (np.fft.irfft(np.fft.rfft(samples), length) * (length / len(samples))).astype(np.float32)
+
+
+class RingBuffer:
+    """
+    Fixed-size int16 ring addressed by absolute sample index.
+    The capture thread appends, the decoder reads any range still held.
+    """
+
+    def __init__(self, seconds=60.0, sample_rate=SAMPLE_RATE):
+        self.capacity = int(seconds * sample_rate)
+        self.total = 0  # Samples ever written
+        self._data = np.zeros(self.capacity, dtype=np.int16)
+        self._lock = threading.Lock()
+
+    def write(self, samples):
+        n = len(samples)
+        with self._lock:
+            if n > self.capacity:
+                self.total += n - self.capacity
+                samples, n = samples[-self.capacity:], self.capacity
+            i = self.total % self.capacity
+            first = min(n, self.capacity - i)
+            self._data[i:i + first] = samples[:first]
+            self._data[:n - first] = samples[first:]
+            self.total += n
+
+    def read(self, start, end):
+        """Samples [start, end) as a copy, clipped to what is still in the ring."""
+        with self._lock:
+            start = max(start, self.total - self.capacity, 0)
+            end = min(end, self.total)
+            if end <= start:
+                return np.zeros(0, dtype=np.int16)
+            i = start % self.capacity
+            n = end - start
+            if i + n <= self.capacity:
+                return self._data[i:i + n].copy()
+            return np.concatenate((self._data[i:], self._data[:n - (self.capacity - i)]))
+
+
+# --- SOURCES (anything with open / read -> int16 frame or None / close) ---
+class MicrophoneSource:
+    """Live capture through speech_recognition's PyAudio stream, opened at 16 kHz."""
+
+    def __init__(self, device_index=None):
+        self.mic = sr.Microphone(device_index=device_index, sample_rate=SAMPLE_RATE, chunk_size=FRAME_SAMPLES)
+
+    def open(self):
+        self.mic.__enter__()
+
+    def read(self):
+        return np.frombuffer(self.mic.stream.read(FRAME_SAMPLES), dtype=np.int16)
+
+    def close(self):
+        self.mic.__exit__(None, None, None)
+
+
+class WavFileSource:
+    """
+    Fake microphone: plays a WAV file (or an int16 array) frame by frame,
+    paced like a real mic unless realtime=False, then trailing silence so the
+    VAD sees the end of speech. audio_end_at is when the last real sample
+    was delivered (perf_counter), for latency measurements.
+    """
+
+    def __init__(self, path=None, samples=None, sample_rate=SAMPLE_RATE, realtime=True, trailing_silence_s=1.5):
+        if path is not None:
+            samples, sample_rate = self._load(path)
+        if sample_rate != SAMPLE_RATE:
+            samples = np.clip(resample(samples, sample_rate), -32768, 32767).astype(np.int16)
+
+        self.speech_samples = len(samples)
+        self.samples = np.concatenate((np.asarray(samples, dtype=np.int16),
+                                       np.zeros(int(trailing_silence_s * SAMPLE_RATE), dtype=np.int16)))
+        self.realtime = realtime
+        self.audio_end_at = None
+        self._pos = 0
+        self._started = None
+
+    @staticmethod
+    def _load(path):
+        with wave.open(path, "rb") as f:
+            width, channels, rate = f.getsampwidth(), f.getnchannels(), f.getframerate()
+            raw = f.readframes(f.getnframes())
+        if width == 1:
+            data = (np.frombuffer(raw, dtype=np.uint8).astype(np.int16) - 128) << 8
+        elif width == 2:
+            data = np.frombuffer(raw, dtype=np.int16)
+        elif width == 4:
+            data = (np.frombuffer(raw, dtype=np.int32) >> 16).astype(np.int16)
+        else:
+            raise ValueError(f"Unsupported WAV sample width: {width} bytes")
+        if channels > 1:
+            data = data.reshape(-1, channels).mean(axis=1).astype(np.int16)
+        return data, rate
+
+    @property
+    def duration(self):
+        return self.speech_samples / SAMPLE_RATE
+
+    def open(self):
+        self._pos = 0
+        self.audio_end_at = None
+        self._started = time.perf_counter()
+
+    def read(self):
+        if self._pos >= len(self.samples):
+            return None
+        frame = self.samples[self._pos:self._pos + FRAME_SAMPLES]
+        self._pos += len(frame)
+
+        if self.realtime:
+            delay = self._started + self._pos / SAMPLE_RATE - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        if self.audio_end_at is None and self._pos >= self.speech_samples:
+            self.audio_end_at = time.perf_counter()
+        return frame
+
+    def close(self):
+        pass
+
+
+class EnergyVAD:
+    """
+    Frame-level RMS gate with hysteresis. `threshold` is in the same units as
+    sr.Recognizer.energy_threshold (RMS of int16 samples), so the ambient
+    calibration carries over.
+    """
+
+    def __init__(self, threshold=400, start_ms=90, end_silence_ms=700):
+        self.threshold = threshold
+        self.start_frames = max(1, start_ms // FRAME_MS)
+        self.end_frames = max(1, end_silence_ms // FRAME_MS)
+        self.reset()
+
+    def reset(self):
+        self.in_speech = False
+        self._voiced = 0
+        self._silent = 0
+
+    def process(self, frame):
+        """-> (event, voiced). event is "start", "end" or None."""
+        voiced = bool(len(frame)) and float(np.sqrt(np.mean(frame.astype(np.float32) ** 2))) >= self.threshold
+
+        if not self.in_speech:
+            self._voiced = self._voiced + 1 if voiced else 0
+            if self._voiced >= self.start_frames:
+                self.in_speech, self._silent = True, 0
+                return "start", voiced
+        else:
+            self._silent = 0 if voiced else self._silent + 1
+            if self._silent >= self.end_frames:
+                self.in_speech, self._voiced = False, 0
+                return "end", voiced
+        return None, voiced
+
+
+class StreamingTranscriber:
+    """
+    Capture thread -> ring buffer -> VAD, while the caller's thread decodes.
+
+    Audio since the last commit is the "tail". Once the tail is longer than
+    chunk_s and the speaker pauses (or it reaches max_chunk_s), it is decoded
+    for good and committed. In between, the tail is re-decoded every
+    partial_s as a throwaway hypothesis. At end of speech only the last tail
+    is left to decode, so the final text lands shortly after the user stops.
+
+        for event in StreamingTranscriber(source, transcribe).stream():
+            event -> {"type": "partial" | "final", "text": ...}
+
+    transcribe(samples_float32, prompt, partial) -> text. `prompt` is the
+    committed text so far (keeps Whisper's context across chunks).
+    chunk_s / max_chunk_s / partial_s = None switch the matching step off;
+    all three off is plain record-then-transcribe.
+    """
+
+    def __init__(self, source, transcribe, vad=None, threshold=400, end_silence_ms=700, chunk_s=2.0,
+                 max_chunk_s=6.0, partial_s=0.6, pause_ms=180, pre_roll_ms=300, timeout=5.0,
+                 phrase_time_limit=30.0):
+        self.source = source
+        self.transcribe = transcribe
+        self.vad = vad or EnergyVAD(threshold=threshold, end_silence_ms=end_silence_ms)
+        self.ring = RingBuffer(seconds=phrase_time_limit + 5.0)
+
+        self.chunk = int(chunk_s * SAMPLE_RATE) if chunk_s else None
+        self.max_chunk = int(max_chunk_s * SAMPLE_RATE) if max_chunk_s else None
+        self.min_partial = SAMPLE_RATE // 2  # Whisper guesses wildly on less than half a second
+        self.partial_s = partial_s
+        self.pause_frames = max(1, pause_ms // FRAME_MS)
+        self.pre_roll = pre_roll_ms * SAMPLE_RATE // 1000
+        self.timeout = int(timeout * SAMPLE_RATE)
+        self.phrase_limit = int(phrase_time_limit * SAMPLE_RATE)
+
+        self.stats = {"decodes": 0, "commits": 0, "decode_s": 0.0, "audio_s": 0.0, "finalize_s": None}
+
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._speech_start = None
+        self._speech_end = None
+        self._speech_end_at = None  # perf_counter() when end of speech was detected
+        self._last_pause = None     # Sample index inside the latest pause, a clean place to cut
+        self._done = False
+
+    # --- CAPTURE THREAD ---
+    def _capture(self):
+        silent_run = 0
+        frame_len = FRAME_SAMPLES
+        try:
+            self.source.open()
+            while not self._stop.is_set():
+                frame = self.source.read()
+                if frame is None:
+                    break
+                frame_len = len(frame) or frame_len
+                self.ring.write(frame)
+                pos = self.ring.total
+                event, voiced = self.vad.process(frame)
+
+                with self._cond:
+                    if self._speech_start is None:
+                        if event == "start":
+                            onset = pos - self.vad.start_frames * frame_len
+                            self._speech_start = max(0, onset - self.pre_roll)
+                        elif pos >= self.timeout:
+                            break
+                    else:
+                        silent_run = 0 if voiced else silent_run + 1
+                        if silent_run == self.pause_frames:
+                            self._last_pause = pos - (self.pause_frames * frame_len) // 2
+                        if event == "end" or pos - self._speech_start >= self.phrase_limit:
+                            # Keep one short pause of trailing silence, drop the rest
+                            trailing = max(0, silent_run - self.pause_frames) * frame_len
+                            self._speech_end = pos - trailing
+                            self._speech_end_at = time.perf_counter()
+                            break
+                    self._cond.notify_all()
+        except Exception as e:
+            print(f">> Ears: Capture failed ({e})")
+        finally:
+            try:
+                self.source.close()
+            except Exception:
+                pass
+            with self._cond:
+                if self._speech_start is not None and self._speech_end is None:
+                    self._speech_end = self.ring.total  # Source ran dry mid-sentence
+                    self._speech_end_at = time.perf_counter()
+                self._done = True
+                self._cond.notify_all()
+
+    # --- DECODER (caller's thread) ---
+    def _decode(self, start, end, prompt, partial):
+        samples = self.ring.read(start, end).astype(np.float32) / 32768.0
+        started = time.perf_counter()
+        text = (self.transcribe(samples, prompt, partial) or "").strip()
+        self.stats["decodes"] += 1
+        self.stats["decode_s"] += time.perf_counter() - started
+        return text
+
+    def stream(self):
+        capture = threading.Thread(target=self._capture, daemon=True)
+        capture.start()
+
+        committed = []
+        commit_pos = None
+        last_partial_at = 0.0
+        last_partial_end = None
+        seen = -1
+        try:
+            while True:
+                with self._cond:
+                    self._cond.wait_for(lambda: self._done or self.ring.total != seen, timeout=0.1)
+                    start, end, pause = self._speech_start, self._speech_end, self._last_pause
+                    total, done = self.ring.total, self._done
+                seen = total
+
+                if start is None:
+                    if done:  # Nobody spoke before the timeout
+                        yield {"type": "final", "text": ""}
+                        return
+                    continue
+                if commit_pos is None:
+                    commit_pos = start
+                prompt = " ".join(committed)
+
+                # 1. End of speech: only the tail is left to decode
+                if end is not None:
+                    tail = self._decode(commit_pos, end, prompt, partial=False) if end > commit_pos else ""
+                    self.stats["audio_s"] = round((end - start) / SAMPLE_RATE, 3)
+                    self.stats["finalize_s"] = round(time.perf_counter() - self._speech_end_at, 6)
+                    yield {"type": "final", "text": " ".join(t for t in committed + [tail] if t)}
+                    return
+
+                # 2. Commit a stable chunk, cut at a pause when there is one
+                cut = None
+                if self.chunk and pause is not None and pause - commit_pos >= self.chunk:
+                    cut = pause
+                elif self.max_chunk and total - commit_pos >= self.max_chunk:
+                    cut = total
+                if cut is not None:
+                    text = self._decode(commit_pos, cut, prompt, partial=False)
+                    if text:
+                        committed.append(text)
+                    commit_pos = cut
+                    self.stats["commits"] += 1
+                    yield {"type": "partial", "text": " ".join(committed)}
+                    continue
+
+                # 3. Throwaway hypothesis for the uncommitted tail
+                now = time.perf_counter()
+                if (self.partial_s and now - last_partial_at >= self.partial_s and total - commit_pos >= self.min_partial
+                        and total != last_partial_end):
+                    hypothesis = self._decode(commit_pos, total, prompt, partial=True)
+                    last_partial_at, last_partial_end = time.perf_counter(), total
+                    yield {"type": "partial", "text": " ".join(t for t in committed + [hypothesis] if t)}
+        finally:
+            self._stop.set()
+            capture.join(timeout=1.0)
@@ -0,0 +1,205 @@
+# src/senses/batch_transcriber.py
+import json
+import multiprocessing
+import os
+import time
+import wave
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from src.senses.asr_profiles import ASRProfile
+from src.utils.boot import lazy_import
+
+sf = lazy_import("soundfile")
+
+AUDIO_EXTENSIONS = (".wav", ".flac", ".mp3", ".ogg", ".m4a")
+
+
+def available_cores():
+    try:
+        return len(os.sched_getaffinity(0))  # Respects taskset / container CPU limits (Linux)
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+# --- JOB LIST ---
+def collect_audio(inputs):
+    """Directories (recursive), .jsonl manifests ({"audio": path}), .txt lists or plain audio files."""
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            for root, _, files in os.walk(item):
+                paths += [os.path.join(root, f) for f in sorted(files) if f.lower().endswith(AUDIO_EXTENSIONS)]
+        elif item.endswith((".jsonl", ".txt")):
+            base = os.path.dirname(os.path.abspath(item))
+            with open(item, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    path = json.loads(line)["audio"] if item.endswith(".jsonl") else line
+                    paths.append(path if os.path.isabs(path) else os.path.join(base, path))
+        else:
+            paths.append(item)
+    return paths
+
+
+def audio_duration(path):
+    """Seconds of audio from the file header (no decoding). 0.0 if unknown."""
+    try:
+        if path.lower().endswith(".wav"):
+            with wave.open(path, "rb") as f:
+                return f.getnframes() / f.getframerate()
+        return sf.info(path).duration
+    except Exception:
+        return 0.0
+
+
+def load_checkpoint(output_path):
+    """Audio already transcribed OK in a previous run (the output file is the checkpoint)."""
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+    with open(output_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                row = json.loads(line)
+            except ValueError:
+                continue  # Half-written last line from a killed run
+            if row.get("status") == "ok":
+                done.add(_key(row["audio"]))
+    return done
+
+
+def _ends_mid_line(path):
+    """True when a killed run left a half-written last line (appending would glue onto it)."""
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return False
+    with open(path, 'rb') as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) != b"\n"
+
+
+def _key(path):
+    return os.path.normcase(os.path.abspath(path))
+
+
+# --- WORKER PROCESS ---
+class WhisperWorker:
+    """One WhisperModel per process, built from an ASR profile."""
+
+    def __init__(self, profile=None, cpu_threads=1):
+        self.asr = ASRProfile.from_config(profile, cpu_threads=cpu_threads, num_workers=1)
+        self.model = self.asr.load_model()
+
+    def __call__(self, path):
+        text, info = self.asr.transcribe(self.model, path)
+        return {"text": text, "language": info.language}
+
+
+_worker = None
+
+
+def _init_worker(factory, args, cpu_threads):
+    global _worker
+    # Keep OpenMP / BLAS from spawning one thread per core in EVERY worker
+    for var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ[var] = str(cpu_threads)
+    _worker = factory(*args)
+
+
+def _run_job(path, duration):
+    started = time.perf_counter()
+    row = {"audio": path, "duration_s": round(duration, 3)}
+    try:
+        row.update(_worker(path))
+        row["status"] = "ok"
+    except Exception as e:
+        row.update(status="error", error=f"{type(e).__name__}: {e}")
+    row["decode_s"] = round(time.perf_counter() - started, 3)
+    row["worker"] = os.getpid()
+    return row
+
+
+def _failed_row(path, duration, error):
+    """Row for a job the pool could not run (worker crashed, result lost)."""
+    return {"audio": path, "duration_s": round(duration, 3), "status": "error",
+            "error": f"{type(error).__name__}: {error}", "decode_s": None, "worker": None}
+
+
+class BatchTranscriber:
+    """
+    Transcribes many files on a process pool (one model per process).
+
+    Jobs are submitted longest-first so a long recording never starts last
+    and holds up the whole batch. Every result is appended to the JSONL
+    output as soon as it finishes; re-running with the same output skips the
+    files already done, so an interrupted batch resumes where it stopped.
+
+    cpu_threads defaults to cores // workers, so the pool uses every core
+    without oversubscribing them.
+    """
+
+    def __init__(self, profile=None, workers=None, cpu_threads=None, worker_factory=WhisperWorker, worker_args=None):
+        cores = available_cores()
+        self.workers = workers or cores
+        self.cpu_threads = cpu_threads or max(1, cores // self.workers)
+        self.worker_factory = worker_factory
+        self.worker_args = worker_args if worker_args is not None else (profile, self.cpu_threads)
+
+    def run(self, paths, output_path, resume=True, progress=True):
+        done = load_checkpoint(output_path) if resume else set()
+        jobs = [(path, audio_duration(path)) for path in paths if _key(path) not in done]
+        jobs.sort(key=lambda job: job[1], reverse=True)
+
+        summary = {"files": len(jobs), "skipped": len(paths) - len(jobs), "ok": 0, "errors": 0, "pool_broken": False,
+                   "audio_s": 0.0, "wall_s": 0.0, "workers": self.workers, "cpu_threads": self.cpu_threads}
+        if not jobs:
+            return summary
+
+        print(f">> Batch: {len(jobs)} files ({summary['skipped']} already done), "
+              f"{self.workers} workers x {self.cpu_threads} threads")
+        started = time.perf_counter()
+        # 'spawn': workers never inherit a half-initialised OpenMP runtime (and it is the only option on Windows)
+        context = multiprocessing.get_context("spawn")
+        mode = 'a' if resume else 'w'
+        broken_tail = resume and _ends_mid_line(output_path)
+        with open(output_path, mode, encoding='utf-8') as out, ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self.worker_factory, self.worker_args, self.cpu_threads),
+        ) as pool:
+            if broken_tail:
+                out.write("\n")
+            futures = {pool.submit(_run_job, path, duration): (path, duration) for path, duration in jobs}
+            for i, future in enumerate(as_completed(futures), 1):
+                try:
+                    row = future.result()
+                except BrokenProcessPool as e:
+                    # A worker died (OOM, native crash, failed model load): every job still
+                    # in the pool is lost. Record them as errors so a resume retries them.
+                    if not summary["pool_broken"]:
+                        summary["pool_broken"] = True
+                        print(f"\n!! Batch: worker pool broke ({e or 'a worker process died'})")
+                    row = _failed_row(*futures[future], e)
+                except Exception as e:
+                    row = _failed_row(*futures[future], e)
+                out.write(json.dumps(row, ensure_ascii=False) + "\n")
+                out.flush()  # The output file doubles as the resume checkpoint
+
+                if row["status"] == "ok":
+                    summary["ok"] += 1
+                    summary["audio_s"] += row["duration_s"]  # Throughput counts transcribed audio only
+                else:
+                    summary["errors"] += 1
+                if progress:
+                    elapsed = time.perf_counter() - started
+                    print(f"\r>> Batch: {i}/{len(jobs)} | {summary['audio_s'] / elapsed:.1f} audio-s/s", end="", flush=True)
+
+        summary["wall_s"] = round(time.perf_counter() - started, 3)
+        summary["audio_s"] = round(summary["audio_s"], 3)
+        summary["speed_x"] = round(summary["audio_s"] / summary["wall_s"], 2) if summary["wall_s"] else None
+        if progress:
+            print()
+        return summary
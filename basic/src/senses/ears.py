@@ -1,46 +1,109 @@
 import speech_recognition as sr
 import sys
 import os
-from faster_whisper import WhisperModel
+import json
+import time
+import numpy as np
+
+from src.senses.asr_profiles import ASRProfile
+from src.senses.audio_stream import MicrophoneSource, StreamingTranscriber, resample
+from src.utils.config_manager import ConfigManager
+from src.utils.telemetry import Telemetry
+
+# Whisper models are trained on 16 kHz mono audio
+WHISPER_SAMPLE_RATE = 16000
+
+
+def audio_to_float32(audio):
+    """
+    sr.AudioData -> float32 samples in [-1, 1] at 16 kHz, entirely in memory:
+    no WAV encode, no temp file, no decode on the Whisper side.
+    The mic already captures at 16 kHz; anything else goes through the
+    anti-aliased resampler (get_raw_data(convert_rate=...) is audioop.ratecv,
+    which aliases and is gone in Python 3.13).
+    """
+    pcm = np.frombuffer(audio.get_raw_data(convert_width=2), dtype=np.int16)
+    return resample(pcm.astype(np.float32) / 32768.0, audio.sample_rate, WHISPER_SAMPLE_RATE)
+
 
 class Ears:
-    def __init__(self):
+    def __init__(self, in_memory=True, streaming=None, profile=None):
         print(">> Ears: Initializing Neural Hearing (Faster-Whisper)...")
+        conf = ConfigManager.load_config().get("ears", {})
+
+        # Streaming: Whisper works through the phrase while the user is still talking
+        self.streaming = conf.get("streaming", False) if streaming is None else streaming
+        self.stream_conf = conf.get("stream", {})
 
         # 1. SETUP WHISPER (The Brain)
-        # Downloads 'base.en' (~80MB) automatically on first run.
+        # Model size, beam, threads etc. come from the "ears.profile" ASR profile.
+        # The model downloads automatically on first run ('base.en' is ~80MB).
+        self.asr = ASRProfile.from_config(profile, conf)
         try:
             # device="cpu" is compatible with everything.
-            # If you have an NVIDIA GPU, you can change to device="cuda".
-            self.model = WhisperModel("base.en", device="cpu", compute_type="int8")
-            print(">> Ears: Whisper Model Loaded.")
+            # If you have an NVIDIA GPU, set "device": "cuda" in the profile.
+            self.model = self.asr.load_model()
+            print(f">> Ears: Whisper Model Loaded ({self.asr.model}, profile '{self.asr.name}').")
         except Exception as e:
             print(f"!! CRITICAL: Whisper Load Failed. ({e})")
             self.model = None
 
+        # Cache path for temporary audio
+        self.base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.cache_dir = os.path.join(self.base_dir, "data")
+        self.temp_wav = os.path.join(self.cache_dir, "input_cache.wav")
+
         # 2. SETUP MIC (The Hardware) - Instant Load Optimization
         self.recognizer = sr.Recognizer()
         self.recognizer.dynamic_energy_threshold = False
         self.recognizer.energy_threshold = 400  # Adjust this if your room is noisy
 
+        # The ambient calibration costs a second of enforced silence, so it is saved and reused
+        self.calibration_path = os.path.join(self.cache_dir, "ears_calibration.json")
+        self.calibration_max_age = conf.get("calibration_max_age_h", 24) * 3600
+
         try:
-            self.mic = sr.Microphone()
-            with self.mic as source:
-                print(">> Ears: Calibrating ambient noise... (Silence please)")
-                self.recognizer.adjust_for_ambient_noise(source, duration=1.0)
-                print(">> Ears: Calibration complete. (Mic is HOT)")
+            self.mic = sr.Microphone(sample_rate=WHISPER_SAMPLE_RATE)  # Same as the streaming mic: no resampling
+            saved = self._load_calibration()
+            if saved is not None:
+                self.recognizer.energy_threshold = saved
+                print(f">> Ears: Reusing saved calibration (threshold {saved:.0f}). (Mic is HOT)")
+            else:
+                self.calibrate()
         except Exception as e:
             print(f"!! CRITICAL: No Microphone found. ({e})")
             self.mic = None
 
-        # Cache path for temporary audio
-        self.base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        self.cache_dir = os.path.join(self.base_dir, "data")
-        self.temp_wav = os.path.join(self.cache_dir, "input_cache.wav")
+        # Audio goes to Whisper as a NumPy array. The old temp-WAV path is kept
+        # (in_memory=False) for comparison benchmarks only.
+        self.in_memory = in_memory
+
+    def calibrate(self):
+        """Measures the room's noise floor and saves it for the next boots."""
+        with self.mic as source:
+            print(">> Ears: Calibrating ambient noise... (Silence please)")
+            self.recognizer.adjust_for_ambient_noise(source, duration=1.0)
+            print(">> Ears: Calibration complete. (Mic is HOT)")
+
+        try:
+            with open(self.calibration_path, 'w', encoding='utf-8') as f:
+                json.dump({"energy_threshold": self.recognizer.energy_threshold, "saved_at": time.time()}, f)
+        except Exception as e:
+            print(f">> Ears: Could not save calibration ({e})")
+
+    def _load_calibration(self):
+        try:
+            with open(self.calibration_path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except Exception:
+            return None  # First boot (or unreadable file): calibrate
+        if time.time() - saved.get("saved_at", 0) > self.calibration_max_age:
+            return None
+        return saved.get("energy_threshold")
 
     def listen(self):
         """
-        Listens via Mic, saves to temp wav, and runs Whisper locally.
+        Listens via Mic and runs Whisper locally on the in-memory samples.
         """
         try:
             # A. Visual Prompt
@@ -62,26 +125,25 @@ class Ears:
 
             print("   >>Listening...")
 
+            if self.streaming:
+                return self._listen_streaming()
+
             with self.mic as source:
                 try:
                     # Listen for audio (Timeouts prevent hanging forever)
-                    audio = self.recognizer.listen(source, timeout=5, phrase_time_limit=10)
+                    with Telemetry.get().span("ears.record"):
+                        audio = self.recognizer.listen(source, timeout=5, phrase_time_limit=10)
                 except sr.WaitTimeoutError:
                     print("   >> ❌ Silence.")
                     return None
 
             print("   >> 🧠 Dreaming (Transcribing)...")
 
-            # D. Save Raw Audio to Disk
-            with open(self.temp_wav, "wb") as f:
-                f.write(audio.get_wav_data())
-
-            # E. Run Whisper (The Magic)
-            # beam_size=5 is smarter/slower. 1 is fastest.
-            segments, info = self.model.transcribe(self.temp_wav, beam_size=5)
-
-            # Combine segments
-            full_text = " ".join([segment.text for segment in segments]).strip()
+            span = Telemetry.get().span("ears.transcribe", model=self.asr.model, profile=self.asr.name,
+                                        in_memory=self.in_memory)
+            with span:
+                full_text, info = self.transcribe(audio)
+                span.set(audio_s=round(info.duration, 3), chars=len(full_text))
 
             if not full_text:
                 print("   >> ❌ Heard nothing.")
@@ -89,14 +151,72 @@ class Ears:
 
             print(f"   >> 🗣️ Heard: {full_text}")
 
-            # Cleanup
-            if os.path.exists(self.temp_wav):
-                os.remove(self.temp_wav)
-
             return full_text
 
         except KeyboardInterrupt:
             return "exit"
         except Exception as e:
             print(f">> Ears Error: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    def _listen_streaming(self):
+        def show_partial(text):
+            print(f"\r   >> 🗣️ ...{text[-70:]}", end="", flush=True)
+
+        full_text = self.listen_stream(on_partial=show_partial)
+        print()
+        if not full_text:
+            print("   >> ❌ Silence.")
+            return None
+
+        print(f"   >> 🗣️ Heard: {full_text}")
+        return full_text
+
+    def listen_stream(self, source=None, on_partial=None):
+        """
+        Streams one utterance and returns the final text ("" on silence).
+        `source` defaults to the live mic; pass a WavFileSource to replay a
+        recording. Partial hypotheses go to on_partial(text) while the user talks.
+        """
+        streamer = StreamingTranscriber(
+            source or MicrophoneSource(),
+            self._transcribe_samples,
+            threshold=self.recognizer.energy_threshold,  # Same units as the ambient calibration
+            **self.stream_conf,
+        )
+
+        full_text = ""
+        with Telemetry.get().span("ears.stream", model=self.asr.model, profile=self.asr.name) as span:
+            for event in streamer.stream():
+                if event["type"] == "partial":
+                    if on_partial:
+                        on_partial(event["text"])
+                else:
+                    full_text = event["text"]
+            span.set(chars=len(full_text), **streamer.stats)
+        return full_text
+
+    def _transcribe_samples(self, samples, prompt="", partial=False):
+        """One chunk of the stream."""
+        return self.asr.transcribe(self.model, samples, prompt=prompt, partial=partial)[0]
+
+    def transcribe(self, audio):
+        """sr.AudioData -> (text, info)."""
+        if self.in_memory:
+            source = audio_to_float32(audio)
+        else:
+            # D. Save Raw Audio to Disk (legacy path)
+            with open(self.temp_wav, "wb") as f:
+                f.write(audio.get_wav_data())
+            source = self.temp_wav
+
+        try:
+            # E. Run Whisper (The Magic)
+            # Beam size and temperature fallback come from the ASR profile
+            full_text, info = self.asr.transcribe(self.model, source)
+        finally:
+            # Cleanup (even when nothing was heard)
+            if not self.in_memory and os.path.exists(self.temp_wav):
+                os.remove(self.temp_wav)
+
+        return full_text, info
\ No newline at end of file
@@ -1,15 +1,26 @@
 import os
+import queue
 import re
-import pygame
-import soundfile as sf
-from kokoro_onnx import Kokoro
+import threading
+import time
+from src.utils.boot import lazy_import
 from src.utils.config_manager import ConfigManager
+from src.utils.telemetry import Telemetry
+
+pygame = lazy_import("pygame")
+sf = lazy_import("soundfile")
+kokoro_onnx = lazy_import("kokoro_onnx")
 
 class Mouth:
     def __init__(self):
         print(">> Mouth: Initializing Kokoro Neural Engine...")
         self.config = ConfigManager.load_config()
 
+        # Streaming playback: sentences queue up here while the Brain keeps writing
+        self.speech_queue = queue.Queue()
+        self._speech_thread = None
+        self.first_audio_at = None  # perf_counter() when the current utterance became audible
+
         try:
             pygame.mixer.init()
         except Exception:
@@ -29,7 +40,7 @@ class Mouth:
                 self.active = False
                 return
 
-            self.kokoro = Kokoro(model_path, voices_path)
+            self.kokoro = kokoro_onnx.Kokoro(model_path, voices_path)
             self.default_voice = k_conf.get("default_voice", "af_bella")
             self.active = True
             print(">> Mouth: Online.")
@@ -75,6 +86,30 @@ class Mouth:
             text = re.sub(r'\b' + re.escape(word) + r'\b', phone, text, flags=re.IGNORECASE)
         return text
 
+    # --- STREAMING PLAYBACK ---
+    def begin_utterance(self):
+        """Resets the first-audio marker for a new reply."""
+        self.first_audio_at = None
+
+    def say(self, text):
+        """Non-blocking speak(): queues a sentence for the playback thread."""
+        if self._speech_thread is None:
+            self._speech_thread = threading.Thread(target=self._speech_loop, name="enjo-mouth", daemon=True)
+            self._speech_thread.start()
+        self.speech_queue.put(text)
+
+    def wait_until_done(self):
+        """Blocks until every queued sentence has been spoken."""
+        self.speech_queue.join()
+
+    def _speech_loop(self):
+        while True:
+            text = self.speech_queue.get()
+            try:
+                self.speak(text)
+            finally:
+                self.speech_queue.task_done()
+
     def speak(self, text):
         """Speaks the text using Kokoro TTS."""
         if not self.active or not text:
@@ -91,23 +126,29 @@ class Mouth:
             return
 
         try:
+            telemetry = Telemetry.get()
+
             # 3. Generate Audio
-            samples, sample_rate = self.kokoro.create(
-                final_text,
-                voice=self.default_voice,
-                speed=1.0,
-                lang="en-us"
-            )
+            with telemetry.span("mouth.synthesize", chars=len(final_text)):
+                samples, sample_rate = self.kokoro.create(
+                    final_text,
+                    voice=self.default_voice,
+                    speed=1.0,
+                    lang="en-us"
+                )
 
             # 4. Save & Play
             temp_path = "temp_speech.wav"
             sf.write(temp_path, samples, sample_rate)
 
-            pygame.mixer.music.load(temp_path)
-            pygame.mixer.music.play()
-            while pygame.mixer.music.get_busy():
-                pygame.time.Clock().tick(10)
-            pygame.mixer.music.unload()
+            with telemetry.span("mouth.playback", audio_s=round(len(samples) / sample_rate, 3)):
+                pygame.mixer.music.load(temp_path)
+                pygame.mixer.music.play()
+                if self.first_audio_at is None:
+                    self.first_audio_at = time.perf_counter()
+                while pygame.mixer.music.get_busy():
+                    pygame.time.Clock().tick(10)
+                pygame.mixer.music.unload()
 
             if os.path.exists(temp_path):
                 os.remove(temp_path)
@@ -0,0 +1,163 @@
+# src/server/app.py
+import asyncio
+import time
+from contextlib import aclosing
+
+from aiohttp import WSMsgType, web
+
+from src.server.sessions import ServerBusy, SessionManager, TurnScheduler
+
+
+class BrainServer:
+    """
+    HTTP + WebSocket front end for the Brain.
+
+      GET  /health                      -> provider health + server counters
+      POST /v1/sessions/{sid}/chat      -> {"text": ...} in, whole reply out
+      GET  /v1/sessions/{sid}/ws        -> send {"text": ...}, receive streamed events
+    """
+
+    def __init__(self, root_brain, sessions_dir, workers=8, max_queue=32, max_sessions=256):
+        self.root_brain = root_brain
+        self.sessions = SessionManager(root_brain, sessions_dir, max_sessions=max_sessions)
+        self.scheduler = TurnScheduler(workers=workers, max_queue=max_queue)
+        self._janitor = None
+
+    def build_app(self):
+        app = web.Application()
+        app.add_routes([
+            web.get("/health", self.handle_health),
+            web.post("/v1/sessions/{sid}/chat", self.handle_chat),
+            web.get("/v1/sessions/{sid}/ws", self.handle_ws),
+        ])
+        app.on_startup.append(self._on_startup)
+        app.on_cleanup.append(self._on_cleanup)
+        return app
+
+    # --- LIFECYCLE ---
+    async def _on_startup(self, app):
+        # Before the first request: otherwise every session's first turn waits on the SDK import
+        await asyncio.get_running_loop().run_in_executor(None, self.root_brain.warm_up)
+        self._janitor = asyncio.create_task(self._evict_loop())
+
+    async def _on_cleanup(self, app):
+        if self._janitor:
+            self._janitor.cancel()
+        await self.sessions.close_all()
+        self.scheduler.shutdown()
+        self.root_brain.shutdown()
+
+    async def _evict_loop(self):
+        while True:
+            await asyncio.sleep(60)
+            await self.sessions.evict_idle()
+
+    # --- TURN ---
+    async def _run_turn(self, sid, text):
+        """
+        Yields Brain events for one turn, then a final 'done' event.
+        Consume it inside aclosing(): if the consumer stops early, the turn
+        still runs to completion before the session lock is released.
+        """
+        session = await self.sessions.get(sid)
+        self.scheduler.admit()
+        started = time.perf_counter()
+        try:
+            async with session.lock:
+                provider = None
+                async with aclosing(self.scheduler.stream_turn(session.brain, text)) as events:
+                    async for event in events:
+                        yield event
+                stats = getattr(session.brain, "last_stream_stats", None) or {}
+                provider = stats.get("provider")
+                session.turns += 1
+        finally:
+            self.scheduler.release()
+
+        yield {
+            "type": "done",
+            "provider": provider,
+            "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+            "first_sentence_ms": round(stats["first_sentence_s"] * 1000, 1) if stats.get("first_sentence_s") else None,
+        }
+
+    # --- HANDLERS ---
+    async def handle_health(self, request):
+        return web.json_response({
+            "providers": self.root_brain.health.snapshot(),
+            "local_engine": self.root_brain.local_engine.status if self.root_brain.local_engine else "off",
+            "sessions": len(self.sessions.sessions),
+            "in_flight": self.scheduler.admitted,
+            "scheduler": self.scheduler.stats,
+        })
+
+    async def handle_chat(self, request):
+        sid = request.match_info["sid"]
+        try:
+            body = await request.json()
+            text = (body.get("text") or "").strip()
+        except Exception:
+            return web.json_response({"error": "Body must be JSON: {\"text\": ...}"}, status=400)
+        if not text:
+            return web.json_response({"error": "Empty text."}, status=400)
+
+        sentences, actions, errors, done = [], [], [], {}
+        try:
+            async with aclosing(self._run_turn(sid, text)) as events:
+                async for event in events:
+                    if event["type"] == "sentence":
+                        sentences.append(event["text"])
+                    elif event["type"] == "action":
+                        actions.append({"command": event["command"], "target": event["target"]})
+                    elif event["type"] == "error":
+                        errors.append(event["text"])
+                    elif event["type"] == "done":
+                        done = event
+        except ServerBusy as e:
+            return web.json_response({"error": str(e)}, status=503, headers={"Retry-After": "1"})
+        except ValueError as e:
+            return web.json_response({"error": str(e)}, status=400)
+
+        return web.json_response({
+            "reply": " ".join(sentences),
+            "actions": actions,
+            "errors": errors,
+            "provider": done.get("provider"),
+            "latency_ms": done.get("latency_ms"),
+        })
+
+    async def handle_ws(self, request):
+        sid = request.match_info["sid"]
+        ws = web.WebSocketResponse(heartbeat=30)
+        await ws.prepare(request)
+
+        async for msg in ws:
+            if msg.type != WSMsgType.TEXT:
+                if msg.type == WSMsgType.ERROR:
+                    break
+                continue
+            try:
+                text = (msg.json().get("text") or "").strip()
+            except Exception:
+                await ws.send_json({"type": "error", "text": "Send JSON: {\"text\": ...}"})
+                continue
+            if not text:
+                continue
+
+            try:
+                async with aclosing(self._run_turn(sid, text)) as events:
+                    async for event in events:
+                        if ws.closed:
+                            break  # Nobody to send to; the turn still completes and is remembered
+                        await ws.send_json(event)
+                if ws.closed:
+                    break
+            except ConnectionResetError:
+                break  # Client vanished mid-stream (same as above)
+            except ServerBusy as e:
+                await ws.send_json({"type": "busy", "text": str(e)})
+            except ValueError as e:
+                await ws.send_json({"type": "error", "text": str(e)})
+                break
+
+        return ws
@@ -0,0 +1,154 @@
+# src/server/sessions.py
+import asyncio
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.brain.memory import MemorySystem
+
+
+class ServerBusy(Exception):
+    """Raised when the turn queue is full (maps to HTTP 503 / a WS 'busy' event)."""
+
+
+class Session:
+    def __init__(self, session_id, brain):
+        self.session_id = session_id
+        self.brain = brain
+        self.lock = asyncio.Lock()   # One turn at a time per conversation (guards _update_memory)
+        self.last_seen = time.time()
+        self.turns = 0
+
+
+class SessionManager:
+    """
+    One Brain per conversation, spawned from a shared root Brain so that
+    clients, health probes and circuit breakers are shared while history and
+    profile live in data/sessions/<id>/.
+    """
+
+    _VALID_ID = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+
+    def __init__(self, root_brain, sessions_dir, max_sessions=256, idle_ttl=1800.0):
+        self.root_brain = root_brain
+        self.sessions_dir = sessions_dir
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self.sessions = {}
+        self._closing = {}  # session_id -> Future of a close still running on the executor
+        os.makedirs(self.sessions_dir, exist_ok=True)
+
+    async def get(self, session_id):
+        if not self._VALID_ID.match(session_id or ""):
+            raise ValueError("Session id must be 1-64 chars of [A-Za-z0-9_-].")
+
+        session = self.sessions.get(session_id)
+        if session is None:
+            await self._evict_if_full()
+            # Never reopen a conversation whose files are still being flushed
+            closing = self._closing.get(session_id)
+            if closing is not None:
+                await asyncio.shield(closing)
+            session = self.sessions.get(session_id)  # Another request may have opened it meanwhile
+            if session is None:
+                memory = MemorySystem(data_dir=os.path.join(self.sessions_dir, session_id))
+                session = Session(session_id, self.root_brain.spawn_session(memory))
+                self.sessions[session_id] = session
+
+        session.last_seen = time.time()
+        return session
+
+    async def evict_idle(self):
+        now = time.time()
+        for session_id, session in list(self.sessions.items()):
+            if now - session.last_seen > self.idle_ttl and not session.lock.locked():
+                await self._close(session_id)
+
+    async def close_all(self):
+        await asyncio.gather(*(self._close(session_id) for session_id in list(self.sessions)))
+
+    async def _evict_if_full(self):
+        if len(self.sessions) < self.max_sessions:
+            return
+        idle = [s for s in self.sessions.values() if not s.lock.locked()]
+        if not idle:
+            raise ServerBusy("Too many active sessions.")
+        oldest = min(idle, key=lambda s: s.last_seen)
+        await self._close(oldest.session_id)
+
+    async def _close(self, session_id):
+        session = self.sessions.pop(session_id, None)
+        if session is None:
+            return
+        # close_session drains the subconscious and flushes files: seconds, not microseconds
+        future = asyncio.get_running_loop().run_in_executor(None, self._close_blocking, session)
+        self._closing[session_id] = future
+        try:
+            await future
+        finally:
+            if self._closing.get(session_id) is future:
+                del self._closing[session_id]
+
+    @staticmethod
+    def _close_blocking(session):
+        session.brain.close_session()
+        session.brain.memory.close()
+
+
+class TurnScheduler:
+    """
+    Bounded worker pool in front of the providers.
+    At most `workers` turns run at once, at most `max_queue` more may wait;
+    anything beyond that is rejected immediately (backpressure) instead of
+    piling up latency for everyone.
+    """
+
+    def __init__(self, workers=8, max_queue=32):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="enjo-turn")
+        self.admitted = 0
+        self.stats = {"accepted": 0, "rejected": 0}
+
+    def admit(self):
+        if self.admitted >= self.workers + self.max_queue:
+            self.stats["rejected"] += 1
+            raise ServerBusy("Server busy, try again shortly.")
+        self.admitted += 1
+        self.stats["accepted"] += 1
+
+    def release(self):
+        self.admitted -= 1
+
+    async def stream_turn(self, brain, text):
+        """
+        Runs Brain.think_stream on a worker thread and yields its events on
+        the event loop as they are produced. Caller must admit() first.
+        """
+        loop = asyncio.get_running_loop()
+        events = asyncio.Queue()
+        done = object()
+
+        def produce():
+            try:
+                for event in brain.think_stream(text):
+                    loop.call_soon_threadsafe(events.put_nowait, event)
+            except Exception as e:
+                loop.call_soon_threadsafe(events.put_nowait, {"type": "error", "text": f">> Server Error: {e}"})
+            finally:
+                loop.call_soon_threadsafe(events.put_nowait, done)
+
+        future = loop.run_in_executor(self.executor, produce)
+        try:
+            while True:
+                event = await events.get()
+                if event is done:
+                    break
+                yield event
+        finally:
+            # Also on early close (client gone): the turn finishes before the caller moves on
+            await future
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
@@ -0,0 +1,150 @@
+import importlib
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class StartupProfile:
+    """
+    Boot timeline for --profile-startup: one row per organ, per organ module
+    import and per lazily imported SDK, with the organ that paid for it.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get():
+        with StartupProfile._lock:
+            if StartupProfile._instance is None:
+                StartupProfile._instance = StartupProfile()
+            return StartupProfile._instance
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.rows = []  # {"kind", "name", "organ", "start_s", "s"}
+        self._rows_lock = threading.Lock()
+        self._local = threading.local()  # Which organ the current thread is building
+
+    def record(self, kind, name, started, seconds):
+        row = {
+            "kind": kind,
+            "name": name,
+            "organ": getattr(self._local, "organ", None),
+            "start_s": round(started - self.started, 4),
+            "s": round(seconds, 4),
+        }
+        with self._rows_lock:
+            self.rows.append(row)
+
+    def organ(self, name):
+        return _OrganTimer(self, name)
+
+    def total(self):
+        with self._rows_lock:
+            ends = [r["start_s"] + r["s"] for r in self.rows if r["kind"] == "organ"]
+        return max(ends) if ends else 0.0
+
+    def report(self):
+        with self._rows_lock:
+            rows = sorted(self.rows, key=lambda r: (r["kind"] != "organ", r["start_s"]))
+
+        lines = [f">> BOOT: {self.total():.2f}s wall clock", f"   {'kind':<7}{'name':<28}{'organ':<8}{'start':>8}{'took':>8}"]
+        for r in rows:
+            lines.append(f"   {r['kind']:<7}{r['name']:<28}{(r['organ'] or '-'):<8}{r['start_s']:>7.2f}s{r['s']:>7.2f}s")
+        organ_sum = sum(r["s"] for r in rows if r["kind"] == "organ")
+        lines.append(f"   Organs one after another: {organ_sum:.2f}s | as booted: {self.total():.2f}s")
+        return "\n".join(lines)
+
+
+class _OrganTimer:
+    def __init__(self, profile, name):
+        self.profile = profile
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        self.profile._local.organ = self.name
+        return self
+
+    def __exit__(self, *exc):
+        self.profile.record("organ", self.name, self.started, time.perf_counter() - self.started)
+        self.profile._local.organ = None
+        return False
+
+
+class LazyModule:
+    """
+    Stands in for a heavy SDK module. The real import happens on the first
+    attribute access, so a provider that is never used is never loaded.
+
+        genai = lazy_import("google.genai")
+        client = genai.Client(...)   # <- google.genai is imported here
+    """
+
+    def __init__(self, name):
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+
+    def _load(self):
+        module = self.__dict__["_module"]
+        if module is None:
+            name = self.__dict__["_name"]
+            fresh = name not in sys.modules
+            started = time.perf_counter()
+            module = importlib.import_module(name)
+            if fresh:
+                StartupProfile.get().record("import", name, started, time.perf_counter() - started)
+            self.__dict__["_module"] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__["_module"] is not None else "not loaded"
+        return f"<lazy module '{self.__dict__['_name']}' ({state})>"
+
+
+def lazy_import(name):
+    return LazyModule(name)
+
+
+class OrganBoot:
+    """
+    Builds the organs concurrently on a thread pool. Each organ gets a
+    readiness Future, and get(name) blocks only until THAT organ is up. Boot
+    takes as long as the slowest organ instead of the sum of all of them.
+    """
+
+    def __init__(self, parallel=True, profile=None):
+        self.profile = profile or StartupProfile.get()
+        self._pool = ThreadPoolExecutor(max_workers=4 if parallel else 1, thread_name_prefix="boot")
+        self.futures = {}
+
+    def submit(self, name, module, class_name, *args, **kwargs):
+        """Imports `module` and builds `class_name(*args, **kwargs)` in the background."""
+        self.futures[name] = self._pool.submit(self._build, name, module, class_name, args, kwargs)
+        return self.futures[name]
+
+    def _build(self, name, module, class_name, args, kwargs):
+        with self.profile.organ(name):
+            fresh = module not in sys.modules
+            started = time.perf_counter()
+            loaded = importlib.import_module(module)
+            if fresh:
+                self.profile.record("module", module, started, time.perf_counter() - started)
+            return getattr(loaded, class_name)(*args, **kwargs)
+
+    def get(self, name, timeout=None):
+        """The organ, once ready. Re-raises whatever its constructor raised."""
+        return self.futures[name].result(timeout=timeout)
+
+    def ready(self, name):
+        return self.futures[name].done()
+
+    def wait_all(self):
+        for future in self.futures.values():
+            future.exception()  # Blocks; errors surface later through get()
+        self._pool.shutdown(wait=False)
@@ -23,4 +23,10 @@ class ConfigManager:
         with open(config_path, 'r', encoding='utf-8') as f:
             ConfigManager._config_cache = json.load(f)
 
-        return ConfigManager._config_cache
\ No newline at end of file
+        return ConfigManager._config_cache
+
+    @staticmethod
+    def reload():
+        """Drops the cache and re-reads config.json (e.g. after editing emotions)."""
+        ConfigManager._config_cache = None
+        return ConfigManager.load_config()
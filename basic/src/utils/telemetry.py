@@ -0,0 +1,210 @@
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.utils.config_manager import ConfigManager
+
+
+class _NullSpan:
+    """What span() hands out when telemetry is off: costs one attribute lookup."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **labels):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    def __init__(self, telemetry, stage, labels):
+        self.telemetry = telemetry
+        self.stage = stage
+        self.labels = labels
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.labels["error"] = exc_type.__name__
+        self.telemetry.record(self.stage, time.perf_counter() - self.started, **self.labels)
+        return False
+
+    def set(self, **labels):
+        """Attach labels discovered mid-span (e.g. response size)."""
+        self.labels.update(labels)
+
+
+class Telemetry:
+    """
+    Per-stage latency instrumentation (Ears -> Brain -> Mouth -> Hands).
+
+        with Telemetry.get().span("mouth.synthesize", chars=len(text)):
+            ...
+
+    Every finished turn becomes one line in a rotating JSONL file, and all
+    stages are aggregated into Prometheus-style histograms (text dump and an
+    optional /metrics endpoint). Disabled in data/config.json by default.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()  # Organs boot on parallel threads
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+    @staticmethod
+    def get():
+        """Singleton, configured from the 'telemetry' section of config.json."""
+        with Telemetry._instance_lock:
+            if Telemetry._instance is None:
+                conf = ConfigManager.load_config().get("telemetry", {})
+                Telemetry._instance = Telemetry(**conf)
+        return Telemetry._instance
+
+    def __init__(self, enabled=False, path="data/telemetry/turns.jsonl", max_bytes=5_000_000, backups=3,
+                 prometheus_path="data/telemetry/metrics.prom", prometheus_port=None):
+        self.enabled = enabled
+        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.path = os.path.join(base_dir, path) if path else None
+        self.prometheus_path = os.path.join(base_dir, prometheus_path) if prometheus_path else None
+        self.max_bytes = max_bytes
+        self.backups = backups
+
+        self._lock = threading.Lock()
+        self._turn = None
+        self._turn_count = 0
+        self._histograms = {}  # (stage, provider, model) -> [bucket_counts, count, sum]
+
+        if self.enabled and prometheus_port:
+            self._serve_metrics(prometheus_port)
+
+    # --- SPANS ---
+    def span(self, stage, **labels):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, stage, labels)
+
+    def record(self, stage, seconds, **labels):
+        if not self.enabled:
+            return
+        with self._lock:
+            if self._turn is not None:
+                self._turn["stages"].append({"stage": stage, "s": round(seconds, 6), **labels})
+            self._observe(stage, labels.get("provider", ""), labels.get("model", ""), seconds)
+
+    # --- TURNS ---
+    def begin_turn(self, **labels):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._turn_count += 1
+            self._turn = {"turn": self._turn_count, "ts": time.time(), "started": time.perf_counter(),
+                          "stages": [], **labels}
+
+    def end_turn(self, **labels):
+        if not self.enabled:
+            return
+        with self._lock:
+            turn, self._turn = self._turn, None
+        if turn is None:
+            return
+
+        turn["total_s"] = round(time.perf_counter() - turn.pop("started"), 6)
+        turn.update(labels)
+        self._write_jsonl(turn)
+        self.dump_prometheus()
+
+    # --- OUTPUT ---
+    def prometheus_text(self):
+        lines = [
+            "# HELP enjo_stage_seconds Latency of each ENJO pipeline stage.",
+            "# TYPE enjo_stage_seconds histogram",
+        ]
+        with self._lock:
+            items = sorted(self._histograms.items())
+            for (stage, provider, model), (buckets, count, total) in items:
+                base = f'stage="{stage}",provider="{provider}",model="{model}"'
+                cumulative = 0
+                for bound, hits in zip(self.BUCKETS, buckets):
+                    cumulative += hits
+                    lines.append(f'enjo_stage_seconds_bucket{{{base},le="{bound}"}} {cumulative}')
+                lines.append(f'enjo_stage_seconds_bucket{{{base},le="+Inf"}} {count}')
+                lines.append(f"enjo_stage_seconds_sum{{{base}}} {total:.6f}")
+                lines.append(f"enjo_stage_seconds_count{{{base}}} {count}")
+            lines.append(f"enjo_turns_total {self._turn_count}")
+        return "\n".join(lines) + "\n"
+
+    def dump_prometheus(self):
+        if not self.prometheus_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.prometheus_path), exist_ok=True)
+            tmp = self.prometheus_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(self.prometheus_text())
+            os.replace(tmp, self.prometheus_path)
+        except Exception as e:
+            print(f">> Telemetry Error: {e}")
+
+    # --- INTERNALS ---
+    def _observe(self, stage, provider, model, seconds):
+        key = (stage, provider, model)
+        if key not in self._histograms:
+            self._histograms[key] = [[0] * len(self.BUCKETS), 0, 0.0]
+        hist = self._histograms[key]
+        for i, bound in enumerate(self.BUCKETS):
+            if seconds <= bound:
+                hist[0][i] += 1
+                break
+        hist[1] += 1
+        hist[2] += seconds
+
+    def _write_jsonl(self, record):
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            if os.path.exists(self.path) and os.path.getsize(self.path) > self.max_bytes:
+                self._rotate()
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except Exception as e:
+            print(f">> Telemetry Error: {e}")
+
+    def _rotate(self):
+        if self.backups <= 0:
+            # No backups kept: start over, or the file would grow forever
+            open(self.path, "w").close()
+            return
+        # turns.jsonl -> turns.jsonl.1 -> ... -> turns.jsonl.<backups> (oldest dropped)
+        for i in range(self.backups, 0, -1):
+            src = self.path if i == 1 else f"{self.path}.{i - 1}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.path}.{i}")
+
+    def _serve_metrics(self, port):
+        telemetry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = telemetry.prometheus_text().encode("utf-8")
+                self.send_response(200 if self.path == "/metrics" else 404)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.end_headers()
+                if self.path == "/metrics":
+                    self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", port), MetricsHandler)
+        threading.Thread(target=server.serve_forever, name="enjo-metrics", daemon=True).start()
+        print(f">> Telemetry: Prometheus metrics on http://127.0.0.1:{port}/metrics")
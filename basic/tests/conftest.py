@@ -0,0 +1,50 @@
+# tests/conftest.py
+import contextlib
+import io
+import os
+import sys
+
+import pytest
+
+# Tests import the app the same way the entry points do: from the basic/ folder
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_providers import FakeGeminiClient, FakeGroqClient, FakeLocalEngine, LatencyModel  # noqa: E402
+
+pytest_plugins = ("aiohttp.pytest_plugin",)  # aiohttp_server / aiohttp_client fixtures, async tests
+
+
+@pytest.fixture
+def make_brain(tmp_path, monkeypatch):
+    """
+    Brain factory wired to the offline fakes (no keys, no network).
+    Keyword arguments override ModelConfig fields; clients can be swapped.
+    """
+    from src.brain import core
+    from src.brain.memory import MemorySystem
+
+    brains = []
+
+    def factory(gemini=None, groq=None, local=None, **config):
+        class Config(core.ModelConfig):
+            def __init__(self):
+                super().__init__()
+                self.gemini_key = self.groq_key = None
+                for name, value in config.items():
+                    setattr(self, name, value)
+
+        monkeypatch.setattr(core, "ModelConfig", Config)
+        with contextlib.redirect_stdout(io.StringIO()):
+            brain = core.Brain(
+                memory=MemorySystem(data_dir=str(tmp_path)),
+                gemini_client=gemini or FakeGeminiClient(LatencyModel(0.01, 0.0, seed=1)),
+                groq_client=groq or FakeGroqClient(LatencyModel(0.01, 0.0, seed=2)),
+                local_engine=local or FakeLocalEngine(LatencyModel(0.01, 0.0, seed=3)),
+            )
+        brains.append(brain)
+        return brain
+
+    yield factory
+    with contextlib.redirect_stdout(io.StringIO()):
+        for brain in brains:
+            brain.shutdown()
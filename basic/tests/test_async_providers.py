@@ -0,0 +1,168 @@
+# tests/test_async_providers.py
+"""AsyncProviderPool and Brain.athink against local stub HTTP servers."""
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from benchmarks.fake_providers import FakeGroqClient, LatencyModel
+from src.brain.async_providers import AsyncProviderPool, AsyncThreadedProvider
+from src.brain.model_loader import ModelConfig
+
+
+class StubProvider:
+    """
+    One aiohttp app speaking just enough Gemini, Groq (OpenAI) and Ollama.
+    `status` / `delay` per provider simulate outages and slow endpoints.
+    """
+
+    def __init__(self):
+        self.status = {"gemini": 200, "groq": 200, "local": 200}
+        self.delay = {"gemini": 0.0, "groq": 0.0, "local": 0.0}
+        self.calls = {"gemini": 0, "groq": 0, "local": 0}
+
+    def app(self):
+        app = web.Application()
+        app.router.add_post("/v1beta/models/{name}", self.gemini)
+        app.router.add_post("/openai/v1/chat/completions", self.groq)
+        app.router.add_get("/openai/v1/models", self.groq_models)
+        app.router.add_post("/api/chat", self.ollama)
+        app.router.add_get("/api/tags", self.ollama_tags)
+        return app
+
+    async def _answer(self, provider, body):
+        self.calls[provider] += 1
+        await asyncio.sleep(self.delay[provider])
+        if self.status[provider] != 200:
+            return web.json_response({"error": {"code": self.status[provider], "message": "stub failure",
+                                                "status": "UNAVAILABLE"}}, status=self.status[provider])
+        return web.json_response(body)
+
+    async def gemini(self, request):
+        return await self._answer("gemini", {
+            "candidates": [{"content": {"role": "model", "parts": [{"text": "gemini stub"}]}, "finishReason": "STOP"}],
+        })
+
+    async def groq(self, request):
+        data = await request.json()
+        return await self._answer("groq", {
+            "id": "stub", "object": "chat.completion", "created": 0, "model": data["model"],
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": "groq stub"}}],
+        })
+
+    async def groq_models(self, request):
+        return await self._answer("groq", {"object": "list", "data": []})
+
+    async def ollama(self, request):
+        data = await request.json()
+        return await self._answer("local", {
+            "model": data["model"], "created_at": "2026-01-01T00:00:00Z", "done": True,
+            "message": {"role": "assistant", "content": "ollama stub"},
+        })
+
+    async def ollama_tags(self, request):
+        return await self._answer("local", {"models": []})
+
+
+@pytest.fixture
+async def stub(aiohttp_server):
+    stub = StubProvider()
+    server = await aiohttp_server(stub.app())
+    stub.url = str(server.make_url("")).rstrip("/")
+    return stub
+
+
+def stub_config(url, timeout=5.0):
+    config = ModelConfig()
+    config.gemini_base_url = url
+    config.groq_base_url = url
+    config.ollama_host = url
+    config.provider_timeout = timeout
+    config.local_timeout = timeout
+    return config
+
+
+# --- PROVIDERS ---
+async def test_every_provider_answers_through_its_stub(stub):
+    pool = AsyncProviderPool(stub_config(stub.url), gemini_key="stub", groq_key="stub")
+    try:
+        assert await pool.get("gemini").generate("hi", "gemini-2.5-flash", is_chat=False) == "gemini stub"
+        assert await pool.get("groq").generate("hi", "llama-3.1-8b-instant", is_chat=False) == "groq stub"
+        assert await pool.get("local").generate("hi", "llama3", is_chat=False) == "ollama stub"
+        await pool.get("groq").probe()
+        await pool.get("local").probe()
+    finally:
+        await pool.aclose()
+
+
+async def test_slow_endpoint_hits_the_per_call_timeout(stub):
+    # Ollama's client has no timeout of its own: only the per-call deadline can stop it
+    stub.delay["local"] = 1.0
+    pool = AsyncProviderPool(stub_config(stub.url, timeout=0.2))
+    try:
+        with pytest.raises(asyncio.TimeoutError):
+            await pool.get("local").generate("hi", "llama3", is_chat=False)
+    finally:
+        await pool.aclose()
+
+
+async def test_aclose_closes_every_client(stub):
+    pool = AsyncProviderPool(stub_config(stub.url), gemini_key="stub", groq_key="stub")
+    providers = [pool.get(name) for name in ("gemini", "groq", "local")]
+    shared_http = pool._http
+    await providers[2].generate("hi", "llama3", is_chat=False)
+
+    await pool.aclose()
+    assert pool.providers == {}
+    assert shared_http.is_closed
+    assert providers[1].client.is_closed()
+    assert providers[2].client._client.is_closed  # Ollama's own httpx session
+
+
+async def test_pool_wraps_injected_clients():
+    fake = FakeGroqClient(LatencyModel(0.0, 0.0))
+    pool = AsyncProviderPool(ModelConfig(), groq_key="real-key-ignored", clients={"groq": fake, "gemini": None})
+    provider = pool.get("groq")
+    assert isinstance(provider, AsyncThreadedProvider)
+    assert "fake reply" in await provider.generate("hello", "llama-3.1-8b-instant", is_chat=False)
+    assert fake.backend.calls == 1
+    assert pool.get("gemini") is None  # No injected client and no key
+    await pool.aclose()
+
+
+# --- BRAIN.ATHINK ---
+async def test_athink_uses_injected_fakes(make_brain):
+    brain = make_brain()
+    reply = await brain.athink("How are you?")
+    assert "[gemini]" in reply
+    assert brain.gemini_client.backend.calls >= 1
+    await brain.aclose()
+
+
+async def test_athink_fails_over_when_a_stub_goes_down(make_brain, stub):
+    brain = make_brain()
+    brain.async_providers = AsyncProviderPool(stub_config(stub.url), gemini_key="stub", groq_key="stub")
+    stub.status["gemini"] = 400
+
+    reply = await brain.athink("How are you?")
+    assert reply.startswith("\n[groq]: groq stub")
+    assert stub.calls["gemini"] >= 1
+    await brain.aclose()
+
+
+async def test_athink_fails_over_when_a_client_cannot_be_built(make_brain, stub):
+    brain = make_brain()
+    pool = AsyncProviderPool(stub_config(stub.url), gemini_key="stub", groq_key="stub")
+    build = pool._build
+
+    def broken_gemini(provider):
+        if provider == "gemini":
+            raise RuntimeError("SDK missing")
+        return build(provider)
+
+    pool._build = broken_gemini
+    brain.async_providers = pool
+    reply = await brain.athink("How are you?")
+    assert reply.startswith("\n[groq]: groq stub")
+    await brain.aclose()
@@ -0,0 +1,171 @@
+# tests/test_audio_stream.py
+"""StreamingTranscriber driven by the fake microphone (WavFileSource), plus its RingBuffer, EnergyVAD and resampler."""
+import wave
+
+import numpy as np
+import speech_recognition as sr
+
+from benchmarks.bench_stream_ears import BATCH, synthetic_utterance
+from src.senses.audio_stream import (FRAME_SAMPLES, SAMPLE_RATE, EnergyVAD, RingBuffer, StreamingTranscriber,
+                                     WavFileSource, resample)
+
+
+class RecordingASR:
+    """Returns 'chunkN' per final decode (or `text`), and records what it was asked to decode."""
+
+    def __init__(self, text=None):
+        self.text = text
+        self.calls = []
+
+    def __call__(self, samples, prompt="", partial=False):
+        self.calls.append({"samples": len(samples), "prompt": prompt, "partial": partial})
+        if self.text is not None:
+            return self.text
+        return "hypothesis" if partial else f"chunk{sum(not c['partial'] for c in self.calls)}"
+
+
+def run(source, asr, **overrides):
+    streamer = StreamingTranscriber(source, asr, **overrides)
+    return streamer, list(streamer.stream())
+
+
+def test_commits_chunks_then_finalizes_the_tail():
+    source = WavFileSource(samples=synthetic_utterance(3.0, seed=0), trailing_silence_s=0.6)
+    asr = RecordingASR()
+    streamer, events = run(source, asr, chunk_s=1.0, max_chunk_s=2.0, partial_s=None, end_silence_ms=300)
+
+    assert [e["type"] for e in events[:-1]] == ["partial"] * (len(events) - 1)
+    assert events[-1]["type"] == "final"
+    commits = streamer.stats["commits"]
+    assert commits >= 1
+    # Every committed chunk is in the final text, in order, followed by the tail
+    assert events[-1]["text"] == " ".join(f"chunk{i}" for i in range(1, commits + 2))
+    # Each decode gets the committed text so far as its prompt
+    assert [c["prompt"] for c in asr.calls] == [" ".join(f"chunk{i}" for i in range(1, n + 1))
+                                               for n in range(commits + 1)]
+    # Chunks tile the utterance: no audio decoded twice, none skipped
+    decoded = sum(c["samples"] for c in asr.calls)
+    assert abs(decoded / SAMPLE_RATE - streamer.stats["audio_s"]) < 0.01
+    assert 2.5 < streamer.stats["audio_s"] < 3.6
+
+
+def test_partials_never_change_committed_text():
+    source = WavFileSource(samples=synthetic_utterance(2.5, seed=1), trailing_silence_s=0.6)
+    streamer, events = run(source, RecordingASR(), chunk_s=1.0, partial_s=0.3, end_silence_ms=300)
+
+    committed = ""
+    for event in events:
+        assert event["text"].startswith(committed)
+        if not event["text"].endswith("hypothesis"):
+            committed = event["text"]
+    assert events[-1]["type"] == "final"
+    assert "hypothesis" not in events[-1]["text"]
+
+
+def test_batch_mode_decodes_once():
+    source = WavFileSource(samples=synthetic_utterance(2.0, seed=2), realtime=False, trailing_silence_s=1.0)
+    asr = RecordingASR()
+    _, events = run(source, asr, end_silence_ms=300, **BATCH)
+    assert events == [{"type": "final", "text": "chunk1"}]
+    assert len(asr.calls) == 1
+
+
+def test_timeout_without_speech_returns_empty_final():
+    silence = np.random.default_rng(0).normal(0, 20, SAMPLE_RATE * 3).astype(np.int16)
+    asr = RecordingASR()
+    streamer, events = run(WavFileSource(samples=silence, realtime=False), asr, timeout=0.5)
+    assert events == [{"type": "final", "text": ""}]
+    assert asr.calls == []
+    assert streamer.stats["decodes"] == 0
+
+
+def test_speech_that_transcribes_to_nothing_gives_empty_final():
+    source = WavFileSource(samples=synthetic_utterance(2.5, seed=3), trailing_silence_s=0.6)
+    asr = RecordingASR(text="   ")
+    streamer, events = run(source, asr, chunk_s=1.0, partial_s=None, end_silence_ms=300)
+    assert events[-1] == {"type": "final", "text": ""}
+    assert all(c["prompt"] == "" for c in asr.calls)  # Empty chunks are not committed as context
+    assert streamer.stats["decodes"] == len(asr.calls) >= 2
+
+
+def test_wav_file_source_reads_a_wav(tmp_path):
+    path = str(tmp_path / "utterance.wav")
+    samples = synthetic_utterance(1.5, seed=4)
+    with wave.open(path, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes(samples.tobytes())
+
+    source = WavFileSource(path=path, realtime=False, trailing_silence_s=1.0)
+    _, events = run(source, RecordingASR(), end_silence_ms=300, **BATCH)
+    assert source.duration == len(samples) / SAMPLE_RATE
+    assert events[-1] == {"type": "final", "text": "chunk1"}
+
+
+# --- RING BUFFER / VAD ---
+def test_ring_buffer_reads_by_absolute_index():
+    ring = RingBuffer(seconds=1, sample_rate=10)
+    ring.write(np.arange(6, dtype=np.int16))
+    ring.write(np.arange(6, 14, dtype=np.int16))  # Wraps: samples 0-3 are gone
+    assert ring.total == 14 and ring.capacity == 10
+    assert ring.read(2, 8).tolist() == [4, 5, 6, 7]  # Clipped to what is retained
+    assert ring.read(10, 14).tolist() == [10, 11, 12, 13]
+    assert ring.read(9, 9).size == 0
+
+
+def test_ring_buffer_oversized_write_keeps_the_tail():
+    ring = RingBuffer(seconds=1, sample_rate=4)
+    ring.write(np.arange(10, dtype=np.int16))
+    assert ring.read(0, 10).tolist() == [6, 7, 8, 9]
+
+
+def test_vad_needs_sustained_voice_and_silence():
+    vad = EnergyVAD(threshold=400, start_ms=90, end_silence_ms=120)
+    loud = np.full(FRAME_SAMPLES, 2000, dtype=np.int16)
+    quiet = np.zeros(FRAME_SAMPLES, dtype=np.int16)
+
+    assert vad.process(loud) == (None, True)
+    assert vad.process(quiet) == (None, False)  # A click is not speech
+    events = [vad.process(loud)[0] for _ in range(3)]
+    assert events == [None, None, "start"]
+    events = [vad.process(quiet)[0] for _ in range(4)]
+    assert events == [None, None, None, "end"]
+
+    vad.process(loud)
+    vad.reset()
+    assert [vad.process(loud)[0] for _ in range(3)][-1] == "start"
+
+
+# --- RESAMPLING ---
+def tone(freq, rate, seconds=1.0):
+    return 0.5 * np.sin(2 * np.pi * freq * np.arange(int(seconds * rate)) / rate)
+
+
+def level(samples):
+    return np.sqrt(np.mean(np.square(samples[1000:-1000]))) / (0.5 / np.sqrt(2))
+
+
+def test_resample_keeps_speech_band_and_drops_what_would_alias():
+    assert len(resample(tone(1000, 44100), 44100)) == SAMPLE_RATE
+    assert abs(level(resample(tone(1000, 44100), 44100)) - 1.0) < 0.01
+    # 12 kHz does not exist at 16 kHz: it must vanish, not fold down to 4 kHz
+    assert level(resample(tone(12000, 48000), 48000)) < 1e-3
+
+
+def test_audio_to_float32_resamples_without_aliasing():
+    from src.senses.ears import audio_to_float32
+
+    def audio(samples, rate):
+        return sr.AudioData((samples * 32767).astype(np.int16).tobytes(), rate, 2)
+
+    native = audio_to_float32(audio(tone(1000, SAMPLE_RATE), SAMPLE_RATE))
+    assert native.dtype == np.float32 and len(native) == SAMPLE_RATE
+    assert level(audio_to_float32(audio(tone(12000, 44100), 44100))) < 1e-3
+
+
+def test_wav_file_source_resamples_other_rates():
+    source = WavFileSource(samples=(tone(1000, 48000) * 32767).astype(np.int16), sample_rate=48000,
+                           realtime=False, trailing_silence_s=0.0)
+    assert source.speech_samples == SAMPLE_RATE
+    assert abs(level(source.samples / 32767) - 1.0) < 0.01
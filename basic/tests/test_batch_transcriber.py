@@ -0,0 +1,100 @@
+# tests/test_batch_transcriber.py
+"""BatchTranscriber with fake transcriber functions (spawned workers import them from here)."""
+import json
+import os
+import wave
+
+import numpy as np
+
+from src.senses.batch_transcriber import BatchTranscriber, load_checkpoint
+
+
+class FakeTranscriber:
+    """Worker factory: 'transcribes' by echoing the file name; 'bad' files raise."""
+
+    def __call__(self, path):
+        name = os.path.basename(path)
+        if "bad" in name:
+            raise ValueError(f"cannot decode {name}")
+        return {"text": name, "language": "en"}
+
+
+class CrashingTranscriber(FakeTranscriber):
+    """Kills its worker process on 'crash' files, like a native segfault or the OOM killer."""
+
+    def __call__(self, path):
+        if "crash" in os.path.basename(path):
+            os._exit(1)
+        return super().__call__(path)
+
+
+class BrokenModel:
+    """Model load fails in every worker (initializer error)."""
+
+    def __init__(self):
+        raise RuntimeError("model file missing")
+
+
+def make_wavs(directory, names, seconds=0.2):
+    paths = []
+    for name in names:
+        path = os.path.join(directory, name)
+        with wave.open(path, "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(16000)
+            f.writeframes(np.zeros(int(seconds * 16000), dtype=np.int16).tobytes())
+        paths.append(path)
+    return paths
+
+
+def read_rows(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def batch(factory, workers=1):
+    return BatchTranscriber(workers=workers, cpu_threads=1, worker_factory=factory, worker_args=())
+
+
+def test_per_file_errors_are_recorded_and_retried_on_resume(tmp_path):
+    paths = make_wavs(str(tmp_path), ["a.wav", "bad.wav", "c.wav"])
+    out = str(tmp_path / "out.jsonl")
+
+    summary = batch(FakeTranscriber).run(paths, out, progress=False)
+    assert (summary["ok"], summary["errors"], summary["pool_broken"]) == (2, 1, False)
+    errors = [row for row in read_rows(out) if row["status"] == "error"]
+    assert [os.path.basename(row["audio"]) for row in errors] == ["bad.wav"]
+    assert "ValueError" in errors[0]["error"]
+
+    # Resume: only the failed file is attempted again
+    summary = batch(FakeTranscriber).run(paths, out, progress=False)
+    assert (summary["files"], summary["skipped"]) == (1, 2)
+
+
+def test_crashed_worker_does_not_abort_the_batch(tmp_path):
+    paths = make_wavs(str(tmp_path), ["a.wav", "crash.wav", "c.wav", "d.wav"])
+    out = str(tmp_path / "out.jsonl")
+
+    summary = batch(CrashingTranscriber, workers=2).run(paths, out, progress=False)
+    assert summary["pool_broken"]
+    assert summary["ok"] + summary["errors"] == 4  # Every job got a row, none raised out of run()
+    rows = read_rows(out)
+    assert len(rows) == 4
+    crashed = [row for row in rows if os.path.basename(row["audio"]) == "crash.wav"]
+    assert crashed[0]["status"] == "error" and "BrokenProcessPool" in crashed[0]["error"]
+
+    # Resume with a healthy worker finishes exactly the files that were lost
+    lost = len(paths) - len(load_checkpoint(out))
+    summary = batch(FakeTranscriber).run(paths, out, progress=False)
+    assert (summary["files"], summary["ok"], summary["errors"]) == (lost, lost, 0)
+    assert len(load_checkpoint(out)) == 4
+
+
+def test_failed_model_load_records_every_file(tmp_path):
+    paths = make_wavs(str(tmp_path), ["a.wav", "b.wav"])
+    out = str(tmp_path / "out.jsonl")
+
+    summary = batch(BrokenModel).run(paths, out, progress=False)
+    assert (summary["ok"], summary["errors"], summary["pool_broken"]) == (0, 2, True)
+    assert load_checkpoint(out) == set()
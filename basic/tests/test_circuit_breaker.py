@@ -0,0 +1,114 @@
+# tests/test_circuit_breaker.py
+import pytest
+
+from benchmarks.fake_providers import FakeGeminiClient, FakeProviderError, LatencyModel
+from src.brain.circuit_breaker import CircuitBreaker, ModelRouter
+from src.brain.model_loader import ModelConfig
+
+
+def expire(breaker):
+    """Fast-forwards past the cooldown without sleeping."""
+    breaker.opened_at -= breaker.open_for + 0.01
+
+
+def test_opens_after_threshold_plain_failures():
+    breaker = CircuitBreaker(failure_threshold=3, cooldown=30.0)
+    for _ in range(2):
+        breaker.record_failure()
+        assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+    assert breaker.open_for == 30.0
+
+
+def test_capacity_error_opens_instantly_for_longer():
+    breaker = CircuitBreaker(cooldown=30.0, capacity_cooldown=60.0)
+    breaker.record_failure(capacity=True)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.open_for == 60.0
+
+
+def test_half_open_lets_exactly_one_trial_through():
+    breaker = CircuitBreaker(failure_threshold=1)
+    breaker.record_failure()
+    expire(breaker)
+
+    assert breaker.is_available()
+    assert breaker.allow()           # The trial
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()       # Everyone else waits for its outcome
+    assert not breaker.is_available()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.failures == 0
+    assert breaker.allow()
+
+
+def test_failed_trial_reopens():
+    breaker = CircuitBreaker(failure_threshold=3)
+    for _ in range(3):
+        breaker.record_failure()
+    expire(breaker)
+    assert breaker.allow()
+    breaker.record_failure()  # One failure is enough while half-open
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+
+def test_router_skips_benched_models():
+    router = ModelRouter({"groq": ["big", "small", "tiny"]}, light_models={"groq": "tiny"})
+    assert router.primary("groq") == "big"
+    assert router.candidates("groq", first="small") == ["small", "big", "tiny"]
+
+    router.breaker("groq", "big").record_failure(capacity=True)
+    assert router.primary("groq") == "small"
+    assert router.light_model("groq") == "tiny"
+    router.breaker("groq", "tiny").record_failure(capacity=True)
+    assert router.light_model("groq") == "small"  # Light model benched: fall back to the primary
+
+    for model in ("small", "tiny"):
+        router.breaker("groq", model).record_failure(capacity=True)
+    assert router.primary("groq") == "big"  # All benched: still name the flagship
+    assert router.snapshot()["groq/big"] == CircuitBreaker.OPEN
+
+
+def test_capacity_errors_are_classified():
+    assert ModelRouter.is_capacity_error(FakeProviderError("429 RESOURCE_EXHAUSTED (fake)", status_code=429))
+    assert ModelRouter.is_capacity_error(RuntimeError("The model is overloaded, try later"))
+    assert not ModelRouter.is_capacity_error(FakeProviderError("500 fake provider failure", status_code=500))
+    assert not ModelRouter.is_capacity_error(ConnectionError("connection refused"))
+
+
+# --- BRAIN (sync and async share one rotation policy) ---
+def busy_primary(primary):
+    """Gemini fake whose flagship model always answers 429."""
+    client = FakeGeminiClient(LatencyModel(0.0, 0.0))
+    generate = client.models.generate_content
+
+    def generate_content(model, contents):
+        if model == primary:
+            raise FakeProviderError("429 RESOURCE_EXHAUSTED (fake)", status_code=429)
+        return generate(model=model, contents=contents)
+
+    client.models.generate_content = generate_content
+    return client
+
+
+@pytest.mark.parametrize("path", ["sync", "async"])
+async def test_capacity_error_rotates_the_same_way_on_both_paths(make_brain, path):
+    primary, fallback = ModelConfig().gemini_models[:2]
+    brain = make_brain(gemini=busy_primary(primary))
+    assert brain.active_model_name == primary
+
+    payload = brain._build_payload("How are you?")
+    if path == "sync":
+        reply = brain._generate_text(payload)
+    else:
+        reply = await brain._agenerate_text(payload)
+        await brain.aclose()
+
+    assert "fake reply" in reply
+    assert brain.active_model_name == fallback
+    assert brain.router.rotations == 1
+    assert brain.router.snapshot()[f"gemini/{primary}"] == CircuitBreaker.OPEN
@@ -0,0 +1,97 @@
+# tests/test_context_window.py
+from benchmarks.fake_providers import FakeGroqClient, LatencyModel
+from src.brain.context_window import ContextWindow, approx_tokens
+
+
+def chat(n, size=40):
+    """n exchanges of ~size/4 tokens per message."""
+    history = []
+    for i in range(n):
+        history += [{"role": "user", "text": f"Question {i}. " + "u" * size},
+                    {"role": "model", "text": f"Answer {i}. " + "m" * size}]
+    return history
+
+
+def test_approx_tokens():
+    assert approx_tokens("") == 1
+    assert approx_tokens("abcd") == 1
+    assert approx_tokens("abcde") == 2
+
+
+def test_fits_untouched_under_budget():
+    window = ContextWindow()
+    history = chat(3)
+    summary, messages = window.fit(history, budget=10_000)
+    assert summary == "" and messages == history
+    assert window.stats["compactions"] == 0
+
+
+def test_overflow_jumps_to_low_water_and_compacts_in_background():
+    calls = []
+
+    def summarize(previous, messages):
+        calls.append(len(messages))
+        return "They asked " + ", ".join(m["text"].split(".")[0] for m in messages if m["role"] == "user")
+
+    window = ContextWindow(summarize_fn=summarize, low_water=0.5)
+    history = chat(10)
+    budget = sum(approx_tokens(m["text"]) for m in history) // 2
+
+    summary, messages = window.fit(history, budget)
+    assert messages[0]["role"] == "user"  # Never opens on a model reply
+    assert sum(approx_tokens(m["text"]) for m in messages) <= budget * 0.5
+    skipped = len(history) - len(messages)
+
+    assert window.drain(timeout=2)
+    summary, after = window.fit(history, budget)
+    assert calls == [skipped]
+    assert summary.startswith("They asked Question 0")
+    assert len(history) == len(messages) and after == messages  # Compacted messages removed in place
+    assert window.stats["messages_compacted"] == skipped
+
+
+def test_fallback_summary_when_summarizer_fails():
+    def broken(previous, messages):
+        raise RuntimeError("provider down")
+
+    window = ContextWindow(summarize_fn=broken)
+    history = chat(6)
+    window.fit(history, budget=60)
+    window.drain(timeout=2)
+    summary, _ = window.fit(history, budget=60)
+    assert summary.startswith("Earlier the user said: ")
+    assert summary.endswith("Question 4")  # Oldest gists are cut to fit the budget share
+    assert window.stats["fallback_summaries"] == 1
+
+
+def test_summary_from_fake_provider():
+    client = FakeGroqClient(LatencyModel(0.0, 0.0))
+
+    def summarize(previous, messages):
+        prompt = "\n".join(m["text"] for m in messages) + "\nUpdated Summary:"
+        return client.chat.completions.create(messages=[{"role": "user", "content": prompt}],
+                                              model="fake").choices[0].message.content
+
+    window = ContextWindow(summarize_fn=summarize)
+    history = chat(6)
+    window.fit(history, budget=60)
+    window.drain(timeout=2)
+    assert window.fit(history, budget=60)[0] == "The user and ENJO have been chatting about benchmarks."
+    assert window.stats["fallback_summaries"] == 0
+
+
+def test_fallback_summary_stays_within_its_share_of_the_budget():
+    def broken(previous, messages):
+        raise RuntimeError("provider down")
+
+    window = ContextWindow(summarize_fn=broken)
+    history, budget = [], 80
+    for exchange in chat(40):
+        history.append(exchange)
+        window.fit(history, budget)
+        window.drain(timeout=2)
+
+    summary, _ = window.fit(history, budget)
+    assert window.stats["fallback_summaries"] > 10
+    assert approx_tokens(summary) <= budget * window.fallback_share
+    assert "Question 3" in summary  # The newest gists are the ones kept
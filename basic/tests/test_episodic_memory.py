@@ -0,0 +1,40 @@
+# tests/test_episodic_memory.py
+import numpy as np
+
+from benchmarks.bench_episodic import _VectorQuery, clustered
+from src.brain.episodic_memory import EpisodicMemory
+
+
+def test_text_search_finds_the_related_exchange(tmp_path):
+    memory = EpisodicMemory(str(tmp_path))
+    memory.add("My trip to Kyoto was amazing", "Glad the ramen lived up to it.")
+    memory.add("open spotify", "On it.")
+    hits = memory.search("remember Kyoto?", k=1)
+    assert hits[0][1] == "My trip to Kyoto was amazing"
+    assert memory.search("Kyoto", before=0) == []
+    memory.close()
+
+
+def test_lsh_recall_against_exact_scan(tmp_path):
+    dim, size, k = 64, 20_000, 3
+    rng = np.random.default_rng(0)
+    embedder = _VectorQuery(dim)
+    memory = EpisodicMemory(str(tmp_path), embedder=embedder, exact_below=0)  # Always use the index
+    vectors = clustered(rng, size, dim, topics=200)
+    memory.add_many([("u", str(i)) for i in range(size)], vectors=vectors)
+
+    recall = []
+    for i in range(50):
+        query = vectors[rng.integers(0, size)] + 0.3 / np.sqrt(dim) * rng.standard_normal(dim).astype(np.float32)
+        embedder.vectors[f"q{i}"] = query / np.linalg.norm(query)
+        found = [int(ai) for _, _, ai in memory.search(f"q{i}", k=k)]
+        exact = np.argpartition(-(vectors @ embedder.vectors[f"q{i}"]), k - 1)[:k]
+        recall.append(np.isin(found, exact).mean())
+
+    assert np.mean(recall) >= 0.9
+    assert len(memory._candidates(embedder.vectors["q0"], size)) < size / 4
+
+    # Rows added after the index was built are scanned exactly until the next rebuild
+    memory.add_many([("u", "new")], vectors=embedder.vectors["q0"][None, :])
+    assert memory.search("q0", k=1)[0][2] == "new"
+    memory.close()
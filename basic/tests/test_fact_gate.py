@@ -0,0 +1,66 @@
+# tests/test_fact_gate.py
+import os
+
+from src.brain.fact_gate import FactGate
+from src.brain.model_loader import ModelConfig
+
+
+def test_training_log_is_off_by_default():
+    assert ModelConfig().fact_gate_log is False
+    gate = FactGate()
+    gate.log("My name is Shin", {"name": "Shin"})  # No path: nothing written, no error
+
+
+def test_training_log_is_capped_and_rotated(tmp_path):
+    path = str(tmp_path / "fact_gate_log.jsonl")
+    gate = FactGate(log_path=path, log_max_bytes=200)
+    for i in range(30):
+        gate.log(f"I live in city number {i}", True)
+
+    assert os.path.getsize(path) <= 200 + 100  # At most one row past the cap
+    assert os.path.getsize(path + ".1") <= 200 + 100
+    assert not os.path.exists(path + ".2")
+    rows = FactGate.read_log(path + ".1") + FactGate.read_log(path)
+    assert rows[-1] == ("I live in city number 29", True)
+
+
+def test_gate_is_opt_in():
+    assert ModelConfig().fact_gate_enabled is False
+
+
+def test_scores_facts_above_chatter():
+    gate = FactGate()
+    for text in ("My name is Shin", "I live in Osaka", "I'm allergic to peanuts", "remember that my car is red"):
+        assert gate.score(text) >= gate.threshold, text
+    # No "I"/"my" in front, and the core stocks/projects fields
+    for text in ("Picked up some AAPL today", "Put 500 bucks into Nvidia", "Tesla went up today, I'm holding 20 shares",
+                 "Working on a new project called Enjo", "Allergic to shellfish btw", "Vegan since last year",
+                 "Remind me that Tom's birthday is June 3"):
+        assert gate.score(text) >= gate.threshold, text
+    for text in ("hello", "open spotify", "mute", "what time is it?", "what's AAPL trading at?", "hey ENJO"):
+        assert gate.score(text) < gate.threshold, text
+
+
+def test_explore_rate_sends_some_skipped_turns():
+    gate = FactGate(explore_rate=0.0)
+    assert gate.should_extract("My dog is called Rover")
+    assert not gate.should_extract("thanks")
+    assert gate.stats == {"passed": 1, "skipped": 1, "explored": 0}
+
+    gate = FactGate(explore_rate=1.0)
+    assert gate.should_extract("thanks")
+    assert gate.stats["explored"] == 1
+
+
+def test_training_moves_the_boundary(tmp_path):
+    gate = FactGate()
+    before = gate.score("I think so")
+    gate.train([("I think so", False), ("I think my sister is a nurse", True)] * 5, epochs=20)
+    assert gate.score("I think so") < before
+    assert gate.score("I think my sister is a nurse") >= gate.threshold
+
+    path = str(tmp_path / "fact_gate.json")
+    gate.save(path)
+    loaded = FactGate.load(path, threshold=0.5)
+    assert loaded.weights == gate.weights and loaded.threshold == 0.5
+    assert FactGate.load(str(tmp_path / "missing.json")).weights == FactGate().weights
@@ -0,0 +1,67 @@
+# tests/test_fused_turn.py
+import json
+
+from benchmarks.fake_providers import FakeGeminiClient, LatencyModel, default_reply
+from src.brain.fused_turn import FusedReplyStream
+
+FUSED = json.dumps({"action": "open | spotify", "reply": 'On it, boss. Playing "Café\nBeats" now.',
+                    "facts": {"music": "lo-fi"}})
+
+
+def test_reply_is_decoded_across_every_chunk_boundary():
+    text = "Sure! ```json\n" + FUSED + "\n```"
+    for size in range(1, len(text) + 1):
+        decoder = FusedReplyStream()
+        out = "".join(decoder.feed(text[i:i + size]) for i in range(0, len(text), size))
+        assert out == '[ACTION: open | spotify] On it, boss. Playing "Café\nBeats" now.', size
+        assert decoder.finished and decoder.raw == text
+
+
+def test_no_reply_field_yields_nothing():
+    decoder = FusedReplyStream()
+    assert decoder.feed("I am not JSON at all.") == ""
+    assert not decoder.started
+
+
+def stream_turn(brain, text):
+    events = list(brain.think_stream(text))
+    brain.flush_subconscious(timeout=5)
+    return events
+
+
+def test_fused_stream_is_one_provider_call_per_turn(make_brain):
+    for fused, calls in ((False, 2), (True, 1)):
+        gemini = FakeGeminiClient(LatencyModel(0.0, 0.0))
+        brain = make_brain(gemini=gemini, fused_turns=fused)
+        for i in range(3):
+            events = stream_turn(brain, f"I live in city number {i}.")
+            assert events and events[0]["type"] == "sentence"
+        assert gemini.backend.calls == 3 * calls, fused
+
+
+def test_fused_stream_speaks_reply_and_learns_facts(make_brain):
+    def reply(prompt):
+        return FUSED if "[RESPONSE FORMAT]" in prompt else default_reply(prompt)
+
+    gemini = FakeGeminiClient(LatencyModel(0.0, 0.0), reply_fn=reply)
+    brain = make_brain(gemini=gemini, fused_turns=True)
+    events = stream_turn(brain, "play something chill, I like lo-fi")
+
+    assert events[0] == {"type": "action", "command": "open", "target": "spotify"}
+    assert [e["text"] for e in events[1:]] == ["On it, boss.", 'Playing "Café', 'Beats" now.']
+    assert brain.memory.load_profile()["music"] == "lo-fi"
+    assert brain.history[-1]["text"].startswith("[ACTION: open | spotify] On it, boss.")
+    assert gemini.backend.calls == 1
+
+
+def test_off_schema_stream_is_salvaged_and_extracted(make_brain):
+    def reply(prompt):
+        return "Sure, here you go." if "[RESPONSE FORMAT]" in prompt else default_reply(prompt)
+
+    gemini = FakeGeminiClient(LatencyModel(0.0, 0.0), reply_fn=reply)
+    brain = make_brain(gemini=gemini, fused_turns=True)
+    events = stream_turn(brain, "I live in Osaka.")
+
+    assert [e["text"] for e in events] == ["Sure, here you go."]
+    assert brain.fused.stats == {"fused": 0, "fallbacks": 1}
+    assert gemini.backend.calls == 2  # The Subconscious picked the turn up
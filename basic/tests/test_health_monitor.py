@@ -0,0 +1,153 @@
+# tests/test_health_monitor.py
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.fake_providers import FakeGeminiClient, FakeGroqClient, FakeLocalEngine, LatencyModel
+from src.brain.health_monitor import HealthMonitor
+
+
+class FakeEndpoint:
+    """Probe target: answers after `latency` seconds, or raises while `down`."""
+
+    def __init__(self, latency=0.0, down=False):
+        self.latency = latency
+        self.down = down
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(self.latency)
+        if self.down:
+            raise ConnectionError("endpoint down")
+
+
+def make_monitor(endpoints, **kwargs):
+    kwargs.setdefault("probe_timeout", 1.0)
+    monitor = HealthMonitor(**kwargs)
+    for provider, endpoint in endpoints.items():
+        monitor.register(provider, f"{provider}-model", endpoint)
+    monitor._pool = ThreadPoolExecutor(max_workers=len(endpoints))  # probe_all() without the background loop
+    return monitor
+
+
+# --- RANKING ---
+def test_fast_local_probe_never_beats_healthy_cloud():
+    monitor = make_monitor({"gemini": FakeEndpoint(0.30), "groq": FakeEndpoint(0.15), "local": FakeEndpoint(0.004)})
+    monitor.probe_all()
+    assert monitor.best_provider() == "gemini"
+
+
+def test_same_tier_provider_wins_only_when_dramatically_faster():
+    monitor = HealthMonitor(latency_slack=3.0)
+    for _ in range(5):
+        monitor.record("gemini", "g", 0.9, True, kind="probe")
+        monitor.record("groq", "q", 0.5, True, kind="probe")
+    assert monitor.best_provider() == "gemini"
+
+    for _ in range(20):
+        monitor.record("groq", "q", 0.1, True, kind="probe")
+    assert monitor.best_provider() == "groq"
+
+
+def test_probe_and_generation_latencies_are_not_mixed():
+    monitor = HealthMonitor(latency_slack=3.0)
+    # Gemini only has a (cheap) probe latency, Groq only a (slow) generation latency
+    monitor.record("gemini", "g", 0.05, True, kind="probe")
+    monitor.record("groq", "q", 2.0, True)
+    assert monitor.latencies("gemini") == []
+    assert monitor.latencies("gemini", kind="probe") == [0.05]
+    assert monitor.stats("groq")["p50"] == 2.0
+    assert monitor.stats("groq")["probe_p50"] is None
+
+    # Generation latencies are compared with generation latencies only
+    monitor.record("gemini", "g", 1.5, True)
+    for _ in range(5):
+        monitor.record("groq", "q", 0.3, True)
+    assert monitor.best_provider() == "groq"
+
+
+# --- TIMEOUTS ---
+def test_timed_out_probe_is_recorded_exactly_once():
+    slow = FakeEndpoint(0.4)
+    monitor = make_monitor({"gemini": slow}, probe_timeout=0.1)
+    monitor.probe_all()
+    time.sleep(0.6)  # Let the late answer land
+
+    assert monitor.stats("gemini")["samples"] == 1
+    assert monitor.stats("gemini")["healthy"] is False
+    assert monitor.latencies("gemini", kind="probe") == []
+
+
+def test_hung_probe_is_not_stacked():
+    release = threading.Event()
+    monitor = make_monitor({"gemini": release.wait}, probe_timeout=0.05)
+    monitor.probe_all()
+    monitor.probe_all()  # Previous probe still in flight: skipped, not re-recorded
+    release.set()
+    assert monitor.stats("gemini")["samples"] == 1
+
+
+def test_wait_for_first_waits_for_preferred_tier():
+    monitor = make_monitor({"gemini": FakeEndpoint(0.3), "local": FakeEndpoint(0.0)}, interval=60.0)
+    monitor.start()
+    try:
+        assert monitor.wait_for_first(2.0)
+        assert monitor.best_provider() == "gemini"
+    finally:
+        monitor.stop()
+
+
+# --- FAILOVER ---
+def test_failover_across_tiers_and_back():
+    gemini, groq, local = FakeEndpoint(), FakeEndpoint(), FakeEndpoint()
+    monitor = make_monitor({"gemini": gemini, "groq": groq, "local": local})
+    monitor.probe_all()
+    assert monitor.best_provider() == "gemini"
+
+    gemini.down = True
+    monitor.probe_all()
+    assert monitor.best_provider() == "groq"
+
+    groq.down = True
+    monitor.probe_all()
+    assert monitor.best_provider() == "local"
+
+    local.down = True
+    monitor.probe_all()
+    assert monitor.best_provider() is None
+
+    gemini.down = False
+    for _ in range(3):  # Enough good probes to bring the error rate back under the limit
+        monitor.probe_all()
+    assert monitor.best_provider() == "gemini"
+
+
+def test_traffic_failures_mark_provider_unhealthy():
+    monitor = HealthMonitor()
+    monitor.record("gemini", "g", 0.1, True, kind="probe")
+    monitor.record("groq", "q", 0.1, True, kind="probe")
+    monitor.record("gemini", "g", 0.5, False)
+    assert monitor.best_provider() == "groq"
+
+
+# --- BRAIN WIRING ---
+def fake_clients():
+    """Probe latencies as in the field: the local probe answers ~75x faster than the cloud."""
+    return {
+        "gemini": FakeGeminiClient(LatencyModel(0.01, 0.0), probe_latency=0.30),
+        "groq": FakeGroqClient(LatencyModel(0.01, 0.0), probe_latency=0.15),
+        "local": FakeLocalEngine(LatencyModel(0.01, 0.0), probe_latency=0.004),
+    }
+
+
+def test_brain_boots_on_cloud_even_when_local_answers_first(make_brain):
+    brain = make_brain(**fake_clients())
+    assert brain.active_provider == "gemini"
+    brain._apply_routing()
+    assert brain.active_provider == "gemini"
+
+
+def test_local_probe_registered_only_when_enabled(make_brain):
+    assert "local" in make_brain(**fake_clients()).health.probes
+    assert "local" not in make_brain(local_enabled=False, **fake_clients()).health.probes
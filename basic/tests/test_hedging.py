@@ -0,0 +1,131 @@
+# tests/test_hedging.py
+"""HedgedExecutor on fixed-latency attempts, plus the Brain's hedged think()."""
+import threading
+import time
+
+import pytest
+
+from benchmarks.fake_providers import FakeGeminiClient, FakeGroqClient, LatencyModel
+from src.brain.hedging import HedgedExecutor
+
+
+@pytest.fixture
+def hedger():
+    executor = HedgedExecutor()
+    yield executor
+    executor._pool.shutdown(wait=True)
+
+
+def fixed(result, latency=0.0, gate=None, log=None, name=None):
+    """Attempt that answers `result` after a fixed latency (or once `gate` is set)."""
+    def fn():
+        if log is not None:
+            log[name] = time.perf_counter()
+        if gate is not None:
+            gate.wait(5.0)
+        else:
+            time.sleep(latency)
+        if isinstance(result, Exception):
+            raise result
+        return result
+    return fn
+
+
+class FakeStream:
+    def __init__(self, name):
+        self.name = name
+        self.closed = threading.Event()
+
+    def close(self):
+        self.closed.set()
+
+
+# --- HEDGE DELAY ---
+def test_hedge_delay_is_the_clamped_percentile(hedger):
+    assert hedger.hedge_delay([]) == hedger.default_delay
+    assert hedger.hedge_delay([0.5, 0.6, 0.7, 0.8, 2.0]) == 2.0
+    assert hedger.hedge_delay([0.01] * 10) == hedger.min_delay
+    assert hedger.hedge_delay([9.0] * 10) == hedger.max_delay
+
+
+def test_fast_primary_never_fires_a_hedge(hedger):
+    log = {}
+    winner = hedger.run([("gemini", fixed("a", 0.01, log=log, name="gemini")),
+                         ("groq", fixed("b", log=log, name="groq"))], delay=0.5)
+    assert winner == ("gemini", "a")
+    assert "groq" not in log
+    assert "groq" not in hedger.snapshot()
+
+
+def test_hedge_fires_after_the_delay(hedger):
+    gate, log = threading.Event(), {}
+    started = time.perf_counter()
+    winner = hedger.run([("gemini", fixed("slow", gate=gate, log=log, name="gemini")),
+                         ("groq", fixed("fast", log=log, name="groq"))], delay=0.1)
+    gate.set()
+
+    assert winner == ("groq", "fast")
+    assert log["groq"] - started >= 0.1
+    stats = hedger.snapshot()
+    assert stats["groq"]["hedges_fired"] == 1 and stats["groq"]["wins"] == 1
+    assert stats["gemini"]["launched"] == 1 and stats["gemini"]["hedges_fired"] == 0
+
+
+def test_hard_failure_hedges_immediately(hedger):
+    started = time.perf_counter()
+    winner = hedger.run([("gemini", fixed(RuntimeError("500"))),
+                         ("groq", fixed(None)),
+                         ("local", fixed("ok"))], delay=5.0)
+    assert winner == ("local", "ok")
+    assert time.perf_counter() - started < 1.0  # Never waited out the 5s delay
+    stats = hedger.snapshot()
+    assert stats["gemini"]["losses"] == 1 and stats["groq"]["losses"] == 1
+    assert stats["gemini"]["wasted"] == 0 and stats["groq"]["wasted"] == 0
+
+
+def test_every_attempt_failing_returns_nothing(hedger):
+    assert hedger.run([("gemini", fixed(None)), ("groq", fixed(RuntimeError("down")))], delay=5.0) == (None, None)
+
+
+# --- LOSERS ---
+def test_late_loser_stream_is_closed_and_counted_wasted_on_arrival(hedger):
+    gate = threading.Event()
+    slow, fast = FakeStream("gemini"), FakeStream("groq")
+    winner = hedger.run([("gemini", fixed(slow, gate=gate)), ("groq", fixed(fast))],
+                        delay=0.05, discard_fn=lambda stream: stream.close())
+
+    assert winner == ("groq", fast)
+    assert hedger.snapshot()["gemini"]["losses"] == 1
+    assert hedger.snapshot()["gemini"]["wasted"] == 0  # Still in flight: nothing wasted yet
+
+    gate.set()
+    assert slow.closed.wait(2.0)
+    assert hedger.snapshot()["gemini"]["wasted"] == 1
+    assert not fast.closed.is_set()
+
+
+def test_late_loser_that_fails_is_not_wasted(hedger):
+    gate = threading.Event()
+    winner = hedger.run([("gemini", fixed(RuntimeError("500"), gate=gate)), ("groq", fixed("ok"))], delay=0.05)
+    assert winner == ("groq", "ok")
+
+    gate.set()
+    hedger._pool.shutdown(wait=True)  # Lets the loser land
+    assert hedger.snapshot()["gemini"] == {"launched": 1, "hedges_fired": 0, "wins": 0, "losses": 1, "wasted": 0}
+
+
+# --- BRAIN ---
+def test_only_the_winner_is_remembered(make_brain):
+    gemini = FakeGeminiClient(LatencyModel(0.4, 0.0), reply_fn=lambda prompt: "slow gemini reply")
+    groq = FakeGroqClient(LatencyModel(0.01, 0.0), reply_fn=lambda prompt: "fast groq reply")
+    brain = make_brain(gemini=gemini, groq=groq, hedging_enabled=True)
+    brain.hedger.default_delay = 0.05
+    before = len(brain.history)
+
+    reply = brain.think("What's up?")
+    assert reply == "\n[groq]: fast groq reply"
+
+    brain.hedger._pool.shutdown(wait=True)  # Gemini's answer lands too...
+    assert brain.hedger.snapshot()["gemini"]["wasted"] == 1
+    # ...but only the winner reached the history
+    assert [m["text"] for m in brain.history[before:]] == ["What's up?", "fast groq reply"]
@@ -0,0 +1,39 @@
+# tests/test_history_store.py
+import threading
+
+from src.brain.history_store import HistoryStore
+
+
+def make_store(tmp_path, messages=0):
+    store = HistoryStore(str(tmp_path / "history.db"))
+    history = [{"role": "user" if i % 2 == 0 else "model", "text": f"message {i}"} for i in range(messages)]
+    store.save(history, limit=200)
+    return store, history
+
+
+def test_iter_messages_returns_the_whole_journal_in_order(tmp_path):
+    store, history = make_store(tmp_path, messages=10)
+    store.save(history[-4:], limit=4)  # Trimming only moves the live window
+    assert list(store.iter_messages(batch=3)) == history
+    assert len(store.load(200)) == 4
+    store.close()
+
+
+def test_saving_while_iterating_does_not_block(tmp_path):
+    store, history = make_store(tmp_path, messages=5)
+    seen = []
+
+    def iterate_and_save():
+        for message in store.iter_messages(batch=2):
+            seen.append(message["text"])
+            if len(seen) == 1:
+                # Same thread, mid-iteration: would deadlock if the lock were held across yield
+                history.append({"role": "user", "text": "new turn"})
+                store.save(history, limit=200)
+
+    worker = threading.Thread(target=iterate_and_save, daemon=True)
+    worker.start()
+    worker.join(timeout=5)
+    assert not worker.is_alive(), "iter_messages held the store lock across yield"
+    assert seen == [f"message {i}" for i in range(5)] + ["new turn"]
+    store.close()
@@ -0,0 +1,56 @@
+# tests/test_intent_router.py
+import pytest
+
+from src.brain.intent_router import IntentRouter
+
+
+@pytest.fixture(scope="module")
+def router():
+    return IntentRouter()
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("open spotify", ("open", "spotify")),
+    ("Hey Enjo, launch the calculator app please.", ("open", "calculator")),
+    ("please start up chrome", ("open", "chrome")),
+    ("set the volume to 30%", ("volume", "30")),
+    ("volume 100", ("volume", "100")),
+    ("Mute.", ("volume", "mute")),
+    ("unmute the sound", ("volume", "unmute")),  # Explicit state: never toggles the speakers back off
+    ("max volume", ("volume", "max")),
+    ("lock my computer", ("system", "lock")),
+    ("sleep the computer", ("system", "sleep")),
+    ("put my pc to sleep", ("system", "sleep")),
+])
+def test_reflex_hits(router, text, expected):
+    command, target, ack = router.route(text)
+    assert (command, target) == expected
+    assert ack
+
+
+@pytest.mark.parametrize("text", [
+    "shutdown",                      # Too destructive for a reflex
+    "go to sleep",                   # Could be meant for ENJO; only a named machine is put to sleep
+    "sleep",
+    "volume 250",                    # Out of range: the LLM talks the user down
+    "open my spreadsheet",           # Unknown app
+    "can you open spotify for me?",  # Not a whole-utterance command
+    "what's the weather like",
+])
+def test_everything_else_falls_through(router, text):
+    assert router.route(text) is None
+
+
+def test_vocabulary_follows_protocol_and_config(router):
+    assert {"chrome", "spotify", "notepad", "calculator", "cmd", "code"} <= router.vocabulary["open"]
+    assert "shutdown" not in router.vocabulary.get("system", set())
+    assert "media" not in router.vocabulary  # DesktopController has no media command
+
+
+def test_stats():
+    router = IntentRouter()
+    router.route("open notepad")
+    router.route("tell me a joke")
+    assert router.stats["hits"] == 1 and router.stats["misses"] == 1
+    assert router.hit_rate() == 0.5
+    assert router.report().startswith("Reflex hits 1/2 (50%)")
@@ -0,0 +1,98 @@
+# tests/test_local_engine.py
+"""LocalEngine warm-up / keep_alive re-pinning against a stub Ollama server."""
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from src.brain.local_engine import LocalEngine
+
+
+class StubOllama:
+    def __init__(self):
+        self.requests = []   # (path, json body)
+        self.failing = False
+
+    def app(self):
+        app = web.Application()
+        app.router.add_post("/api/generate", self.generate)
+        app.router.add_post("/api/chat", self.chat)
+        app.router.add_get("/api/tags", self.tags)
+        return app
+
+    async def generate(self, request):
+        self.requests.append(("generate", await request.json()))
+        if self.failing:
+            return web.json_response({"error": "model not loaded"}, status=500)
+        return web.json_response({"model": "llama3", "created_at": "2026-01-01T00:00:00Z", "response": "", "done": True})
+
+    async def chat(self, request):
+        body = await request.json()
+        self.requests.append(("chat", body))
+        if self.failing:
+            return web.json_response({"error": "model not loaded"}, status=500)
+        return web.json_response({"model": body["model"], "created_at": "2026-01-01T00:00:00Z", "done": True,
+                                  "message": {"role": "assistant", "content": "hello from stub"}})
+
+    async def tags(self, request):
+        return web.json_response({"models": []})
+
+    def calls(self, path):
+        return [body for p, body in self.requests if p == path]
+
+
+@pytest.fixture
+async def ollama_stub(aiohttp_server):
+    stub = StubOllama()
+    server = await aiohttp_server(stub.app())
+    stub.url = str(server.make_url("")).rstrip("/")
+    return stub
+
+
+async def in_thread(fn, *args):
+    """LocalEngine is synchronous; keep the stub's event loop free while it runs."""
+    return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+
+
+async def wait_until(predicate, timeout=5.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition not reached in time"
+        await asyncio.sleep(0.02)
+
+
+async def test_client_is_built_on_first_use(ollama_stub):
+    engine = LocalEngine(host=ollama_stub.url, timeout=5.0)
+    assert engine._client is None
+    await in_thread(engine.probe)
+    assert engine._client is not None
+    assert engine.client is engine._client  # One persistent client
+
+
+async def test_warm_up_preloads_and_pins_the_model(ollama_stub):
+    engine = LocalEngine(preferred_model="llama3", keep_alive="30m", host=ollama_stub.url, timeout=5.0)
+    assert await in_thread(engine.warm_up)
+    assert engine.status == "ready" and engine.ready.is_set()
+
+    generate, chat = ollama_stub.calls("generate"), ollama_stub.calls("chat")
+    assert generate[0]["prompt"] == "" and generate[0]["keep_alive"] == "30m"
+    assert chat[0]["options"]["num_predict"] == 1 and chat[0]["keep_alive"] == "30m"
+    assert await in_thread(engine.think, [{"role": "user", "content": "hi"}]) == "hello from stub"
+    assert ollama_stub.calls("chat")[-1]["keep_alive"] == "30m"
+
+
+async def test_repin_refreshes_keep_alive_and_recovers(ollama_stub):
+    ollama_stub.failing = True
+    engine = LocalEngine(keep_alive=-1, host=ollama_stub.url, timeout=5.0, repin_interval=0.1)
+    engine.start_warmup()
+    try:
+        await wait_until(lambda: engine.status == "failed")
+        assert engine._client is not None  # Built lazily by the warm-up thread
+
+        ollama_stub.failing = False
+        await wait_until(lambda: engine.status == "ready")
+        count = len(ollama_stub.calls("generate"))
+        await wait_until(lambda: len(ollama_stub.calls("generate")) >= count + 2)
+        assert all(body["keep_alive"] == -1 and body["prompt"] == "" for body in ollama_stub.calls("generate"))
+    finally:
+        engine.stop()
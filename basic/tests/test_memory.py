@@ -0,0 +1,96 @@
+# tests/test_memory.py
+import json
+import os
+import time
+
+import pytest
+
+from src.brain import memory as memory_module
+from src.brain.memory import MemorySystem
+
+
+def read_profile(path):
+    with open(os.path.join(path, "profile.json"), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.fixture
+def count_writes(monkeypatch):
+    """Counts (and can fail) the os.replace that publishes profile.json."""
+    calls = {"writes": 0, "fail": 0}
+    real_replace = os.replace
+
+    def replace(src, dst):
+        if dst.endswith("profile.json"):
+            if calls["fail"]:
+                calls["fail"] -= 1
+                raise OSError("disk full")
+            calls["writes"] += 1
+        return real_replace(src, dst)
+
+    monkeypatch.setattr(memory_module.os, "replace", replace)
+    return calls
+
+
+def test_write_behind_coalesces_facts(tmp_path, monkeypatch, count_writes):
+    monkeypatch.setattr(MemorySystem, "PROFILE_FLUSH_DELAY", 0.3)
+    memory = MemorySystem(data_dir=str(tmp_path))
+    for i in range(5):
+        memory.update_profile({f"fact_{i}": i})
+    assert memory.load_profile()["fact_4"] == 4  # Visible at once, before any write
+
+    assert wait_for(lambda: "fact_4" in read_profile(tmp_path))
+    assert count_writes["writes"] == 1
+    memory.close()
+
+
+def test_shutdown_flushes_pending_facts(tmp_path, monkeypatch):
+    monkeypatch.setattr(MemorySystem, "PROFILE_FLUSH_DELAY", 60.0)
+    memory = MemorySystem(data_dir=str(tmp_path))
+    memory.update_profile({"location": "Tokyo"})
+    started = time.monotonic()
+    memory.close()
+    assert time.monotonic() - started < 5.0  # close() does not sit out the debounce
+    assert read_profile(tmp_path)["location"] == "Tokyo"
+
+
+def test_hand_edit_is_reloaded_and_pending_facts_win(tmp_path, monkeypatch):
+    monkeypatch.setattr(MemorySystem, "PROFILE_FLUSH_DELAY", 60.0)
+    monkeypatch.setattr(MemorySystem, "PROFILE_MTIME_CHECK", 0.0)
+    memory = MemorySystem(data_dir=str(tmp_path))
+    memory.update_profile({"location": "Tokyo"})
+
+    path = os.path.join(str(tmp_path), "profile.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"name": "Shin", "location": "London"}, f)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    profile = memory.load_profile()
+    assert profile["name"] == "Shin"
+    assert profile["location"] == "Tokyo"  # Learned but not yet written
+    memory.close()
+    assert read_profile(tmp_path) == {"name": "Shin", "location": "Tokyo"}
+
+
+def test_failed_write_keeps_facts_for_the_next_flush(tmp_path, monkeypatch, count_writes):
+    monkeypatch.setattr(MemorySystem, "PROFILE_FLUSH_DELAY", 60.0)
+    memory = MemorySystem(data_dir=str(tmp_path))
+    memory.update_profile({"allergy": "shellfish"})
+
+    count_writes["fail"] = 1
+    assert memory.flush() is False
+    assert "allergy" not in read_profile(tmp_path)
+
+    memory.close()  # The shutdown flush still has them
+    assert read_profile(tmp_path)["allergy"] == "shellfish"
+    assert count_writes["writes"] == 1
@@ -0,0 +1,44 @@
+# tests/test_profile_index.py
+from src.brain.profile_index import ProfileIndex, tokenize
+
+PROFILE = {
+    "name": "Shin",
+    "stocks": "NVDA",
+    "projects": "ENJO",
+    "pets": "Dog named Rover",
+    "allergies": "Peanuts",
+    "favorite_food": "Ramen",
+    "home_city": "Osaka",
+    "car": "Red hatchback",
+}
+
+
+def test_tokenize_drops_stopwords_and_stems():
+    assert tokenize("What are my pets?") == ["pet"]
+    assert tokenize("Allergies and class") == ["allergy", "class"]
+
+
+def test_core_fields_are_not_indexed():
+    index = ProfileIndex()
+    index.build(PROFILE)
+    assert [k for k, _ in index.facts] == ["pets", "allergies", "favorite_food", "home_city", "car"]
+    assert index.full_tokens > 0
+
+
+def test_search_ranks_matching_facts():
+    index = ProfileIndex()
+    index.build(PROFILE)
+    assert index.search("how is my dog doing")[0] == ("pets", "Dog named Rover")
+    assert index.search("any food allergy I should mention?", k=2) == [("allergies", "Peanuts"),
+                                                                       ("favorite_food", "Ramen")]
+    assert index.search("open spotify") == []
+
+
+def test_empty_profile():
+    index = ProfileIndex()
+    index.build({"name": "Shin"})
+    assert index.search("pets") == [] and index.full_tokens == 0
+
+
+def test_format_fact():
+    assert ProfileIndex.format_fact("pets", "Dog") == "\nPets: Dog"
@@ -0,0 +1,66 @@
+# tests/test_prompt_builder.py
+from benchmarks.fake_providers import FakeGroqClient, LatencyModel
+from src.brain.prompt_builder import PayloadBuilder
+
+
+def turn(user, reply):
+    return [{"role": "user", "text": user}, {"role": "model", "text": reply}]
+
+
+def test_chat_layout_keeps_volatile_bytes_last():
+    builder = PayloadBuilder("default")
+    builder.set_profile_text("\nName: Shin")
+    history = turn("hi", "Hey boss.")
+    payload = builder.build("groq", history, "open spotify", summary="We talked stocks.", recall="[RECALL] tea")
+
+    assert payload[0] == {"role": "system", "content": builder.static_prefix}
+    assert payload[1] == {"role": "system", "content": "[EARLIER IN THIS CONVERSATION]\nWe talked stocks."}
+    assert payload[2:4] == [{"role": "user", "content": "hi"}, {"role": "assistant", "content": "Hey boss."}]
+    assert payload[4:] == [{"role": "system", "content": "\nName: Shin"},
+                           {"role": "system", "content": "[RECALL] tea"},
+                           {"role": "user", "content": "open spotify"}]
+    assert builder.system_prompt.endswith("\nName: Shin")
+
+
+def test_history_is_converted_once_and_prefix_reused():
+    builder = PayloadBuilder("default")
+    history = turn("one", "first")
+    first = builder.build("local", history, "a")
+    history += turn("two", "second")
+    second = builder.build("local", history, "b")
+
+    assert builder.stats["messages_converted"] == 4  # Not 2 + 4
+    assert second[0] is first[0]                     # Static prefix object shared across turns
+    assert second[1] is first[1]                     # ...and so are already-converted messages
+    assert builder.stats["prefix_bytes_reused"] >= len(builder.static_prefix.encode("utf-8"))
+
+    builder.set_profile_text("\nPets: Dog")          # A learned fact only changes the tail
+    third = builder.build("local", history, "c")
+    assert third[:5] == second[:5] and builder.stats["messages_converted"] == 4
+
+
+def test_trimmed_history_is_reconverted():
+    builder = PayloadBuilder("default")
+    history = turn("one", "first") + turn("two", "second")
+    builder.build("groq", history, "a")
+    del history[:2]  # ContextWindow landed a compaction
+    payload = builder.build("groq", history, "b", summary="Earlier: one")
+
+    assert builder.stats["messages_converted"] == 6
+    assert [m["content"] for m in payload[2:4]] == ["two", "second"]
+
+
+def test_gemini_format():
+    builder = PayloadBuilder("default")
+    builder.set_profile_text("\nName: Shin")
+    payload = builder.build("gemini", turn("hi", "hello"), "what's up")
+
+    assert [c.role for c in payload] == ["user", "user", "model", "user"]
+    assert [p.text for p in payload[-1].parts] == ["\nName: Shin", "what's up"]
+
+
+def test_fake_provider_sees_the_final_prompt():
+    client = FakeGroqClient(LatencyModel(0.0, 0.0), reply_fn=lambda text: f"echo: {text}")
+    payload = PayloadBuilder("default").build("groq", turn("hi", "hey"), "volume 30")
+    reply = client.chat.completions.create(messages=payload, model="fake")
+    assert reply.choices[0].message.content == "echo: volume 30"
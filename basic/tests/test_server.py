@@ -0,0 +1,134 @@
+# tests/test_server.py
+"""BrainServer endpoints through aiohttp's test client, on the offline fakes."""
+import asyncio
+import threading
+
+import pytest
+from aiohttp import web
+
+from benchmarks.fake_providers import FakeGeminiClient, LatencyModel
+from src.server.app import BrainServer
+
+
+@pytest.fixture
+def server(make_brain, tmp_path):
+    def factory(**kwargs):
+        brain = make_brain(gemini=kwargs.pop("gemini", None))
+        return BrainServer(brain, str(tmp_path / "sessions"), **kwargs)
+    return factory
+
+
+async def wait_until(predicate, timeout=5.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition not reached in time"
+        await asyncio.sleep(0.02)
+
+
+# --- GET /health ---
+async def test_health_reports_providers_and_counters(aiohttp_client, server):
+    client = await aiohttp_client(server().build_app())
+    response = await client.get("/health")
+    assert response.status == 200
+    body = await response.json()
+    assert {"gemini", "groq", "local"} <= set(body["providers"])
+    assert body["sessions"] == 0
+    assert body["in_flight"] == 0
+
+
+# --- POST /v1/sessions/{sid}/chat ---
+async def test_chat_returns_the_whole_reply(aiohttp_client, server):
+    brain_server = server()
+    client = await aiohttp_client(brain_server.build_app())
+    response = await client.post("/v1/sessions/alice/chat", json={"text": "How are you?"})
+    assert response.status == 200
+    body = await response.json()
+    assert "fake reply" in body["reply"]
+    assert body["provider"] == "gemini"
+    assert brain_server.sessions.sessions["alice"].turns == 1
+
+
+async def test_chat_rejects_bad_input(aiohttp_client, server):
+    client = await aiohttp_client(server().build_app())
+    assert (await client.post("/v1/sessions/alice/chat", data="not json")).status == 400
+    assert (await client.post("/v1/sessions/alice/chat", json={"text": "  "})).status == 400
+    assert (await client.post("/v1/sessions/bad.id/chat", json={"text": "hi"})).status == 400
+
+
+async def test_chat_sheds_load_when_the_queue_is_full(aiohttp_client, server):
+    brain_server = server(workers=1, max_queue=0)
+    client = await aiohttp_client(brain_server.build_app())
+    brain_server.scheduler.admitted = 1  # One turn already running
+    response = await client.post("/v1/sessions/alice/chat", json={"text": "hi"})
+    assert response.status == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+# --- GET /v1/sessions/{sid}/ws ---
+async def test_ws_streams_sentences_then_done(aiohttp_client, server):
+    client = await aiohttp_client(server().build_app())
+    ws = await client.ws_connect("/v1/sessions/alice/ws")
+    await ws.send_json({"text": "How are you?"})
+    events = []
+    while not events or events[-1]["type"] != "done":
+        events.append(await ws.receive_json(timeout=5))
+    assert any(e["type"] == "sentence" for e in events)
+    assert events[-1]["provider"] == "gemini"
+    await ws.close()
+
+
+async def test_ws_disconnect_mid_stream_keeps_turn_and_lock_consistent(aiohttp_client, server, monkeypatch):
+    # A slow stream: the socket dies after the first sentence was sent
+    slow = FakeGeminiClient(LatencyModel(1.0, 0.0, first_token=0.1), reply_fn=lambda _: "One. Two. Three. Four.")
+    brain_server = server(gemini=slow)
+    client = await aiohttp_client(brain_server.build_app())
+
+    sent = []
+    send_json = web.WebSocketResponse.send_json
+
+    async def flaky_send_json(self, data, *args, **kwargs):
+        if sent:
+            raise ConnectionResetError("Cannot write to closing transport")
+        sent.append(data)
+        await send_json(self, data, *args, **kwargs)
+
+    monkeypatch.setattr(web.WebSocketResponse, "send_json", flaky_send_json)
+    ws = await client.ws_connect("/v1/sessions/alice/ws")
+    await ws.send_json({"text": "Count for me"})
+    assert (await ws.receive_json(timeout=5))["type"] == "sentence"
+
+    session = brain_server.sessions.sessions["alice"]
+    await wait_until(lambda: brain_server.scheduler.admitted == 0 and not session.lock.locked())
+    # The lock is only released once the turn ran to completion and was remembered
+    assert [m["role"] for m in session.brain.history[-2:]] == ["user", "model"]
+    await ws.close()
+    monkeypatch.undo()
+
+    # The session is immediately usable again
+    response = await client.post("/v1/sessions/alice/chat", json={"text": "Again"})
+    assert response.status == 200
+
+
+# --- SESSIONS ---
+async def test_eviction_closes_sessions_off_the_event_loop(aiohttp_client, server):
+    brain_server = server(max_sessions=1)
+    client = await aiohttp_client(brain_server.build_app())
+    assert (await client.post("/v1/sessions/alice/chat", json={"text": "hi"})).status == 200
+
+    alice = brain_server.sessions.sessions["alice"].brain
+    closed_on = []
+    close_session = alice.close_session
+    alice.close_session = lambda: (closed_on.append(threading.current_thread()), close_session())
+
+    assert (await client.post("/v1/sessions/bob/chat", json={"text": "hi"})).status == 200
+    assert set(brain_server.sessions.sessions) == {"bob"}
+    assert closed_on and closed_on[0] is not threading.main_thread()
+
+
+# --- LIFECYCLE ---
+async def test_startup_warms_the_sdk_path_off_the_event_loop(aiohttp_client, server):
+    brain_server = server()
+    warmed_on = []
+    brain_server.root_brain.warm_up = lambda: warmed_on.append(threading.current_thread())
+    await aiohttp_client(brain_server.build_app())
+    assert warmed_on and warmed_on[0] is not threading.main_thread()
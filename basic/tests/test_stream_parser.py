@@ -0,0 +1,69 @@
+# tests/test_stream_parser.py
+from benchmarks.fake_providers import FakeGroqClient, LatencyModel
+from src.brain.stream_parser import ActionTagDetector, SentenceChunker
+
+
+def feed_all(detector, chunks):
+    text, actions = "", []
+    for chunk in chunks:
+        clean, found = detector.feed(chunk)
+        text += clean
+        actions += found
+    return text + detector.flush(), actions
+
+
+# --- ACTION TAGS ---
+def test_tag_split_across_every_token_boundary():
+    reply = "Opening it now. [ACTION: open | spotify] Enjoy!"
+    for size in range(1, len(reply) + 1):
+        chunks = [reply[i:i + size] for i in range(0, len(reply), size)]
+        text, actions = feed_all(ActionTagDetector(), chunks)
+        assert actions == [("open", "spotify")], size
+        assert "[" not in text and text.replace("  ", " ") == "Opening it now. Enjoy!"
+
+
+def test_partial_open_is_held_back_until_resolved():
+    detector = ActionTagDetector()
+    assert detector.feed("Look [ACT") == ("Look ", [])
+    assert detector.feed("UALLY fine") == ("[ACTUALLY fine", [])
+
+
+def test_plain_brackets_and_malformed_tags():
+    assert feed_all(ActionTagDetector(), ["a [note] b"]) == ("a [note] b", [])
+    assert feed_all(ActionTagDetector(), ["x [ACTION: mute] y"]) == ("x  y", [])  # No target: dropped, not spoken
+    assert feed_all(ActionTagDetector(), ["bye [ACTION: system | lo"]) == ("bye ", [])  # Unterminated at the end
+
+
+def test_multiple_tags_in_one_stream():
+    text, actions = feed_all(ActionTagDetector(), ["[ACTION: volume | 30]", "Done. [ACTION: open | chrome]"])
+    assert actions == [("volume", "30"), ("open", "chrome")]
+    assert text == "Done. "
+
+
+# --- SENTENCES ---
+def test_sentences_come_out_as_soon_as_they_end():
+    chunker = SentenceChunker()
+    assert chunker.feed("Hello there. How") == ["Hello there."]
+    assert chunker.feed(" are you? I'm") == ["How are you?"]
+    assert chunker.flush() == "I'm"
+
+
+def test_abbreviations_and_quotes_do_not_split():
+    chunker = SentenceChunker()
+    assert chunker.feed('Ask Dr. Smith, e.g. tomorrow. He said "fine." Then ') == \
+        ["Ask Dr. Smith, e.g. tomorrow.", 'He said "fine."']
+    assert chunker.feed("newline\nnext") == ["Then newline"]
+    assert chunker.flush() == "next"
+
+
+def test_fake_provider_stream_through_both_stages():
+    client = FakeGroqClient(LatencyModel(0.0, 0.0), reply_fn=lambda _: "Sure. [ACTION: open | notepad] Opening notepad now. Done.")
+    detector, chunker = ActionTagDetector(), SentenceChunker()
+    sentences, actions = [], []
+    for token in client.backend.stream("open notepad"):
+        clean, found = detector.feed(token)
+        actions += found
+        sentences += chunker.feed(clean)
+    sentences += [s for s in (chunker.feed(detector.flush()) + [chunker.flush()]) if s]
+    assert actions == [("open", "notepad")]
+    assert sentences == ["Sure.", "Opening notepad now.", "Done."]
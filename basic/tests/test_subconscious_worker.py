@@ -0,0 +1,122 @@
+# tests/test_subconscious_worker.py
+"""Background fact extraction: batching, backpressure, drain-on-stop, flush at shutdown."""
+import json
+import os
+import re
+import threading
+import time
+
+from benchmarks.fake_providers import FakeGeminiClient, LatencyModel, default_reply
+from src.brain.memory import MemorySystem
+from src.brain.subconscious import Subconscious
+from src.brain.subconscious_worker import SubconsciousWorker
+
+# The quoted user turns inside single and batch analysis prompts
+TURN_LINE = re.compile(r'^\s*(?:User Input: |\d+\. )"(.*)"\s*$', re.MULTILINE)
+
+
+class FakeExtractor:
+    """generate_fn stand-in: every analysed turn 'mentions' one fact."""
+
+    def __init__(self, delay=0.0, gate=None):
+        self.delay = delay
+        self.gate = gate
+        self.prompts = []
+        self.started = threading.Event()
+
+    def __call__(self, prompt):
+        self.started.set()
+        if self.gate is not None:
+            self.gate.wait(5)
+        time.sleep(self.delay)
+        self.prompts.append(prompt)
+        turns = TURN_LINE.findall(prompt)
+        return json.dumps({f"fact_{len(self.prompts)}_{i}": text for i, text in enumerate(turns)})
+
+
+def read_profile(data_dir):
+    with open(os.path.join(data_dir, "profile.json"), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_stop_drains_pending_turns_and_profile_reaches_disk(tmp_path):
+    memory = MemorySystem(data_dir=str(tmp_path))
+    extractor = FakeExtractor(delay=0.2)  # Slower than the test enqueues
+    worker = SubconsciousWorker(Subconscious(), extractor, memory.update_profile)
+    for text in ("I live in Tokyo", "My dog is Rover", "I work on ENJO"):
+        worker.submit(text)
+
+    worker.stop()
+    memory.flush()
+
+    stats = worker.snapshot()
+    assert stats["turns_queued"] == 3 and stats["errors"] == 0
+    assert stats["extraction_calls"] + stats["calls_saved"] == 3
+    assert sorted(v for k, v in read_profile(tmp_path).items() if k.startswith("fact_")) == \
+        ["I live in Tokyo", "I work on ENJO", "My dog is Rover"]
+    memory.close()
+
+
+def test_turns_queued_together_share_one_extraction_call():
+    gate = threading.Event()
+    applied = []
+    extractor = FakeExtractor(gate=gate)
+    worker = SubconsciousWorker(Subconscious(), extractor, applied.append, batch_window=0.5)
+    for i in range(4):
+        worker.submit(f"Turn {i}")
+    gate.set()
+    worker.stop()
+
+    assert len(extractor.prompts) == 1
+    assert worker.snapshot()["calls_saved"] == 3
+    assert len(applied) == 1 and len(applied[0]) == 4
+
+
+def test_full_queue_drops_the_oldest_turn():
+    gate = threading.Event()
+    extractor = FakeExtractor(gate=gate)
+    worker = SubconsciousWorker(Subconscious(), extractor, lambda facts: None, max_queue=2, max_batch=1,
+                                batch_window=0.0)
+    worker.submit("first")
+    assert extractor.started.wait(5)  # The worker holds "first" and blocks on the gate
+    for text in ("second", "third", "fourth"):
+        worker.submit(text)
+    gate.set()
+    worker.stop()
+
+    analysed = " ".join(extractor.prompts)
+    assert "second" not in analysed and "third" in analysed and "fourth" in analysed
+    assert worker.snapshot()["turns_dropped"] == 1
+
+
+def test_failing_extraction_does_not_kill_the_worker():
+    calls = []
+
+    def flaky(prompt):
+        calls.append(prompt)
+        if len(calls) == 1:
+            raise RuntimeError("provider down")
+        return '{"name": "Shin"}'
+
+    applied = []
+    worker = SubconsciousWorker(Subconscious(), flaky, applied.append, batch_window=0.0)
+    worker.submit("hello")
+    worker.flush(5)
+    worker.submit("My name is Shin")
+    worker.stop()
+    assert worker.snapshot()["errors"] == 1
+    assert applied == [{"name": "Shin"}]
+
+
+def test_brain_shutdown_writes_facts_learned_in_the_background(make_brain, tmp_path):
+    def reply(prompt):
+        if "Output (JSON ONLY)" in prompt:
+            time.sleep(0.3)  # Extraction still running when the conversation ends
+            return '{"location": "Tokyo"}'
+        return default_reply(prompt)
+
+    brain = make_brain(gemini=FakeGeminiClient(LatencyModel(0.0, 0.0), reply_fn=reply), fact_gate_enabled=False)
+    brain.think("I live in Tokyo now.")
+    brain.shutdown()
+
+    assert read_profile(tmp_path)["location"] == "Tokyo"
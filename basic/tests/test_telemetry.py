@@ -0,0 +1,115 @@
+# tests/test_telemetry.py
+"""Telemetry spans, turn records, JSONL rotation and the Prometheus text."""
+import json
+import os
+import time
+
+import pytest
+
+from src.utils.telemetry import Telemetry
+
+
+@pytest.fixture
+def telemetry(tmp_path):
+    def factory(**kwargs):
+        kwargs.setdefault("enabled", True)
+        kwargs.setdefault("path", str(tmp_path / "turns.jsonl"))
+        kwargs.setdefault("prometheus_path", str(tmp_path / "metrics.prom"))
+        return Telemetry(**kwargs)
+    return factory
+
+
+def read_turns(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+# --- SPANS / TURNS ---
+def test_span_times_the_stage_and_end_turn_writes_one_record(telemetry):
+    t = telemetry()
+    t.begin_turn(mode="voice")
+    with t.span("brain.generate", provider="gemini", model="flash") as span:
+        time.sleep(0.05)
+        span.set(chars=12)
+    t.end_turn(reply_chars=12)
+
+    [turn] = read_turns(t.path)
+    assert turn["turn"] == 1 and turn["mode"] == "voice" and turn["reply_chars"] == 12
+    [stage] = turn["stages"]
+    assert stage["stage"] == "brain.generate" and stage["provider"] == "gemini" and stage["chars"] == 12
+    assert 0.05 <= stage["s"] <= turn["total_s"]
+    assert "started" not in turn
+
+
+def test_span_labels_the_exception_and_reraises(telemetry):
+    t = telemetry()
+    t.begin_turn()
+    with pytest.raises(ValueError):
+        with t.span("hands.execute"):
+            raise ValueError("boom")
+    t.end_turn()
+    assert read_turns(t.path)[0]["stages"][0]["error"] == "ValueError"
+
+
+def test_end_turn_without_begin_writes_nothing(telemetry):
+    t = telemetry()
+    t.end_turn()
+    assert not os.path.exists(t.path)
+
+
+# --- ROTATION ---
+def write_turns(t, n):
+    for i in range(n):
+        t.begin_turn(i=i)
+        t.end_turn()
+
+
+def test_rotation_keeps_the_configured_backups(telemetry):
+    t = telemetry(max_bytes=10, backups=2)
+    write_turns(t, 4)
+    assert [r["i"] for r in read_turns(t.path)] == [3]
+    assert [r["i"] for r in read_turns(t.path + ".1")] == [2]
+    assert [r["i"] for r in read_turns(t.path + ".2")] == [1]
+    assert not os.path.exists(t.path + ".3")
+
+
+def test_rotation_without_backups_truncates(telemetry):
+    t = telemetry(max_bytes=10, backups=0)
+    write_turns(t, 3)
+    assert [r["i"] for r in read_turns(t.path)] == [2]
+    assert not os.path.exists(t.path + ".1")
+
+
+# --- PROMETHEUS ---
+def test_prometheus_histogram_is_cumulative(telemetry):
+    t = telemetry()
+    t.record("brain.generate", 0.03, provider="groq", model="llama")
+    t.record("brain.generate", 0.3, provider="groq", model="llama")
+    text = t.prometheus_text()
+
+    base = 'stage="brain.generate",provider="groq",model="llama"'
+    assert f'enjo_stage_seconds_bucket{{{base},le="0.025"}} 0' in text
+    assert f'enjo_stage_seconds_bucket{{{base},le="0.05"}} 1' in text
+    assert f'enjo_stage_seconds_bucket{{{base},le="0.5"}} 2' in text
+    assert f'enjo_stage_seconds_bucket{{{base},le="+Inf"}} 2' in text
+    assert f"enjo_stage_seconds_sum{{{base}}} 0.330000" in text
+    assert f"enjo_stage_seconds_count{{{base}}} 2" in text
+
+    t.begin_turn()
+    t.end_turn()
+    with open(t.prometheus_path, encoding="utf-8") as f:
+        assert "enjo_turns_total 1" in f.read()
+
+
+# --- DISABLED ---
+def test_disabled_is_a_no_op(telemetry):
+    t = telemetry(enabled=False)
+    t.begin_turn()
+    with t.span("brain.generate", provider="gemini") as span:
+        span.set(chars=1)
+    t.record("mouth.synthesize", 0.1)
+    t.end_turn()
+
+    assert span is t.span("anything")  # The shared null span
+    assert not os.path.exists(t.path) and not os.path.exists(t.prometheus_path)
+    assert "enjo_stage_seconds_bucket" not in t.prometheus_text()
@@ -0,0 +1,51 @@
+# ENJO - Anthropomorphic AI Assistant
+# Copyright (C) 2026 Sania
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# Batch transcription for recorded sessions (auditing), with the same Whisper
+# setup as the Ears. One model per worker process, longest files first,
+# results streamed to JSONL. Re-run the same command to resume.
+#
+#   python transcribe.py recordings/ --out transcripts.jsonl
+#   python transcribe.py manifest.jsonl --profile fast --workers 8 --out transcripts.jsonl
+
+import argparse
+import json
+
+from src.senses.batch_transcriber import BatchTranscriber, available_cores, collect_audio
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Transcribe a directory or manifest of audio files.")
+    parser.add_argument("inputs", nargs="+", help="Audio files, directories, .jsonl manifests or .txt path lists.")
+    parser.add_argument("--out", required=True, help="JSONL output (also the resume checkpoint).")
+    parser.add_argument("--profile", help="ASR profile (default: ears.profile in data/config.json).")
+    parser.add_argument("--workers", type=int, default=None, help=f"Worker processes (default: {available_cores()} cores).")
+    parser.add_argument("--cpu-threads", type=int, default=None, help="Threads per worker (default: cores // workers).")
+    parser.add_argument("--restart", action="store_true", help="Ignore the existing output and start over.")
+    args = parser.parse_args()
+
+    paths = collect_audio(args.inputs)
+    if not paths:
+        raise SystemExit("No audio files found.")
+
+    batch = BatchTranscriber(profile=args.profile, workers=args.workers, cpu_threads=args.cpu_threads)
+    summary = batch.run(paths, args.out, resume=not args.restart)
+    print(json.dumps(summary, indent=2))
+    if summary["errors"]:
+        # Failed files are in the output with status "error"; a resume only skips the "ok" ones
+        print(f"!! {summary['errors']} files failed. Re-run the same command to retry them.")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()